@@ -54,6 +54,7 @@ import torch
 import isaaclab_mimic.envs  # noqa: F401
 from isaaclab_mimic.datagen.data_generator import DataGenerator
 from isaaclab_mimic.datagen.datagen_info_pool import DataGenInfoPool
+from isaaclab_mimic.datagen.trajectory_executor import MultiEnvTrajectoryExecutor
 
 from isaaclab.envs.mdp.recorders.recorders_cfg import ActionStateRecorderManagerCfg
 from isaaclab.managers import DatasetExportMode
@@ -68,14 +69,14 @@ num_failures = 0
 num_attempts = 0
 
 
-async def run_data_generator(env, env_id, env_action_queue, data_generator, success_term, pause_subtask=False):
+async def run_data_generator(env, env_id, trajectory_executor, data_generator, success_term, pause_subtask=False):
     """Run data generator."""
     global num_success, num_failures, num_attempts
     while True:
         results = await data_generator.generate(
             env_id=env_id,
             success_term=success_term,
-            env_action_queue=env_action_queue,
+            trajectory_executor=trajectory_executor,
             select_src_per_subtask=env.unwrapped.cfg.datagen_config.generation_select_src_per_subtask,
             transform_first_robot_pose=env.unwrapped.cfg.datagen_config.generation_transform_first_robot_pose,
             interpolate_from_last_target_pose=env.unwrapped.cfg.datagen_config.generation_interpolate_from_last_target_pose,
@@ -88,7 +89,7 @@ async def run_data_generator(env, env_id, env_action_queue, data_generator, succ
         num_attempts += 1
 
 
-def env_loop(env, env_action_queue, shared_datagen_info_pool, asyncio_event_loop):
+def env_loop(env, trajectory_executor, shared_datagen_info_pool, asyncio_event_loop):
     """Main loop for the environment."""
     global num_success, num_failures, num_attempts
     prev_num_attempts = 0
@@ -96,20 +97,11 @@ def env_loop(env, env_action_queue, shared_datagen_info_pool, asyncio_event_loop
     with contextlib.suppress(KeyboardInterrupt) and torch.inference_mode():
         while True:
 
-            actions = torch.zeros(env.unwrapped.action_space.shape)
+            # an async-blocking call to wait for the trajectories of all the data generators
+            asyncio_event_loop.run_until_complete(trajectory_executor.wait_for_trajectories())
 
-            # get actions from all the data generators
-            for i in range(env.unwrapped.num_envs):
-                # an async-blocking call to get an action from a data generator
-                env_id, action = asyncio_event_loop.run_until_complete(env_action_queue.get())
-                actions[env_id] = action
-
-            # perform action on environment
-            env.step(actions)
-
-            # mark done so the data generators can continue with the step results
-            for i in range(env.unwrapped.num_envs):
-                env_action_queue.task_done()
+            # perform the current actions of all the trajectories on the environment
+            trajectory_executor.step()
 
             if prev_num_attempts != num_attempts:
                 prev_num_attempts = num_attempts
@@ -201,7 +193,7 @@ def main():
 
     # Set up asyncio stuff
     asyncio_event_loop = asyncio.get_event_loop()
-    env_action_queue = asyncio.Queue()
+    trajectory_executor = MultiEnvTrajectoryExecutor(env.unwrapped, success_term)
 
     shared_datagen_info_pool_lock = asyncio.Lock()
     shared_datagen_info_pool = DataGenInfoPool(
@@ -217,7 +209,7 @@ def main():
         data_generator_asyncio_tasks.append(
             asyncio_event_loop.create_task(
                 run_data_generator(
-                    env, i, env_action_queue, data_generator, success_term, pause_subtask=args_cli.pause_subtask
+                    env, i, trajectory_executor, data_generator, success_term, pause_subtask=args_cli.pause_subtask
                 )
             )
         )
@@ -227,7 +219,7 @@ def main():
     except asyncio.CancelledError:
         print("Tasks were cancelled.")
 
-    env_loop(env, env_action_queue, shared_datagen_info_pool, asyncio_event_loop)
+    env_loop(env, trajectory_executor, shared_datagen_info_pool, asyncio_event_loop)
 
 
 if __name__ == "__main__":
@@ -3,9 +3,30 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+"""Script to merge a set of HDF5 datasets.
+
+The episodes are copied group by group with :meth:`h5py.Group.copy`, so they are never loaded into memory.
+The output can be split into several shard files, which are written in parallel by a pool of processes.
+In that case, the output file is an index file that refers to the episodes of the shards with external links.
+With ``--link``, no data is copied at all and the output file refers to the episodes of the input files.
+
+Optionally, duplicate episodes are skipped. Two episodes are duplicates if their datasets have the same
+names, types, shapes and contents, and their groups and datasets have the same attributes. The content hashes of the input files are computed in parallel as well.
+
+.. code-block:: bash
+
+    # Usage
+    ./isaaclab.sh -p scripts/tools/merge_hdf5_datasets.py --input_files <FILES> --output_file <FILE> \
+        --num_workers 8 --num_shards 4 --dedupe
+
+"""
+
 import argparse
 import h5py
+import hashlib
+import numpy as np
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 parser = argparse.ArgumentParser(description="Merge a set of HDF5 datasets.")
 parser.add_argument(
@@ -16,29 +37,226 @@ parser.add_argument(
     help="A list of paths to HDF5 files to merge.",
 )
 parser.add_argument("--output_file", type=str, default="merged_dataset.hdf5", help="File path to merged output.")
+parser.add_argument(
+    "--num_workers", type=int, default=1, help="Number of processes used to read the inputs and write the shards."
+)
+parser.add_argument(
+    "--num_shards",
+    type=int,
+    default=1,
+    help=(
+        "Number of shard files the episodes are copied into. If greater than 1, the output file only contains"
+        " external links to the episodes of the shards."
+    ),
+)
+parser.add_argument(
+    "--link",
+    action="store_true",
+    default=False,
+    help="Create external links to the episodes of the input files instead of copying them.",
+)
+parser.add_argument("--dedupe", action="store_true", default=False, help="Skip episodes with duplicate contents.")
 
 args_cli = parser.parse_args()
 
 
+"""
+Helper functions.
+"""
+
+
+def hash_episode(h5_episode_group: h5py.Group) -> str:
+    """Compute the hash of the contents of an episode.
+
+    The hash covers the attributes of the groups and datasets (for instance, the success flag and the seed of the
+    episode), and the datasets. The datasets are read chunk by chunk, so the episode is never fully loaded into memory.
+
+    Args:
+        h5_episode_group: The group of the episode.
+
+    Returns:
+        The hexadecimal SHA-256 digest of the episode.
+    """
+    hasher = hashlib.sha256()
+
+    def hash_attrs(item: h5py.Group | h5py.Dataset):
+        for key in sorted(item.attrs.keys()):
+            value = np.asarray(item.attrs[key])
+            hasher.update(f"@{key}{value.dtype.str}{value.shape}".encode())
+            # note: the arrays of variable-length strings are object arrays, whose bytes are pointers
+            if value.dtype == object:
+                hasher.update(repr(value.tolist()).encode())
+            else:
+                hasher.update(np.ascontiguousarray(value).tobytes())
+
+    def hash_helper(group: h5py.Group):
+        hash_attrs(group)
+        for key in sorted(group.keys()):
+            item = group[key]
+            hasher.update(key.encode())
+            if isinstance(item, h5py.Group):
+                hash_helper(item)
+                continue
+            hasher.update(f"{item.dtype.str}{item.shape}".encode())
+            hash_attrs(item)
+            if item.ndim == 0:
+                hasher.update(np.ascontiguousarray(item[()]).tobytes())
+                continue
+            # read the dataset in slices of chunks along the time dimension
+            num_rows = item.chunks[0] if item.chunks is not None else 1024
+            for start in range(0, item.shape[0], num_rows):
+                hasher.update(np.ascontiguousarray(item[start : start + num_rows]).tobytes())
+
+    hash_helper(h5_episode_group)
+    return hasher.hexdigest()
+
+
+def read_episode_infos(file_path: str, dedupe: bool) -> list[dict]:
+    """Read the information of the episodes of an input file.
+
+    Args:
+        file_path: The path to the input file.
+        dedupe: Whether to compute the content hashes of the episodes.
+
+    Returns:
+        The name, number of samples, success flag and hash (None if not computed) of the episodes.
+    """
+    episode_infos = []
+    with h5py.File(file_path, "r") as h5_file:
+        for episode_name, h5_episode_group in h5_file["data"].items():
+            success = h5_episode_group.attrs.get("success")
+            episode_infos.append({
+                "file_path": file_path,
+                "name": episode_name,
+                "num_samples": int(h5_episode_group.attrs.get("num_samples", 0)),
+                "success": -1 if success is None else int(bool(success)),
+                "hash": hash_episode(h5_episode_group) if dedupe else None,
+            })
+    return episode_infos
+
+
+def write_index(h5_file: h5py.File, episode_names: list[str], episode_infos: list[dict]):
+    """Write the episode index and the total number of samples of a dataset file.
+
+    The index has the same layout as the one written by :class:`isaaclab.utils.datasets.HDF5DatasetFileHandler`.
+    """
+    h5_file["data"].attrs["total"] = sum(info["num_samples"] for info in episode_infos)
+    h5_index_group = h5_file.create_group("index")
+    h5_index_group.create_dataset("episode_names", data=episode_names, dtype=h5py.string_dtype(), maxshape=(None,))
+    h5_index_group.create_dataset(
+        "success", data=[info["success"] for info in episode_infos], dtype=np.int8, maxshape=(None,)
+    )
+    h5_index_group.create_dataset(
+        "num_samples", data=[info["num_samples"] for info in episode_infos], dtype=np.int64, maxshape=(None,)
+    )
+
+
+def write_shard(shard_path: str, episode_names: list[str], episode_infos: list[dict], env_args: str):
+    """Copy episodes of the input files into a shard file.
+
+    Args:
+        shard_path: The path to the shard file.
+        episode_names: The names of the episodes in the shard file.
+        episode_infos: The information of the episodes to copy.
+        env_args: The environment arguments of the dataset.
+    """
+    input_files: dict[str, h5py.File] = dict()
+    try:
+        with h5py.File(shard_path, "w") as h5_shard_file:
+            h5_data_group = h5_shard_file.create_group("data")
+            if env_args is not None:
+                h5_data_group.attrs["env_args"] = env_args
+            for episode_name, info in zip(episode_names, episode_infos):
+                if info["file_path"] not in input_files:
+                    input_files[info["file_path"]] = h5py.File(info["file_path"], "r")
+                input_files[info["file_path"]].copy(f"data/{info['name']}", h5_data_group, episode_name)
+            write_index(h5_shard_file, episode_names, episode_infos)
+    finally:
+        for h5_file in input_files.values():
+            h5_file.close()
+
+
+def map_with_workers(func, *iterables) -> list:
+    """Apply a function to the items of the iterables, in a pool of processes if there are several workers."""
+    if args_cli.num_workers <= 1:
+        return list(map(func, *iterables))
+    with ProcessPoolExecutor(max_workers=args_cli.num_workers) as executor:
+        return list(executor.map(func, *iterables))
+
+
+"""
+Main.
+"""
+
+
 def merge_datasets():
     for filepath in args_cli.input_files:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"The dataset file {filepath} does not exist.")
+    if args_cli.num_shards < 1:
+        raise ValueError(f"The number of shards must be at least 1. Received: {args_cli.num_shards}.")
+    if args_cli.link and args_cli.num_shards > 1:
+        raise ValueError("Sharding the output is not supported when linking to the input files.")
 
-    with h5py.File(args_cli.output_file, "w") as output:
-        episode_idx = 0
-        copy_attributes = True
-
-        for filepath in args_cli.input_files:
+    # read the episodes of the input files
+    episode_infos = []
+    for file_episode_infos in map_with_workers(
+        read_episode_infos, args_cli.input_files, [args_cli.dedupe] * len(args_cli.input_files)
+    ):
+        episode_infos.extend(file_episode_infos)
+    # skip the duplicate episodes
+    if args_cli.dedupe:
+        episode_hashes = set()
+        unique_episode_infos = []
+        for info in episode_infos:
+            if info["hash"] not in episode_hashes:
+                episode_hashes.add(info["hash"])
+                unique_episode_infos.append(info)
+        print(f"Skipped {len(episode_infos) - len(unique_episode_infos)} duplicate episodes.")
+        episode_infos = unique_episode_infos
+    episode_names = [f"demo_{episode_idx}" for episode_idx in range(len(episode_infos))]
 
-            with h5py.File(filepath, "r") as input:
-                for episode, data in input["data"].items():
-                    input.copy(f"data/{episode}", output, f"data/demo_{episode_idx}")
-                    episode_idx += 1
+    # the environment arguments are taken from the first input file
+    env_args = None
+    if len(args_cli.input_files) > 0:
+        with h5py.File(args_cli.input_files[0], "r") as h5_file:
+            env_args = h5_file["data"].attrs["env_args"]
 
-                if copy_attributes:
-                    output["data"].attrs["env_args"] = input["data"].attrs["env_args"]
-                    copy_attributes = False
+    output_dir = os.path.dirname(os.path.abspath(args_cli.output_file))
+    if args_cli.num_shards == 1 and not args_cli.link:
+        # copy the episodes into the output file
+        write_shard(args_cli.output_file, episode_names, episode_infos, env_args)
+    else:
+        # copy the episodes into the shard files
+        episode_links = []
+        if args_cli.link:
+            for info in episode_infos:
+                episode_links.append((info["file_path"], f"data/{info['name']}"))
+        else:
+            output_stem = os.path.splitext(args_cli.output_file)[0]
+            shard_paths = [f"{output_stem}_shard_{shard_idx}.hdf5" for shard_idx in range(args_cli.num_shards)]
+            shard_ranges = np.array_split(np.arange(len(episode_infos)), args_cli.num_shards)
+            map_with_workers(
+                write_shard,
+                shard_paths,
+                [[episode_names[idx] for idx in shard_range] for shard_range in shard_ranges],
+                [[episode_infos[idx] for idx in shard_range] for shard_range in shard_ranges],
+                [env_args] * args_cli.num_shards,
+            )
+            for shard_path, shard_range in zip(shard_paths, shard_ranges):
+                for idx in shard_range:
+                    episode_links.append((shard_path, f"data/{episode_names[idx]}"))
+        # write the index file with external links to the episodes
+        # note: the paths are relative to the output file, so that the files can be moved together
+        with h5py.File(args_cli.output_file, "w") as h5_output_file:
+            h5_data_group = h5_output_file.create_group("data")
+            if env_args is not None:
+                h5_data_group.attrs["env_args"] = env_args
+            for episode_name, (file_path, episode_path) in zip(episode_names, episode_links):
+                h5_data_group[episode_name] = h5py.ExternalLink(
+                    os.path.relpath(os.path.abspath(file_path), output_dir), episode_path
+                )
+            write_index(h5_output_file, episode_names, episode_infos)
 
     print(f"Merged dataset saved to {args_cli.output_file}")
 
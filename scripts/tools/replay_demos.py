@@ -176,8 +176,9 @@ def main():
                         if next_episode_index is not None:
                             replayed_episode_count += 1
                             print(f"{replayed_episode_count :4}: Loading #{next_episode_index} episode to env_{env_id}")
+                            # load lazily since only the initial state and actions are read
                             episode_data = dataset_file_handler.load_episode(
-                                episode_names[next_episode_index], env.device
+                                episode_names[next_episode_index], env.device, lazy=True
                             )
                             env_episode_data_map[env_id] = episode_data
                             # Set initial state for the new episode
@@ -33,5 +33,6 @@ from .actuator_cfg import (
     ImplicitActuatorCfg,
     RemotizedPDActuatorCfg,
 )
+from .actuator_fused import FusedActuatorGroup, fuse_actuator_groups
 from .actuator_net import ActuatorNetLSTM, ActuatorNetMLP
 from .actuator_pd import DCMotor, DelayedPDActuator, IdealPDActuator, ImplicitActuator, RemotizedPDActuator
@@ -149,6 +149,26 @@ class ActuatorNetLSTMCfg(DCMotorCfg):
     network_file: str = MISSING
     """Path to the file containing network weights."""
 
+    network_backend: Literal["torchscript", "torch_compile", "onnxruntime"] = "torchscript"
+    """Backend used to load and run the network. Defaults to "torchscript".
+
+    The backend determines the format of the :attr:`network_file`:
+
+    * ``"torchscript"``: A TorchScript model saved with :func:`torch.jit.save`.
+    * ``"torch_compile"``: An exported program saved with :func:`torch.export.save`. The module of the program
+      is compiled with :func:`torch.compile` (TorchScript models cannot be compiled).
+    * ``"onnxruntime"``: An ONNX model, which is run with ONNX Runtime. This requires the ``onnxruntime``
+      package (or ``onnxruntime-gpu`` for CUDA devices). The batch axis must be the only dynamic axis of the model.
+    """
+
+    network_dtype: Literal["float32", "float16", "bfloat16"] = "float32"
+    """Data type of the parameters and the inputs of the network. Defaults to "float32".
+
+    Half-precision types reduce the cost of the inference. The computed efforts are always converted back to
+    single precision. This is not used by the ``"onnxruntime"`` backend, for which the data types are defined
+    by the ONNX model.
+    """
+
 
 @configclass
 class ActuatorNetMLPCfg(DCMotorCfg):
@@ -162,6 +182,26 @@ class ActuatorNetMLPCfg(DCMotorCfg):
     network_file: str = MISSING
     """Path to the file containing network weights."""
 
+    network_backend: Literal["torchscript", "torch_compile", "onnxruntime"] = "torchscript"
+    """Backend used to load and run the network. Defaults to "torchscript".
+
+    The backend determines the format of the :attr:`network_file`:
+
+    * ``"torchscript"``: A TorchScript model saved with :func:`torch.jit.save`.
+    * ``"torch_compile"``: An exported program saved with :func:`torch.export.save`. The module of the program
+      is compiled with :func:`torch.compile` (TorchScript models cannot be compiled).
+    * ``"onnxruntime"``: An ONNX model, which is run with ONNX Runtime. This requires the ``onnxruntime``
+      package (or ``onnxruntime-gpu`` for CUDA devices). The batch axis must be the only dynamic axis of the model.
+    """
+
+    network_dtype: Literal["float32", "float16", "bfloat16"] = "float32"
+    """Data type of the parameters and the inputs of the network. Defaults to "float32".
+
+    Half-precision types reduce the cost of the inference. The computed efforts are always converted back to
+    single precision. This is not used by the ``"onnxruntime"`` backend, for which the data types are defined
+    by the ONNX model.
+    """
+
     pos_scale: float = MISSING
     """Scaling of the joint position errors input to the network."""
     vel_scale: float = MISSING
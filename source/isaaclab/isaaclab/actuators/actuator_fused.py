@@ -0,0 +1,308 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+from isaaclab.utils.types import ArticulationActions
+
+from .actuator_base import ActuatorBase
+from .actuator_pd import DCMotor, DelayedPDActuator, IdealPDActuator, ImplicitActuator
+
+
+class FusedActuatorGroup:
+    """Evaluates several actuator groups of the same model at once over their concatenated joints.
+
+    An articulation usually evaluates its actuator groups one after the other. Each evaluation gathers the
+    joint states and targets of the group, computes the model and scatters the results back. For robots with
+    many groups, this launches many small kernels at every physics step. This class concatenates the joints
+    of groups that share the same actuator model, so that the model is evaluated once for all of them.
+
+    The parameters of the groups (stiffness, damping, effort limit and velocity limit) are stored in
+    concatenated buffers of shape (num_envs, num_joints), and the parameter buffers of each group are replaced
+    by views into them. Hence, the in-place modifications of the parameters of a group (for instance, by the
+    randomization of the actuator gains) are seen by the fused evaluation. If a parameter buffer of a group is
+    replaced by another tensor, its values are copied into the concatenated buffer at the next evaluation.
+    The computed and applied efforts of each group are set to views into the results of the fused evaluation.
+
+    The computation is the same as the one of the groups, element by element, so the results match the
+    evaluation of each group exactly. The supported models are given by :attr:`SUPPORTED_CLASS_TYPES`.
+    Subclasses of these models are not supported, since they may change the computation. For the
+    :class:`DelayedPDActuator` model, the delay buffers remain owned by each group, since their time lags
+    and resets are set per group. Only the PD control law is evaluated for all the groups at once.
+
+    The class provides the same interface as the actuator groups to the articulation. This means that the
+    :meth:`compute` method takes and returns the joint commands over the concatenated joints, which are
+    given by :attr:`joint_indices`.
+    """
+
+    SUPPORTED_CLASS_TYPES: tuple[type[ActuatorBase], ...] = (
+        ImplicitActuator,
+        IdealPDActuator,
+        DCMotor,
+        DelayedPDActuator,
+    )
+    """The actuator models whose groups can be fused."""
+
+    _FUSED_PARAMETERS: tuple[str, ...] = ("stiffness", "damping", "effort_limit", "velocity_limit")
+    """The names of the parameters of the groups that are stored in concatenated buffers."""
+
+    computed_effort: torch.Tensor
+    """The computed effort over the concatenated joints. Shape is (num_envs, num_joints)."""
+    applied_effort: torch.Tensor
+    """The applied effort over the concatenated joints. Shape is (num_envs, num_joints)."""
+
+    def __init__(self, actuators: Sequence[ActuatorBase], num_articulation_joints: int, device: str):
+        """Initialize the fused actuator group.
+
+        Args:
+            actuators: The actuator groups to fuse. They must be instances of the same supported model.
+            num_articulation_joints: The number of joints in the articulation. This is used to resolve the
+                joint indices of groups that contain all the joints.
+            device: Device used for processing.
+
+        Raises:
+            ValueError: If no actuator group is provided.
+            ValueError: If the actuator groups are not instances of the same supported model.
+        """
+        if len(actuators) == 0:
+            raise ValueError("At least one actuator group is required to create a fused actuator group.")
+        class_type = type(actuators[0])
+        if class_type not in self.SUPPORTED_CLASS_TYPES:
+            raise ValueError(
+                f"Actuator model '{class_type.__name__}' cannot be fused. Supported models are:"
+                f" {[supported_type.__name__ for supported_type in self.SUPPORTED_CLASS_TYPES]}."
+            )
+        for actuator in actuators:
+            if type(actuator) is not class_type:
+                raise ValueError(
+                    f"Only actuator groups of the same model can be fused. Received: '{class_type.__name__}'"
+                    f" and '{type(actuator).__name__}'."
+                )
+        # store inputs
+        self._actuators = list(actuators)
+        self._class_type = class_type
+        self._device = device
+
+        # resolve the concatenated joint indices and the columns of each group
+        joint_ids = list()
+        self._group_columns: list[slice] = list()
+        for actuator in self._actuators:
+            if isinstance(actuator.joint_indices, slice):
+                group_joint_ids = list(range(num_articulation_joints))[actuator.joint_indices]
+            else:
+                group_joint_ids = torch.as_tensor(actuator.joint_indices).tolist()
+            self._group_columns.append(slice(len(joint_ids), len(joint_ids) + len(group_joint_ids)))
+            joint_ids.extend(group_joint_ids)
+        self._joint_indices = torch.tensor(joint_ids, dtype=torch.long, device=device)
+
+        # concatenate the parameters of the groups and replace them with views
+        self._parameters: dict[str, torch.Tensor] = dict()
+        self._parameter_views: list[dict[str, torch.Tensor]] = [dict() for _ in self._actuators]
+        for name in self._FUSED_PARAMETERS:
+            self._parameters[name] = torch.cat([getattr(actuator, name) for actuator in self._actuators], dim=1)
+            for actuator, columns, views in zip(self._actuators, self._group_columns, self._parameter_views):
+                views[name] = self._parameters[name][:, columns]
+                setattr(actuator, name, views[name])
+
+        # model-specific parameters
+        if self._class_type is DCMotor:
+            # note: the saturation effort of a group is a scalar, which is expanded over its joints
+            self._saturation_effort = torch.cat(
+                [
+                    torch.full((1, actuator.num_joints), float(actuator._saturation_effort), device=device)
+                    for actuator in self._actuators
+                ],
+                dim=1,
+            )
+            self._zeros_effort = torch.zeros_like(self._parameters["effort_limit"])
+
+        # create commands buffers for allocation
+        self.computed_effort = torch.zeros_like(self._parameters["effort_limit"])
+        self.applied_effort = torch.zeros_like(self.computed_effort)
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the fused actuator group."""
+        return (
+            f"<class {self.__class__.__name__}> object:\n"
+            f"\tActuator model        : {self._class_type.__name__}\n"
+            f"\tNumber of groups      : {len(self._actuators)}\n"
+            f"\tNumber of joints      : {self.num_joints}\n"
+            f"\tJoint indices         : {self._joint_indices.tolist()}\n"
+        )
+
+    """
+    Properties.
+    """
+
+    @property
+    def actuators(self) -> list[ActuatorBase]:
+        """The fused actuator groups."""
+        return self._actuators
+
+    @property
+    def class_type(self) -> type[ActuatorBase]:
+        """The actuator model of the fused groups."""
+        return self._class_type
+
+    @property
+    def num_joints(self) -> int:
+        """Number of concatenated joints of the groups."""
+        return len(self._joint_indices)
+
+    @property
+    def joint_indices(self) -> torch.Tensor:
+        """Articulation's joint indices of the concatenated joints of the groups. Shape is (num_joints,)."""
+        return self._joint_indices
+
+    @property
+    def stiffness(self) -> torch.Tensor:
+        """The stiffness (P gain) over the concatenated joints. Shape is (num_envs, num_joints)."""
+        return self._parameters["stiffness"]
+
+    @property
+    def damping(self) -> torch.Tensor:
+        """The damping (D gain) over the concatenated joints. Shape is (num_envs, num_joints)."""
+        return self._parameters["damping"]
+
+    @property
+    def effort_limit(self) -> torch.Tensor:
+        """The effort limit over the concatenated joints. Shape is (num_envs, num_joints)."""
+        return self._parameters["effort_limit"]
+
+    @property
+    def velocity_limit(self) -> torch.Tensor:
+        """The velocity limit over the concatenated joints. Shape is (num_envs, num_joints)."""
+        return self._parameters["velocity_limit"]
+
+    """
+    Operations.
+    """
+
+    def compute(
+        self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
+    ) -> ArticulationActions:
+        """Process the actions of the fused groups and compute the articulation actions.
+
+        Args:
+            control_action: The joint action instance comprising of the desired joint positions, joint velocities
+                and (feed-forward) joint efforts over the concatenated joints.
+            joint_pos: The current joint positions of the concatenated joints. Shape is (num_envs, num_joints).
+            joint_vel: The current joint velocities of the concatenated joints. Shape is (num_envs, num_joints).
+
+        Returns:
+            The computed desired joint positions, joint velocities and joint efforts.
+        """
+        # update the parameters that were replaced in the groups
+        self._update_parameters()
+        # apply the delays of each group
+        if self._class_type is DelayedPDActuator:
+            control_action.joint_positions = self._apply_group_delays(control_action.joint_positions, "positions")
+            control_action.joint_velocities = self._apply_group_delays(control_action.joint_velocities, "velocities")
+            control_action.joint_efforts = self._apply_group_delays(control_action.joint_efforts, "efforts")
+        # compute errors
+        error_pos = control_action.joint_positions - joint_pos
+        error_vel = control_action.joint_velocities - joint_vel
+        # calculate the desired joint torques
+        self.computed_effort = self.stiffness * error_pos + self.damping * error_vel + control_action.joint_efforts
+        # clip the torques based on the motor limits
+        if self._class_type is DCMotor:
+            self.applied_effort = self._clip_dc_motor_effort(self.computed_effort, joint_vel)
+        else:
+            self.applied_effort = torch.clip(self.computed_effort, min=-self.effort_limit, max=self.effort_limit)
+        # share the efforts with the groups
+        for actuator, columns in zip(self._actuators, self._group_columns):
+            actuator.computed_effort = self.computed_effort[:, columns]
+            actuator.applied_effort = self.applied_effort[:, columns]
+        # set the computed actions back into the control action
+        # note: for implicit actuators, the control action is handled by the simulation
+        if self._class_type is not ImplicitActuator:
+            control_action.joint_efforts = self.applied_effort
+            control_action.joint_positions = None
+            control_action.joint_velocities = None
+        return control_action
+
+    """
+    Helper functions.
+    """
+
+    def _update_parameters(self):
+        """Copy the parameters that were replaced by other tensors in the groups into the concatenated buffers."""
+        for actuator, columns, views in zip(self._actuators, self._group_columns, self._parameter_views):
+            for name, view in views.items():
+                value = getattr(actuator, name)
+                if value is not view:
+                    view[:] = value
+                    setattr(actuator, name, view)
+
+    def _apply_group_delays(self, data: torch.Tensor, name: str) -> torch.Tensor:
+        """Apply the delay buffer of each group to its columns of the data."""
+        return torch.cat(
+            [
+                getattr(actuator, f"{name}_delay_buffer").compute(data[:, columns])
+                for actuator, columns in zip(self._actuators, self._group_columns)
+            ],
+            dim=1,
+        )
+
+    def _clip_dc_motor_effort(self, effort: torch.Tensor, joint_vel: torch.Tensor) -> torch.Tensor:
+        """Clip the torques based on the velocity-dependent limits of the DC motor model."""
+        # compute torque limits
+        # -- max limit
+        max_effort = self._saturation_effort * (1.0 - joint_vel / self.velocity_limit)
+        max_effort = torch.clip(max_effort, min=self._zeros_effort, max=self.effort_limit)
+        # -- min limit
+        min_effort = self._saturation_effort * (-1.0 - joint_vel / self.velocity_limit)
+        min_effort = torch.clip(min_effort, min=-self.effort_limit, max=self._zeros_effort)
+        # clip the torques based on the motor limits
+        return torch.clip(effort, min=min_effort, max=max_effort)
+
+
+def fuse_actuator_groups(
+    actuators: Sequence[ActuatorBase], num_articulation_joints: int, device: str
+) -> list[ActuatorBase | FusedActuatorGroup]:
+    """Fuse the actuator groups of the same supported model for their evaluation.
+
+    The groups of each model in :attr:`FusedActuatorGroup.SUPPORTED_CLASS_TYPES` are replaced by a single
+    :class:`FusedActuatorGroup` if there are at least two of them. It is placed at the position of the first
+    of its groups. The other groups are returned unchanged.
+
+    Args:
+        actuators: The actuator groups of the articulation.
+        num_articulation_joints: The number of joints in the articulation.
+        device: Device used for processing.
+
+    Returns:
+        The fused and remaining actuator groups, in the order of evaluation.
+
+    Raises:
+        ValueError: If a joint is part of several actuator groups.
+    """
+    # check that the groups do not share joints
+    # note: otherwise, the order of evaluation of the groups would matter
+    all_joint_ids = set()
+    for actuator in actuators:
+        if isinstance(actuator.joint_indices, slice):
+            all_joint_ids.update(range(num_articulation_joints)[actuator.joint_indices])
+        else:
+            all_joint_ids.update(torch.as_tensor(actuator.joint_indices).tolist())
+    if len(all_joint_ids) != sum(actuator.num_joints for actuator in actuators):
+        raise ValueError("Actuator groups cannot be fused since some joints are part of several actuator groups.")
+    # collect the groups of each supported model
+    groups_per_model: dict[type[ActuatorBase], list[ActuatorBase]] = dict()
+    for actuator in actuators:
+        if type(actuator) in FusedActuatorGroup.SUPPORTED_CLASS_TYPES:
+            groups_per_model.setdefault(type(actuator), []).append(actuator)
+    # replace the groups with the fused groups
+    evaluators = list()
+    for actuator in actuators:
+        groups = groups_per_model.get(type(actuator))
+        if groups is None or len(groups) < 2:
+            evaluators.append(actuator)
+        elif actuator is groups[0]:
+            evaluators.append(FusedActuatorGroup(groups, num_articulation_joints, device))
+    return evaluators
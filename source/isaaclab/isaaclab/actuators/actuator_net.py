@@ -14,8 +14,9 @@ Currently, the following models are supported:
 
 from __future__ import annotations
 
+import numpy as np
 import torch
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING
 
 from isaaclab.utils.assets import read_file
@@ -45,23 +46,30 @@ class ActuatorNetLSTM(DCMotor):
     def __init__(self, cfg: ActuatorNetLSTMCfg, *args, **kwargs):
         super().__init__(cfg, *args, **kwargs)
 
-        # load the model from JIT file
-        file_bytes = read_file(self.cfg.network_file)
-        self.network = torch.jit.load(file_bytes, map_location=self._device)
+        # load the network with the configured backend
+        self.network = _load_network(self.cfg, self._device)
+        self._network_dtype = _get_network_dtype(self.network, self.cfg)
 
-        # extract number of lstm layers and hidden dim from the shape of weights
-        num_layers = len(self.network.lstm.state_dict()) // 4
-        hidden_dim = self.network.lstm.state_dict()["weight_hh_l0"].shape[1]
+        # extract number of lstm layers and hidden dim from the shape of the states or weights
+        if isinstance(self.network, _OnnxRuntimeNetwork):
+            num_layers, _, hidden_dim = self.network.input_shapes[1]
+        else:
+            lstm_state_dict = getattr(self.network, "_orig_mod", self.network).lstm.state_dict()
+            num_layers = len(lstm_state_dict) // 4
+            hidden_dim = lstm_state_dict["weight_hh_l0"].shape[1]
         # create buffers for storing LSTM inputs
-        self.sea_input = torch.zeros(self._num_envs * self.num_joints, 1, 2, device=self._device)
+        self.sea_input = torch.zeros(
+            self._num_envs * self.num_joints, 1, 2, dtype=self._network_dtype, device=self._device
+        )
         self.sea_hidden_state = torch.zeros(
-            num_layers, self._num_envs * self.num_joints, hidden_dim, device=self._device
+            num_layers, self._num_envs * self.num_joints, hidden_dim, dtype=self._network_dtype, device=self._device
         )
-        self.sea_cell_state = torch.zeros(num_layers, self._num_envs * self.num_joints, hidden_dim, device=self._device)
+        self.sea_cell_state = torch.zeros_like(self.sea_hidden_state)
         # reshape via views (doesn't change the actual memory layout)
         layer_shape_per_env = (num_layers, self._num_envs, self.num_joints, hidden_dim)
         self.sea_hidden_state_per_env = self.sea_hidden_state.view(layer_shape_per_env)
         self.sea_cell_state_per_env = self.sea_cell_state.view(layer_shape_per_env)
+        self._sea_input_per_env = self.sea_input.view(self._num_envs, self.num_joints, 2)
 
     """
     Operations.
@@ -77,17 +85,25 @@ class ActuatorNetLSTM(DCMotor):
         self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
     ) -> ArticulationActions:
         # compute network inputs
-        self.sea_input[:, 0, 0] = (control_action.joint_positions - joint_pos).flatten()
-        self.sea_input[:, 0, 1] = joint_vel.flatten()
+        # note: the inputs are written through a view of the buffer to avoid flattening the joint states
+        self._sea_input_per_env[..., 0] = control_action.joint_positions - joint_pos
+        self._sea_input_per_env[..., 1] = joint_vel
         # save current joint vel for dc-motor clipping
         self._joint_vel[:] = joint_vel
 
         # run network inference
         with torch.inference_mode():
-            torques, (self.sea_hidden_state[:], self.sea_cell_state[:]) = self.network(
-                self.sea_input, (self.sea_hidden_state, self.sea_cell_state)
-            )
-        self.computed_effort = torques.reshape(self._num_envs, self.num_joints)
+            if isinstance(self.network, _OnnxRuntimeNetwork):
+                torques, hidden_state, cell_state = self.network(
+                    self.sea_input, self.sea_hidden_state, self.sea_cell_state
+                )
+            else:
+                torques, (hidden_state, cell_state) = self.network(
+                    self.sea_input, (self.sea_hidden_state, self.sea_cell_state)
+                )
+            self.sea_hidden_state[:] = hidden_state
+            self.sea_cell_state[:] = cell_state
+        self.computed_effort = torques.reshape(self._num_envs, self.num_joints).to(torch.float32)
 
         # clip the computed effort based on the motor limits
         self.applied_effort = self._clip_effort(self.computed_effort)
@@ -111,7 +127,12 @@ class ActuatorNetMLP(DCMotor):
     This class implements the learned model as a neural network based on the work from
     :cite:t:`hwangbo2019learning`. The class stores the history of the joint positions errors
     and velocities which are used to provide input to the neural network. The model is loaded
-    as a TorchScript.
+    with the backend set in the configuration (TorchScript by default).
+
+    The history is stored in a ring buffer, in which the scaled position errors and velocities of the current
+    step overwrite the oldest entry. The entries selected by :attr:`ActuatorNetMLPCfg.input_idx` are gathered
+    from the ring buffer into the network input in a single operation, with indices precomputed for each
+    position of the head of the ring buffer.
 
     Note:
         Only the desired joint positions are used as inputs to the network.
@@ -124,16 +145,34 @@ class ActuatorNetMLP(DCMotor):
     def __init__(self, cfg: ActuatorNetMLPCfg, *args, **kwargs):
         super().__init__(cfg, *args, **kwargs)
 
-        # load the model from JIT file
-        file_bytes = read_file(self.cfg.network_file)
-        self.network = torch.jit.load(file_bytes, map_location=self._device)
+        # load the network with the configured backend
+        self.network = _load_network(self.cfg, self._device)
+        self._network_dtype = _get_network_dtype(self.network, self.cfg)
+
+        # resolve the channels of the inputs in the history based on their order in the network input
+        if self.cfg.input_order == "pos_vel":
+            self._pos_channel, self._vel_channel = 0, 1
+        elif self.cfg.input_order == "vel_pos":
+            self._pos_channel, self._vel_channel = 1, 0
+        else:
+            raise ValueError(
+                f"Invalid input order for MLP actuator net: {self.cfg.input_order}. Must be 'pos_vel' or 'vel_pos'."
+            )
 
-        # create buffers for MLP history
-        history_length = max(self.cfg.input_idx) + 1
-        self._joint_pos_error_history = torch.zeros(
-            self._num_envs, history_length, self.num_joints, device=self._device
+        # create the ring buffer for the MLP history
+        # note: the layout (num_envs, num_joints, channel, history) makes the gathered inputs contiguous
+        input_idx = list(self.cfg.input_idx)
+        self._history_length = max(input_idx) + 1
+        self._history = torch.zeros(self._num_envs, self.num_joints, 2, self._history_length, device=self._device)
+        # the position of the head of the ring buffer
+        self._history_pointer = -1
+        # indices of the inputs in the ring buffer for each position of the head
+        # note: the row at index p holds the indices p - input_idx (modulo history length)
+        self._history_input_indices = torch.remainder(
+            torch.arange(self._history_length, device=self._device).unsqueeze(1)
+            - torch.tensor(input_idx, device=self._device),
+            self._history_length,
         )
-        self._joint_vel_history = torch.zeros(self._num_envs, history_length, self.num_joints, device=self._device)
 
     """
     Operations.
@@ -141,42 +180,35 @@ class ActuatorNetMLP(DCMotor):
 
     def reset(self, env_ids: Sequence[int]):
         # reset the history for the specified environments
-        self._joint_pos_error_history[env_ids] = 0.0
-        self._joint_vel_history[env_ids] = 0.0
+        self._history[env_ids] = 0.0
 
     def compute(
         self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
     ) -> ArticulationActions:
-        # move history queue by 1 and update top of history
+        # move the head of the ring buffer and write the scaled inputs of the current step
+        self._history_pointer = (self._history_pointer + 1) % self._history_length
         # -- positions
-        self._joint_pos_error_history = self._joint_pos_error_history.roll(1, 1)
-        self._joint_pos_error_history[:, 0] = control_action.joint_positions - joint_pos
+        self._history[:, :, self._pos_channel, self._history_pointer] = (
+            control_action.joint_positions - joint_pos
+        ) * self.cfg.pos_scale
         # -- velocity
-        self._joint_vel_history = self._joint_vel_history.roll(1, 1)
-        self._joint_vel_history[:, 0] = joint_vel
+        self._history[:, :, self._vel_channel, self._history_pointer] = joint_vel * self.cfg.vel_scale
         # save current joint vel for dc-motor clipping
         self._joint_vel[:] = joint_vel
 
-        # compute network inputs
-        # -- positions
-        pos_input = torch.cat([self._joint_pos_error_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
-        pos_input = pos_input.view(self._num_envs * self.num_joints, -1)
-        # -- velocity
-        vel_input = torch.cat([self._joint_vel_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
-        vel_input = vel_input.view(self._num_envs * self.num_joints, -1)
-        # -- scale and concatenate inputs
-        if self.cfg.input_order == "pos_vel":
-            network_input = torch.cat([pos_input * self.cfg.pos_scale, vel_input * self.cfg.vel_scale], dim=1)
-        elif self.cfg.input_order == "vel_pos":
-            network_input = torch.cat([vel_input * self.cfg.vel_scale, pos_input * self.cfg.pos_scale], dim=1)
-        else:
-            raise ValueError(
-                f"Invalid input order for MLP actuator net: {self.cfg.input_order}. Must be 'pos_vel' or 'vel_pos'."
-            )
+        # gather the network inputs from the history
+        # note: the inputs of each joint are ordered by channel and then by the input indices
+        network_input = torch.index_select(self._history, 3, self._history_input_indices[self._history_pointer]).view(
+            self._num_envs * self.num_joints, -1
+        )
 
         # run network inference
-        torques = self.network(network_input).view(self._num_envs, self.num_joints)
-        self.computed_effort = torques.view(self._num_envs, self.num_joints) * self.cfg.torque_scale
+        with torch.no_grad():
+            torques = self.network(network_input.to(self._network_dtype))
+        if isinstance(self.network, _OnnxRuntimeNetwork):
+            torques = torques[0]
+        torques = torques.view(self._num_envs, self.num_joints).to(torch.float32)
+        self.computed_effort = torques * self.cfg.torque_scale
 
         # clip the computed effort based on the motor limits
         self.applied_effort = self._clip_effort(self.computed_effort)
@@ -186,3 +218,141 @@ class ActuatorNetMLP(DCMotor):
         control_action.joint_positions = None
         control_action.joint_velocities = None
         return control_action
+
+
+"""
+Network backends.
+"""
+
+_NETWORK_DTYPES = {"float32": torch.float32, "float16": torch.float16, "bfloat16": torch.bfloat16}
+"""Mapping from the names of the network data types to the PyTorch data types."""
+
+
+def _load_network(cfg: ActuatorNetLSTMCfg | ActuatorNetMLPCfg, device: str) -> Callable:
+    """Load the network of an actuator model with the backend set in the configuration.
+
+    Args:
+        cfg: The configuration of the actuator model.
+        device: Device used for processing.
+
+    Returns:
+        The network. For the ``"onnxruntime"`` backend, this is an :class:`_OnnxRuntimeNetwork`.
+
+    Raises:
+        ValueError: If the backend is not supported.
+    """
+    file_bytes = read_file(cfg.network_file)
+    if cfg.network_backend == "onnxruntime":
+        return _OnnxRuntimeNetwork(file_bytes.getvalue(), device)
+    if cfg.network_backend == "torchscript":
+        network = torch.jit.load(file_bytes, map_location=device)
+    elif cfg.network_backend == "torch_compile":
+        network = torch.export.load(file_bytes).module()
+    else:
+        raise ValueError(
+            f"Invalid network backend for actuator net: {cfg.network_backend}."
+            " Must be 'torchscript', 'torch_compile' or 'onnxruntime'."
+        )
+    network = network.to(device=device, dtype=_NETWORK_DTYPES[cfg.network_dtype])
+    if cfg.network_backend == "torch_compile":
+        network = torch.compile(network, dynamic=False)
+    return network
+
+
+def _get_network_dtype(network: Callable, cfg: ActuatorNetLSTMCfg | ActuatorNetMLPCfg) -> torch.dtype:
+    """Get the data type of the inputs of a network loaded with :func:`_load_network`."""
+    if isinstance(network, _OnnxRuntimeNetwork):
+        return network.input_dtypes[0]
+    return _NETWORK_DTYPES[cfg.network_dtype]
+
+
+class _OnnxRuntimeNetwork:
+    """Runs an ONNX model with ONNX Runtime on the memory of PyTorch tensors.
+
+    The inputs and outputs are bound to the memory of the tensors, so that no data is copied between PyTorch and
+    ONNX Runtime. On CUDA devices, the model is run on the current CUDA stream of PyTorch at the creation of the
+    session. The outputs are written into buffers that are allocated at the first call and reused afterwards.
+    """
+
+    _ONNX_DTYPES = {"tensor(float)": torch.float32, "tensor(float16)": torch.float16, "tensor(double)": torch.float64}
+    """Mapping from the ONNX tensor types to the PyTorch data types."""
+
+    _NUMPY_DTYPES = {torch.float32: np.float32, torch.float16: np.float16, torch.float64: np.float64}
+    """Mapping from the PyTorch data types to the NumPy data types used to bind the tensors."""
+
+    def __init__(self, model_bytes: bytes, device: str):
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImportError(
+                "The 'onnxruntime' backend of the actuator nets requires the 'onnxruntime' package"
+                " (or 'onnxruntime-gpu' for CUDA devices)."
+            ) from e
+        # resolve the execution provider
+        device = torch.device(device)
+        if device.type == "cuda":
+            self._device_type = "cuda"
+            self._device_id = torch.cuda.current_device() if device.index is None else device.index
+            providers = [(
+                "CUDAExecutionProvider",
+                {
+                    "device_id": self._device_id,
+                    "user_compute_stream": str(torch.cuda.current_stream(self._device_id).cuda_stream),
+                },
+            )]
+        else:
+            self._device_type, self._device_id = "cpu", 0
+            providers = ["CPUExecutionProvider"]
+        self._device = device
+        # create the session
+        self._session = onnxruntime.InferenceSession(model_bytes, providers=providers)
+        self._input_names = [node.name for node in self._session.get_inputs()]
+        self._output_names = [node.name for node in self._session.get_outputs()]
+        self._input_shapes = [node.shape for node in self._session.get_inputs()]
+        self._input_dtypes = [self._ONNX_DTYPES[node.type] for node in self._session.get_inputs()]
+        self._io_binding = self._session.io_binding()
+        # buffers of the outputs (allocated at the first call)
+        self._outputs: tuple[torch.Tensor, ...] | None = None
+
+    @property
+    def input_shapes(self) -> list[list[int | str | None]]:
+        """The shapes of the inputs of the model. Dynamic axes are given by their names or None."""
+        return self._input_shapes
+
+    @property
+    def input_dtypes(self) -> list[torch.dtype]:
+        """The data types of the inputs of the model."""
+        return self._input_dtypes
+
+    def __call__(self, *inputs: torch.Tensor) -> tuple[torch.Tensor, ...]:
+        """Run the model.
+
+        Args:
+            *inputs: The inputs of the model, in the order of the inputs of the model.
+
+        Returns:
+            The outputs of the model. The tensors are reused by the next call.
+        """
+        # bind the inputs
+        # note: the tensors are kept alive until the end of the call
+        inputs = [x.to(dtype).contiguous() for x, dtype in zip(inputs, self._input_dtypes)]
+        for name, x in zip(self._input_names, inputs):
+            self._bind(self._io_binding.bind_input, name, x)
+        # allocate the output buffers from the output shapes of a first run
+        if self._outputs is None:
+            for name in self._output_names:
+                self._io_binding.bind_output(name, self._device_type, self._device_id)
+            self._session.run_with_iobinding(self._io_binding)
+            self._outputs = tuple(
+                torch.tensor(value.numpy(), device=self._device) for value in self._io_binding.get_outputs()
+            )
+            for name, y in zip(self._output_names, self._outputs):
+                self._bind(self._io_binding.bind_output, name, y)
+            return self._outputs
+        # run the model into the output buffers
+        self._session.run_with_iobinding(self._io_binding)
+        return self._outputs
+
+    def _bind(self, bind_func: Callable, name: str, x: torch.Tensor):
+        """Bind the memory of a tensor to an input or output of the model."""
+        bind_func(name, self._device_type, self._device_id, self._NUMPY_DTYPES[x.dtype], tuple(x.shape), x.data_ptr())
@@ -21,7 +21,7 @@ from pxr import PhysxSchema, UsdPhysics
 import isaaclab.sim as sim_utils
 import isaaclab.utils.math as math_utils
 import isaaclab.utils.string as string_utils
-from isaaclab.actuators import ActuatorBase, ActuatorBaseCfg, ImplicitActuator
+from isaaclab.actuators import ActuatorBase, ActuatorBaseCfg, FusedActuatorGroup, ImplicitActuator, fuse_actuator_groups
 from isaaclab.utils.types import ArticulationActions
 
 from ..asset_base import AssetBase
@@ -1387,6 +1387,12 @@ class Articulation(AssetBase):
             self._data.default_joint_stiffness[:, actuator.joint_indices] = actuator.stiffness
             self._data.default_joint_damping[:, actuator.joint_indices] = actuator.damping
 
+        # resolve the order in which the actuator models are evaluated
+        # note: the groups of the same model are evaluated together if fusion is enabled
+        self._actuator_evaluators: list[ActuatorBase | FusedActuatorGroup] = list(self.actuators.values())
+        if self.cfg.fuse_actuator_groups:
+            self._actuator_evaluators = fuse_actuator_groups(self._actuator_evaluators, self.num_joints, self.device)
+
         # perform some sanity checks to ensure actuators are prepared correctly
         total_act_joints = sum(actuator.num_joints for actuator in self.actuators.values())
         if total_act_joints != (self.num_joints - self.num_fixed_tendons):
@@ -1430,8 +1436,8 @@ class Articulation(AssetBase):
         The actions are first processed using actuator models. Depending on the robot configuration,
         the actuator models compute the joint level simulation commands and sets them into the PhysX buffers.
         """
-        # process actions per group
-        for actuator in self.actuators.values():
+        # process actions per group (or per fused groups of the same model)
+        for actuator in self._actuator_evaluators:
             # prepare input for actuator model based on cached data
             # TODO : A tensor dict would be nice to do the indexing of all tensors together
             control_action = ArticulationActions(
@@ -50,3 +50,12 @@ class ArticulationCfg(AssetBaseCfg):
 
     actuators: dict[str, ActuatorBaseCfg] = MISSING
     """Actuators for the robot with corresponding joint names."""
+
+    fuse_actuator_groups: bool = False
+    """Whether to evaluate the actuator groups of the same model together. Defaults to False.
+
+    If True, the groups of the same actuator model are evaluated at once over their concatenated joints
+    with a :class:`~isaaclab.actuators.FusedActuatorGroup`. This reduces the number of launched kernels for
+    articulations with many actuator groups, while giving the same results as evaluating each group. Groups
+    of models that are not supported by the fused evaluation are evaluated separately.
+    """
@@ -9,7 +9,11 @@ import weakref
 import omni.physics.tensors.impl.api as physx
 
 import isaaclab.utils.math as math_utils
-from isaaclab.utils.buffers import TimestampedBuffer
+from isaaclab.utils.buffers import TimestampedBuffer, TimestampedPropertyStats, timestamped_property
+
+# lazy buffers that the derived root quantities depend on
+# note: writing a root state into the simulation modifies at least one of these buffers in-place
+_ROOT_STATE_BUFFERS = ("_root_state_w", "_root_link_state_w", "_root_com_state_w")
 
 
 class ArticulationData:
@@ -81,6 +85,21 @@ class ArticulationData:
         # since we do finite differencing.
         self.joint_acc
 
+    def get_cache_stats(self) -> dict[str, TimestampedPropertyStats]:
+        """Returns the hit and miss counts of the memoized derived quantities.
+
+        Derived quantities such as :attr:`projected_gravity_b` or :attr:`root_lin_vel_b` are computed at most
+        once per simulation step, and again only if the root state is written in the meantime.
+
+        Returns:
+            A dictionary mapping the names of the accessed derived quantities to their counters.
+        """
+        return timestamped_property.get_stats(self)
+
+    def reset_cache_stats(self):
+        """Resets the hit and miss counts of the memoized derived quantities."""
+        timestamped_property.reset_stats(self)
+
     ##
     # Names.
     ##
@@ -408,12 +427,12 @@ class ArticulationData:
             self._body_acc_w.timestamp = self._sim_timestamp
         return self._body_acc_w.data
 
-    @property
+    @timestamped_property(dependencies=_ROOT_STATE_BUFFERS)
     def projected_gravity_b(self):
         """Projection of the gravity direction on base frame. Shape is (num_instances, 3)."""
         return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.GRAVITY_VEC_W)
 
-    @property
+    @timestamped_property(dependencies=_ROOT_STATE_BUFFERS)
     def heading_w(self):
         """Yaw heading of the base frame (in radians). Shape is (num_instances,).
 
@@ -499,7 +518,7 @@ class ArticulationData:
         """
         return self.root_state_w[:, 10:13]
 
-    @property
+    @timestamped_property(dependencies=_ROOT_STATE_BUFFERS)
     def root_lin_vel_b(self) -> torch.Tensor:
         """Root linear velocity in base frame. Shape is (num_instances, 3).
 
@@ -508,7 +527,7 @@ class ArticulationData:
         """
         return math_utils.quat_rotate_inverse(self.root_quat_w, self.root_lin_vel_w)
 
-    @property
+    @timestamped_property(dependencies=_ROOT_STATE_BUFFERS)
     def root_ang_vel_b(self) -> torch.Tensor:
         """Root angular velocity in base world frame. Shape is (num_instances, 3).
 
@@ -571,7 +590,7 @@ class ArticulationData:
         """
         return self.root_link_state_w[:, 10:13]
 
-    @property
+    @timestamped_property(dependencies=_ROOT_STATE_BUFFERS)
     def root_link_lin_vel_b(self) -> torch.Tensor:
         """Root link linear velocity in base frame. Shape is (num_instances, 3).
 
@@ -580,7 +599,7 @@ class ArticulationData:
         """
         return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.root_link_lin_vel_w)
 
-    @property
+    @timestamped_property(dependencies=_ROOT_STATE_BUFFERS)
     def root_link_ang_vel_b(self) -> torch.Tensor:
         """Root link angular velocity in base world frame. Shape is (num_instances, 3).
 
@@ -646,7 +665,7 @@ class ArticulationData:
             return velocity[:, 3:6]
         return self.root_com_state_w[:, 10:13]
 
-    @property
+    @timestamped_property(dependencies=_ROOT_STATE_BUFFERS)
     def root_com_lin_vel_b(self) -> torch.Tensor:
         """Root center of mass linear velocity in base frame. Shape is (num_instances, 3).
 
@@ -655,7 +674,7 @@ class ArticulationData:
         """
         return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.root_com_lin_vel_w)
 
-    @property
+    @timestamped_property(dependencies=_ROOT_STATE_BUFFERS)
     def root_com_ang_vel_b(self) -> torch.Tensor:
         """Root center of mass angular velocity in base world frame. Shape is (num_instances, 3).
 
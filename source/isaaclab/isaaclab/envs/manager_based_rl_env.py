@@ -11,17 +11,22 @@ import math
 import numpy as np
 import torch
 from collections.abc import Sequence
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any, ClassVar
 
 from isaacsim.core.version import get_version
 
 from isaaclab.managers import CommandManager, CurriculumManager, RewardManager, TerminationManager
 from isaaclab.ui.widgets import ManagerLiveVisualizer
+from isaaclab.utils import StepProfiler
 
 from .common import VecEnvStepReturn
 from .manager_based_env import ManagerBasedEnv
 from .manager_based_rl_env_cfg import ManagerBasedRLEnvCfg
 
+_NULL_CONTEXT = nullcontext()
+"""No-op context manager used in place of the profiler sections when profiling is disabled."""
+
 
 class ManagerBasedRLEnv(ManagerBasedEnv, gym.Env):
     """The superclass for the manager-based workflow reinforcement learning-based environments.
@@ -129,6 +134,12 @@ class ManagerBasedRLEnv(ManagerBasedEnv, gym.Env):
         # setup the action and observation spaces for Gym
         self._configure_gym_env_spaces()
 
+        # setup the profiler of the environment step
+        self.profiler: StepProfiler | None = None
+        if self.cfg.profile_step:
+            self.profiler = StepProfiler(device=self.device, window_size=self.cfg.profile_window_size)
+            self._profile_manager_terms()
+
         # perform events at the start of the simulation
         if "startup" in self.event_manager.available_modes:
             self.event_manager.apply(mode="startup")
@@ -168,8 +179,11 @@ class ManagerBasedRLEnv(ManagerBasedEnv, gym.Env):
         Returns:
             A tuple containing the observations, rewards, resets (terminated and truncated) and extras.
         """
+        if self.profiler is not None:
+            self.profiler.start("step")
         # process actions
-        self.action_manager.process_action(action.to(self.device))
+        with self._profile("action_manager.process_action"):
+            self.action_manager.process_action(action.to(self.device))
 
         self.recorder_manager.record_pre_step()
 
@@ -178,32 +192,39 @@ class ManagerBasedRLEnv(ManagerBasedEnv, gym.Env):
         is_rendering = self.sim.has_gui() or self.sim.has_rtx_sensors()
 
         # perform physics stepping
-        for _ in range(self.cfg.decimation):
-            self._sim_step_counter += 1
-            # set actions into buffers
-            self.action_manager.apply_action()
-            # set actions into simulator
-            self.scene.write_data_to_sim()
-            # simulate
-            self.sim.step(render=False)
-            # render between steps only if the GUI or an RTX sensor needs it
-            # note: we assume the render interval to be the shortest accepted rendering interval.
-            #    If a camera needs rendering at a faster frequency, this will lead to unexpected behavior.
-            if self._sim_step_counter % self.cfg.sim.render_interval == 0 and is_rendering:
-                self.sim.render()
-            # update buffers at sim dt
-            self.scene.update(dt=self.physics_dt)
+        with self._profile("decimation"):
+            for _ in range(self.cfg.decimation):
+                self._sim_step_counter += 1
+                # set actions into buffers
+                with self._profile("decimation/action_manager.apply_action"):
+                    self.action_manager.apply_action()
+                # set actions into simulator
+                with self._profile("decimation/scene.write_data_to_sim"):
+                    self.scene.write_data_to_sim()
+                # simulate
+                with self._profile("decimation/sim.step"):
+                    self.sim.step(render=False)
+                # render between steps only if the GUI or an RTX sensor needs it
+                # note: we assume the render interval to be the shortest accepted rendering interval.
+                #    If a camera needs rendering at a faster frequency, this will lead to unexpected behavior.
+                if self._sim_step_counter % self.cfg.sim.render_interval == 0 and is_rendering:
+                    self.sim.render()
+                # update buffers at sim dt
+                with self._profile("decimation/scene.update"):
+                    self.scene.update(dt=self.physics_dt)
 
         # post-step:
         # -- update env counters (used for curriculum generation)
         self.episode_length_buf += 1  # step in current episode (per env)
         self.common_step_counter += 1  # total step (common for all envs)
         # -- check terminations
-        self.reset_buf = self.termination_manager.compute()
+        with self._profile("termination_manager.compute"):
+            self.reset_buf = self.termination_manager.compute()
         self.reset_terminated = self.termination_manager.terminated
         self.reset_time_outs = self.termination_manager.time_outs
         # -- reward computation
-        self.reward_buf = self.reward_manager.compute(dt=self.step_dt)
+        with self._profile("reward_manager.compute"):
+            self.reward_buf = self.reward_manager.compute(dt=self.step_dt)
 
         if len(self.recorder_manager.active_terms) > 0:
             # update observations for recording if needed
@@ -213,29 +234,37 @@ class ManagerBasedRLEnv(ManagerBasedEnv, gym.Env):
         # -- reset envs that terminated/timed-out and log the episode information
         reset_env_ids = self.reset_buf.nonzero(as_tuple=False).squeeze(-1)
         if len(reset_env_ids) > 0:
-            # trigger recorder terms for pre-reset calls
-            self.recorder_manager.record_pre_reset(reset_env_ids)
+            with self._profile("reset"):
+                # trigger recorder terms for pre-reset calls
+                self.recorder_manager.record_pre_reset(reset_env_ids)
 
-            self._reset_idx(reset_env_ids)
-            # update articulation kinematics
-            self.scene.write_data_to_sim()
-            self.sim.forward()
+                self._reset_idx(reset_env_ids)
+                # update articulation kinematics
+                self.scene.write_data_to_sim()
+                self.sim.forward()
 
-            # if sensors are added to the scene, make sure we render to reflect changes in reset
-            if self.sim.has_rtx_sensors() and self.cfg.rerender_on_reset:
-                self.sim.render()
+                # if sensors are added to the scene, make sure we render to reflect changes in reset
+                if self.sim.has_rtx_sensors() and self.cfg.rerender_on_reset:
+                    self.sim.render()
 
-            # trigger recorder terms for post-reset calls
-            self.recorder_manager.record_post_reset(reset_env_ids)
+                # trigger recorder terms for post-reset calls
+                self.recorder_manager.record_post_reset(reset_env_ids)
 
         # -- update command
-        self.command_manager.compute(dt=self.step_dt)
+        with self._profile("command_manager.compute"):
+            self.command_manager.compute(dt=self.step_dt)
         # -- step interval events
         if "interval" in self.event_manager.available_modes:
-            self.event_manager.apply(mode="interval", dt=self.step_dt)
+            with self._profile("event_manager.apply_interval"):
+                self.event_manager.apply(mode="interval", dt=self.step_dt)
         # -- compute observations
         # note: done after reset to get the correct observations for reset envs
-        self.obs_buf = self.observation_manager.compute()
+        with self._profile("observation_manager.compute"):
+            self.obs_buf = self.observation_manager.compute()
+
+        if self.profiler is not None:
+            self.profiler.stop("step")
+            self.profiler.step()
 
         # return observations, rewards, resets and extras
         return self.obs_buf, self.reward_buf, self.reset_terminated, self.reset_time_outs, self.extras
@@ -343,6 +372,48 @@ class ManagerBasedRLEnv(ManagerBasedEnv, gym.Env):
         self.observation_space = gym.vector.utils.batch_space(self.single_observation_space, self.num_envs)
         self.action_space = gym.vector.utils.batch_space(self.single_action_space, self.num_envs)
 
+    def _profile(self, name: str) -> AbstractContextManager:
+        """Get the context manager that times a phase of the step if profiling is enabled.
+
+        Args:
+            name: The name of the phase.
+
+        Returns:
+            The context manager of the profiler section, or a no-op context manager if profiling is disabled.
+        """
+        if self.profiler is None:
+            return _NULL_CONTEXT
+        return self.profiler.section(name)
+
+    def _profile_manager_terms(self):
+        """Wrap the terms of the managers so that their calls are timed by the profiler.
+
+        The sections of the terms are named after the manager and the term, e.g. ``"reward/<term_name>"``.
+        """
+        # -- action terms
+        for name, term in self.action_manager._terms.items():
+            term.process_actions = self.profiler.wrap(f"action/{name}.process_actions", term.process_actions)
+            term.apply_actions = self.profiler.wrap(f"action/{name}.apply_actions", term.apply_actions)
+        # -- command terms
+        for name, term in self.command_manager._terms.items():
+            term.compute = self.profiler.wrap(f"command/{name}", term.compute)
+        # -- observation terms
+        for group_name, term_names in self.observation_manager._group_obs_term_names.items():
+            for name, term_cfg in zip(term_names, self.observation_manager._group_obs_term_cfgs[group_name]):
+                term_cfg.func = self.profiler.wrap(f"observation/{group_name}/{name}", term_cfg.func)
+        # -- event terms
+        for mode, term_names in self.event_manager._mode_term_names.items():
+            for name, term_cfg in zip(term_names, self.event_manager._mode_term_cfgs[mode]):
+                term_cfg.func = self.profiler.wrap(f"event/{mode}/{name}", term_cfg.func)
+        # -- reward, termination and curriculum terms
+        for prefix, manager in (
+            ("reward", self.reward_manager),
+            ("termination", self.termination_manager),
+            ("curriculum", self.curriculum_manager),
+        ):
+            for name, term_cfg in zip(manager._term_names, manager._term_cfgs):
+                term_cfg.func = self.profiler.wrap(f"{prefix}/{name}", term_cfg.func)
+
     def _reset_idx(self, env_ids: Sequence[int]):
         """Reset environments based on specified indices.
 
@@ -386,6 +457,9 @@ class ManagerBasedRLEnv(ManagerBasedEnv, gym.Env):
         # -- recorder manager
         info = self.recorder_manager.reset(env_ids)
         self.extras["log"].update(info)
+        # -- step profiler
+        if self.profiler is not None:
+            self.extras["log"].update(self.profiler.get_log())
 
         # reset the episode length buffer
         self.episode_length_buf[env_ids] = 0
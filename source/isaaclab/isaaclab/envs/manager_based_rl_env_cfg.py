@@ -41,6 +41,23 @@ class ManagerBasedRLEnvCfg(ManagerBasedEnvCfg):
         wrappers to determine what type of done signal to send to the corresponding learning agent.
     """
 
+    profile_step: bool = False
+    """Whether to profile the time spent in the phases of the environment step and in the manager terms.
+    Defaults to False.
+
+    If True, each phase of :meth:`ManagerBasedRLEnv.step` (action processing, decimation loop, scene update and
+    computations of the managers) and each term of the managers is timed with a :class:`~isaaclab.utils.StepProfiler`.
+    The mean times over the last :attr:`profile_window_size` steps are added to ``extras["log"]`` with the
+    ``"Profile/"`` prefix when environments are reset. The statistics can also be exported with the profiler
+    of the environment, for instance with :meth:`~isaaclab.utils.StepProfiler.to_table`.
+    """
+
+    profile_window_size: int = 100
+    """Number of environment steps over which the profiled times are averaged. Defaults to 100.
+
+    This is only used if :attr:`profile_step` is True.
+    """
+
     episode_length_s: float = MISSING
     """Duration of an episode (in seconds).
 
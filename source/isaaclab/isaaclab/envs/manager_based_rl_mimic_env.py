@@ -65,6 +65,46 @@ class ManagerBasedRLMimicEnv(ManagerBasedRLEnv):
         """
         raise NotImplementedError
 
+    def target_eef_poses_to_actions(
+        self,
+        target_eef_pose_dict: dict,
+        gripper_action_dict: dict,
+        noise: torch.Tensor | None = None,
+        env_ids: Sequence[int] | None = None,
+    ) -> torch.Tensor:
+        """
+        Batched version of :meth:`target_eef_pose_to_action` for several environments.
+
+        The default implementation calls :meth:`target_eef_pose_to_action` for each environment. Environments
+        should override it with a vectorized implementation to convert the targets of all the environments at once.
+
+        Args:
+            target_eef_pose_dict: Dictionary of 4x4 target eef poses for each end-effector. Shape of each
+                pose is (len(env_ids), 4, 4).
+            gripper_action_dict: Dictionary of gripper actions for each end-effector. Shape of each action is
+                (len(env_ids), gripper_action_dim).
+            noise: Amplitude of the noise to add to the action of each environment. Shape is (len(env_ids),).
+                If None, no noise is added. A zero amplitude adds no noise.
+            env_ids: Environment indices to compute the actions for. If None, all envs are considered.
+
+        Returns:
+            An action torch.Tensor that's compatible with env.step(). Shape is (len(env_ids), action_dim).
+        """
+        if env_ids is None:
+            env_ids = range(self.num_envs)
+        actions = []
+        for i, env_id in enumerate(env_ids):
+            env_noise = None if noise is None else noise[i].item()
+            actions.append(
+                self.target_eef_pose_to_action(
+                    target_eef_pose_dict={eef_name: pose[i] for eef_name, pose in target_eef_pose_dict.items()},
+                    gripper_action_dict={eef_name: action[i] for eef_name, action in gripper_action_dict.items()},
+                    noise=env_noise,
+                    env_id=env_id,
+                )
+            )
+        return torch.stack(actions)
+
     def action_to_target_eef_pose(self, action: torch.Tensor) -> dict[str, torch.Tensor]:
         """
         Converts action (compatible with env.step) to a target pose for the end effector controller.
@@ -14,6 +14,7 @@ the event introduced by the function.
 
 from __future__ import annotations
 
+import itertools
 import torch
 from typing import TYPE_CHECKING, Literal
 
@@ -57,6 +58,11 @@ class randomize_rigid_body_material(ManagerTermBase):
         PhysX only allows 64000 unique physics materials in the scene. If the number of materials exceeds this
         limit, the simulation will crash. Due to this reason, we sample the materials only once during initialization.
         Afterwards, these materials are randomly assigned to the geometries of the asset.
+
+    .. note::
+        The material properties of the asset are read from the simulation only at the first call and cached
+        afterwards. Thus, changes made to the material properties of the asset outside of this term (for instance,
+        by another term randomizing the materials of the same asset) are overwritten for the given environments.
     """
 
     def __init__(self, cfg: EventTermCfg, env: ManagerBasedEnv):
@@ -97,9 +103,16 @@ class randomize_rigid_body_material(ManagerTermBase):
                     "Randomization term 'randomize_rigid_body_material' failed to parse the number of shapes per body."
                     f" Expected total shapes: {expected_shapes}, but got: {num_shapes}."
                 )
+            # obtain indices of the shapes of the selected bodies
+            shape_offsets = [0] + list(itertools.accumulate(self.num_shapes_per_body))
+            self.shape_ids = torch.cat([
+                torch.arange(shape_offsets[body_id], shape_offsets[body_id + 1], device="cpu")
+                for body_id in self.asset_cfg.body_ids
+            ])
         else:
             # in this case, we don't need to do special indexing
             self.num_shapes_per_body = None
+            self.shape_ids = torch.arange(self.asset.root_physx_view.max_shapes, device="cpu")
 
         # obtain parameters for sampling friction and restitution values
         static_friction_range = cfg.params.get("static_friction_range", (1.0, 1.0))
@@ -119,6 +132,9 @@ class randomize_rigid_body_material(ManagerTermBase):
         if make_consistent:
             self.material_buckets[:, 1] = torch.min(self.material_buckets[:, 0], self.material_buckets[:, 1])
 
+        # material buffer of the asset (read from the simulation at the first call)
+        self.materials: torch.Tensor | None = None
+
     def __call__(
         self,
         env: ManagerBasedEnv,
@@ -136,30 +152,18 @@ class randomize_rigid_body_material(ManagerTermBase):
         else:
             env_ids = env_ids.cpu()
 
-        # randomly assign material IDs to the geometries
-        total_num_shapes = self.asset.root_physx_view.max_shapes
-        bucket_ids = torch.randint(0, num_buckets, (len(env_ids), total_num_shapes), device="cpu")
-        material_samples = self.material_buckets[bucket_ids]
-
         # retrieve material buffer from the physics simulation
-        materials = self.asset.root_physx_view.get_material_properties()
+        if self.materials is None:
+            self.materials = self.asset.root_physx_view.get_material_properties()
 
+        # randomly assign material IDs to the geometries
+        bucket_ids = torch.randint(0, num_buckets, (len(env_ids), len(self.shape_ids)), device="cpu")
         # update material buffer with new samples
-        if self.num_shapes_per_body is not None:
-            # sample material properties from the given ranges
-            for body_id in self.asset_cfg.body_ids:
-                # obtain indices of shapes for the body
-                start_idx = sum(self.num_shapes_per_body[:body_id])
-                end_idx = start_idx + self.num_shapes_per_body[body_id]
-                # assign the new materials
-                # material samples are of shape: num_env_ids x total_num_shapes x 3
-                materials[env_ids, start_idx:end_idx] = material_samples[:, start_idx:end_idx]
-        else:
-            # assign all the materials
-            materials[env_ids] = material_samples[:]
+        # material samples are of shape: num_env_ids x num_shape_ids x 3
+        self.materials[env_ids[:, None], self.shape_ids] = self.material_buckets[bucket_ids]
 
         # apply to simulation
-        self.asset.root_physx_view.set_material_properties(materials, env_ids)
+        self.asset.root_physx_view.set_material_properties(self.materials, env_ids)
 
 
 def randomize_rigid_body_mass(
@@ -50,6 +50,12 @@ class EventManager(ManagerBase):
         The triggering of operations corresponding to the mode ``"interval"`` are the only mode that are
         directly handled by the manager itself. The other modes are handled by the environment implementation.
 
+    .. note::
+
+        The timers of the ``"interval"`` terms and the trigger steps of the ``"reset"`` terms are stored in
+        tensors of shape (num_terms, num_envs). This way, the terms to apply are computed for all the terms
+        at once, and the host only synchronizes once per call to decide which terms are applied.
+
     """
 
     _env: ManagerBasedEnv
@@ -123,23 +129,21 @@ class EventManager(ManagerBase):
             for term_cfg in mode_cfg:
                 term_cfg.func.reset(env_ids=env_ids)
 
-        # resolve number of environments
+        # resolve the environment indices
         if env_ids is None:
-            num_envs = self._env.num_envs
-        else:
-            num_envs = len(env_ids)
+            env_ids = slice(None)
         # if we are doing interval based events then we need to reset the time left
         # when the episode starts. otherwise the counter will start from the last time
         # for that environment
-        if "interval" in self._mode_class_term_cfgs:
-            for index, term_cfg in enumerate(self._mode_class_term_cfgs["interval"]):
-                # sample a new interval and set that as time left
-                # note: global time events are based on simulation time and not episode time
-                #   so we do not reset them
-                if not term_cfg.is_global_time:
-                    lower, upper = term_cfg.interval_range_s
-                    sampled_interval = torch.rand(num_envs, device=self.device) * (upper - lower) + lower
-                    self._interval_term_time_left[index][env_ids] = sampled_interval
+        if len(self._interval_term_time_left) > 0:
+            # sample a new interval and set that as time left
+            # note: global time events are based on simulation time and not episode time
+            #   so we do not reset them
+            time_left = self._interval_term_time_left[:, env_ids]
+            sampled_interval = self._sample_interval_time_left(time_left.shape[1])
+            self._interval_term_time_left[:, env_ids] = torch.where(
+                self._interval_term_is_global_time.unsqueeze(1), time_left, sampled_interval
+            )
 
         # nothing to log here
         return {}
@@ -196,75 +200,13 @@ class EventManager(ManagerBase):
         if mode == "reset" and global_env_step_count is None:
             raise ValueError(f"Event mode '{mode}' requires the total number of environment steps to be provided.")
 
-        # iterate over all the event terms
-        for index, term_cfg in enumerate(self._mode_term_cfgs[mode]):
-            if mode == "interval":
-                # extract time left for this term
-                time_left = self._interval_term_time_left[index]
-                # update the time left for each environment
-                time_left -= dt
-
-                # check if the interval has passed and sample a new interval
-                # note: we compare with a small value to handle floating point errors
-                if term_cfg.is_global_time:
-                    if time_left < 1e-6:
-                        lower, upper = term_cfg.interval_range_s
-                        sampled_interval = torch.rand(1) * (upper - lower) + lower
-                        self._interval_term_time_left[index][:] = sampled_interval
-
-                        # call the event term (with None for env_ids)
-                        term_cfg.func(self._env, None, **term_cfg.params)
-                else:
-                    valid_env_ids = (time_left < 1e-6).nonzero().flatten()
-                    if len(valid_env_ids) > 0:
-                        lower, upper = term_cfg.interval_range_s
-                        sampled_time = torch.rand(len(valid_env_ids), device=self.device) * (upper - lower) + lower
-                        self._interval_term_time_left[index][valid_env_ids] = sampled_time
-
-                        # call the event term
-                        term_cfg.func(self._env, valid_env_ids, **term_cfg.params)
-            elif mode == "reset":
-                # obtain the minimum step count between resets
-                min_step_count = term_cfg.min_step_count_between_reset
-                # resolve the environment indices
-                if env_ids is None:
-                    env_ids = slice(None)
-
-                # We bypass the trigger mechanism if min_step_count is zero, i.e. apply term on every reset call.
-                # This should avoid the overhead of checking the trigger condition.
-                if min_step_count == 0:
-                    self._reset_term_last_triggered_step_id[index][env_ids] = global_env_step_count
-                    self._reset_term_last_triggered_once[index][env_ids] = True
-
-                    # call the event term with the environment indices
-                    term_cfg.func(self._env, env_ids, **term_cfg.params)
-                else:
-                    # extract last reset step for this term
-                    last_triggered_step = self._reset_term_last_triggered_step_id[index][env_ids]
-                    triggered_at_least_once = self._reset_term_last_triggered_once[index][env_ids]
-                    # compute the steps since last reset
-                    steps_since_triggered = global_env_step_count - last_triggered_step
-
-                    # check if the term can be applied after the minimum step count between triggers has passed
-                    valid_trigger = steps_since_triggered >= min_step_count
-                    # check if the term has not been triggered yet (in that case, we trigger it at least once)
-                    # this is usually only needed at the start of the environment
-                    valid_trigger |= (last_triggered_step == 0) & ~triggered_at_least_once
-
-                    # select the valid environment indices based on the trigger
-                    if env_ids == slice(None):
-                        valid_env_ids = valid_trigger.nonzero().flatten()
-                    else:
-                        valid_env_ids = env_ids[valid_trigger]
-
-                    # reset the last reset step for each environment to the current env step count
-                    if len(valid_env_ids) > 0:
-                        self._reset_term_last_triggered_once[index][valid_env_ids] = True
-                        self._reset_term_last_triggered_step_id[index][valid_env_ids] = global_env_step_count
-
-                        # call the event term
-                        term_cfg.func(self._env, valid_env_ids, **term_cfg.params)
-            else:
+        if mode == "interval":
+            self._apply_interval(dt)
+        elif mode == "reset":
+            self._apply_reset(env_ids, global_env_step_count)
+        else:
+            # iterate over all the event terms
+            for term_cfg in self._mode_term_cfgs[mode]:
                 # call the event term
                 term_cfg.func(self._env, env_ids, **term_cfg.params)
 
@@ -288,7 +230,15 @@ class EventManager(ManagerBase):
         term_found = False
         for mode, terms in self._mode_term_names.items():
             if term_name in terms:
-                self._mode_term_cfgs[mode][terms.index(term_name)] = cfg
+                index = terms.index(term_name)
+                self._mode_term_cfgs[mode][index] = cfg
+                # update the stacked settings of the term
+                if mode == "interval":
+                    self._interval_term_ranges[index] = torch.tensor(cfg.interval_range_s, device=self.device)
+                    self._interval_term_is_global_time[index] = cfg.is_global_time
+                elif mode == "reset":
+                    self._reset_term_min_step_count[index] = cfg.min_step_count_between_reset
+                    self._reset_term_has_min_step_count = bool(torch.any(self._reset_term_min_step_count > 0))
                 term_found = True
                 break
         if not term_found:
@@ -318,13 +268,99 @@ class EventManager(ManagerBase):
     Helper functions.
     """
 
+    def _apply_interval(self, dt: float):
+        """Apply the event terms in the "interval" mode whose time interval has passed."""
+        # update the time left of all the terms for each environment
+        self._interval_term_time_left -= dt
+        # check if the interval has passed for all the terms at once
+        # note: we compare with a small value to handle floating point errors
+        due_mask = self._interval_term_time_left < 1e-6
+        # sample a new interval where the interval has passed
+        sampled_interval = self._sample_interval_time_left(self.num_envs)
+        self._interval_term_time_left = torch.where(due_mask, sampled_interval, self._interval_term_time_left)
+
+        # obtain the number of environments for which each term is due
+        # note: this is the only synchronization with the device if no term is due
+        num_due_envs = due_mask.sum(dim=1).tolist()
+        if sum(num_due_envs) == 0:
+            return
+        # obtain the environment indices of each term from the stacked mask
+        due_env_ids = torch.split(due_mask.nonzero()[:, 1], num_due_envs)
+
+        # call the due event terms
+        for index, term_cfg in enumerate(self._mode_term_cfgs["interval"]):
+            if num_due_envs[index] == 0:
+                continue
+            if term_cfg.is_global_time:
+                # call the event term (with None for env_ids)
+                term_cfg.func(self._env, None, **term_cfg.params)
+            else:
+                term_cfg.func(self._env, due_env_ids[index], **term_cfg.params)
+
+    def _apply_reset(self, env_ids: Sequence[int] | None, global_env_step_count: int):
+        """Apply the event terms in the "reset" mode whose minimum step count between triggers has passed."""
+        # resolve the environment indices
+        if env_ids is None:
+            env_ids = slice(None)
+
+        # extract last reset step for all the terms
+        last_triggered_step = self._reset_term_last_triggered_step_id[:, env_ids]
+        triggered_at_least_once = self._reset_term_last_triggered_once[:, env_ids]
+        # compute the steps since last reset
+        steps_since_triggered = global_env_step_count - last_triggered_step
+
+        # check if the term can be applied after the minimum step count between triggers has passed
+        valid_trigger = steps_since_triggered >= self._reset_term_min_step_count.unsqueeze(1)
+        # check if the term has not been triggered yet (in that case, we trigger it at least once)
+        # this is usually only needed at the start of the environment
+        valid_trigger |= (last_triggered_step == 0) & ~triggered_at_least_once
+        # terms with a zero minimum step count are applied on every reset call
+        valid_trigger |= (self._reset_term_min_step_count == 0).unsqueeze(1)
+
+        # reset the last reset step for each environment to the current env step count
+        self._reset_term_last_triggered_once[:, env_ids] = triggered_at_least_once | valid_trigger
+        self._reset_term_last_triggered_step_id[:, env_ids] = torch.where(
+            valid_trigger, global_env_step_count, last_triggered_step
+        )
+
+        # obtain the environment indices of the terms with a non-zero minimum step count from the stacked mask
+        # note: we bypass this for the other terms to avoid synchronizing with the device
+        if self._reset_term_has_min_step_count:
+            check_mask = valid_trigger & (self._reset_term_min_step_count > 0).unsqueeze(1)
+            num_valid_envs = check_mask.sum(dim=1).tolist()
+            valid_env_ids = torch.split(check_mask.nonzero()[:, 1], num_valid_envs)
+            if not isinstance(env_ids, slice):
+                env_ids_tensor = torch.as_tensor(env_ids, device=self.device)
+                valid_env_ids = [env_ids_tensor[ids] for ids in valid_env_ids]
+
+        # call the event terms
+        for index, term_cfg in enumerate(self._mode_term_cfgs["reset"]):
+            if term_cfg.min_step_count_between_reset == 0:
+                # call the event term with the environment indices
+                term_cfg.func(self._env, env_ids, **term_cfg.params)
+            elif num_valid_envs[index] > 0:
+                term_cfg.func(self._env, valid_env_ids[index], **term_cfg.params)
+
+    def _sample_interval_time_left(self, num_envs: int) -> torch.Tensor:
+        """Sample the time left of all the "interval" terms for the given number of environments.
+
+        The terms with global time share the value sampled for the first environment.
+
+        Returns:
+            The sampled time left. Shape is (num_terms, num_envs).
+        """
+        lower = self._interval_term_ranges[:, 0].unsqueeze(1)
+        upper = self._interval_term_ranges[:, 1].unsqueeze(1)
+        sampled_interval = torch.rand(len(lower), num_envs, device=self.device) * (upper - lower) + lower
+        return torch.where(self._interval_term_is_global_time.unsqueeze(1), sampled_interval[:, :1], sampled_interval)
+
     def _prepare_terms(self):
         # buffer to store the time left for "interval" mode
-        # if interval is global, then it is a single value, otherwise it is per environment
-        self._interval_term_time_left: list[torch.Tensor] = list()
-        # buffer to store the step count when the term was last triggered for each environment for "reset" mode
-        self._reset_term_last_triggered_step_id: list[torch.Tensor] = list()
-        self._reset_term_last_triggered_once: list[torch.Tensor] = list()
+        # if interval is global, then all the environments share the same value
+        interval_term_ranges: list[tuple[float, float]] = list()
+        interval_term_is_global_time: list[bool] = list()
+        # buffer to store the minimum step count between triggers for "reset" mode
+        reset_term_min_step_count: list[int] = list()
 
         # check if config is dict already
         if isinstance(self.cfg, dict):
@@ -373,16 +409,8 @@ class EventManager(ManagerBase):
                         f"Event term '{term_name}' has mode 'interval' but 'interval_range_s' is not specified."
                     )
 
-                # sample the time left for global
-                if term_cfg.is_global_time:
-                    lower, upper = term_cfg.interval_range_s
-                    time_left = torch.rand(1) * (upper - lower) + lower
-                    self._interval_term_time_left.append(time_left)
-                else:
-                    # sample the time left for each environment
-                    lower, upper = term_cfg.interval_range_s
-                    time_left = torch.rand(self.num_envs, device=self.device) * (upper - lower) + lower
-                    self._interval_term_time_left.append(time_left)
+                interval_term_ranges.append(term_cfg.interval_range_s)
+                interval_term_is_global_time.append(term_cfg.is_global_time)
             # -- reset mode
             elif term_cfg.mode == "reset":
                 if term_cfg.min_step_count_between_reset < 0:
@@ -390,10 +418,26 @@ class EventManager(ManagerBase):
                         f"Event term '{term_name}' has mode 'reset' but 'min_step_count_between_reset' is"
                         f" negative: {term_cfg.min_step_count_between_reset}. Please provide a non-negative value."
                     )
-
-                # initialize the current step count for each environment to zero
-                step_count = torch.zeros(self.num_envs, device=self.device, dtype=torch.int32)
-                self._reset_term_last_triggered_step_id.append(step_count)
-                # initialize the trigger flag for each environment to zero
-                no_trigger = torch.zeros(self.num_envs, device=self.device, dtype=torch.bool)
-                self._reset_term_last_triggered_once.append(no_trigger)
+                reset_term_min_step_count.append(term_cfg.min_step_count_between_reset)
+
+        # -- interval mode
+        # store the ranges and the time left for each term and environment
+        self._interval_term_ranges = torch.tensor(interval_term_ranges, device=self.device, dtype=torch.float).reshape(
+            -1, 2
+        )
+        self._interval_term_is_global_time = torch.tensor(
+            interval_term_is_global_time, device=self.device, dtype=torch.bool
+        )
+        self._interval_term_time_left = self._sample_interval_time_left(self.num_envs)
+        # -- reset mode
+        self._reset_term_min_step_count = torch.tensor(reset_term_min_step_count, device=self.device, dtype=torch.int32)
+        self._reset_term_has_min_step_count = any(count > 0 for count in reset_term_min_step_count)
+        # initialize the current step count for each term and environment to zero
+        num_reset_terms = len(reset_term_min_step_count)
+        self._reset_term_last_triggered_step_id = torch.zeros(
+            num_reset_terms, self.num_envs, device=self.device, dtype=torch.int32
+        )
+        # initialize the trigger flag for each term and environment to zero
+        self._reset_term_last_triggered_once = torch.zeros(
+            num_reset_terms, self.num_envs, device=self.device, dtype=torch.bool
+        )
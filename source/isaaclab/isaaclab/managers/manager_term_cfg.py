@@ -230,6 +230,21 @@ class ObservationGroupCfg:
     ObservationGroupCfg.history_length is set.
     """
 
+    fuse_terms: bool = False
+    """Whether to compute the observation terms of the group into a preallocated output buffer. Defaults to False.
+
+    If True, the observation manager allocates a single output tensor for the group and assigns each term a fixed
+    slice of it. The terms are written directly into their slices and the clipping and scaling of all the terms
+    are applied together in one vectorized pass. This removes the per-term clone and the concatenation performed
+    on every call. The computed values are identical to those of the default path.
+
+    The returned tensor is the same buffer on every call and is overwritten the next time the group is computed.
+    Please clone it if the values need to be kept across calls.
+
+    This option requires :attr:`concatenate_terms` to be True and all the terms (after flattening of the
+    history dimension) to be one-dimensional.
+    """
+
 
 ##
 # Event manager
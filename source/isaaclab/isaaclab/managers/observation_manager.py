@@ -60,6 +60,10 @@ class ObservationManager(ManagerBase):
     If a noise model or custom modifier is registered for a term, the function is called to corrupt
     the observation. The corruption function is expected to return a tensor with the same shape as the observation.
     The observations are clipped and scaled as per the configuration settings.
+
+    For concatenated groups, the terms can optionally be computed into a preallocated output buffer by setting
+    the :attr:`ObservationGroupCfg.fuse_terms` attribute. In this case, the clipping and scaling of all the terms
+    in the group are applied together in a single vectorized pass.
     """
 
     def __init__(self, cfg: object, env: ManagerBasedEnv):
@@ -100,6 +104,9 @@ class ObservationManager(ManagerBase):
             else:
                 self._group_obs_dim[group_name] = group_term_dims
 
+        # prepare the preallocated output buffers for groups with fused terms
+        self._prepare_fused_group_buffers()
+
         # Stores the latest observations.
         self._obs_buffer: dict[str, torch.Tensor | dict[str, torch.Tensor]] | None = None
 
@@ -295,6 +302,9 @@ class ObservationManager(ManagerBase):
                 f"Unable to find the group '{group_name}' in the observation manager."
                 f" Available groups are: {list(self._group_obs_term_names.keys())}"
             )
+        # use the preallocated buffer if the terms in the group are fused
+        if group_name in self._group_obs_fused_buffer:
+            return self._compute_fused_group(group_name)
         # iterate over all the terms in each group
         group_term_names = self._group_obs_term_names[group_name]
         # buffer to store obs per group
@@ -304,18 +314,8 @@ class ObservationManager(ManagerBase):
 
         # evaluate terms: compute, add noise, clip, scale, custom modifiers
         for term_name, term_cfg in obs_terms:
-            # compute term's value
-            obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params).clone()
-            # apply post-processing
-            if term_cfg.modifiers is not None:
-                for modifier in term_cfg.modifiers:
-                    obs = modifier.func(obs, **modifier.params)
-            if term_cfg.noise:
-                obs = term_cfg.noise.func(obs, term_cfg.noise)
-            if term_cfg.clip:
-                obs = obs.clip_(min=term_cfg.clip[0], max=term_cfg.clip[1])
-            if term_cfg.scale is not None:
-                obs = obs.mul_(term_cfg.scale)
+            # compute term's value and apply post-processing
+            obs = self._compute_term(term_cfg)
             # Update the history buffer if observation term has history enabled
             if term_cfg.history_length > 0:
                 self._group_obs_term_history_buffer[group_name][term_name].append(obs)
@@ -338,6 +338,144 @@ class ObservationManager(ManagerBase):
     Helper functions.
     """
 
+    def _compute_term(self, term_cfg: ObservationTermCfg) -> torch.Tensor:
+        """Computes the value of an observation term and applies its post-processing.
+
+        Args:
+            term_cfg: The configuration of the observation term.
+
+        Returns:
+            The processed observation of the term. Shape is (num_envs, ...).
+        """
+        # compute term's value
+        obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params).clone()
+        # apply post-processing
+        if term_cfg.modifiers is not None:
+            for modifier in term_cfg.modifiers:
+                obs = modifier.func(obs, **modifier.params)
+        if term_cfg.noise:
+            obs = term_cfg.noise.func(obs, term_cfg.noise)
+        if term_cfg.clip:
+            obs = obs.clip_(min=term_cfg.clip[0], max=term_cfg.clip[1])
+        if term_cfg.scale is not None:
+            obs = obs.mul_(term_cfg.scale)
+        return obs
+
+    def _compute_fused_group(self, group_name: str) -> torch.Tensor:
+        """Computes the observations for a group with fused terms.
+
+        Each term is written into its slice of the preallocated output buffer of the group. Modifiers and
+        noise are applied per term (in the same order as in :meth:`compute_group`) to keep the random number
+        streams unchanged. Clipping and scaling are applied afterwards to the whole buffer in one pass using
+        per-column bounds and scales. Terms with history are fully processed before they are appended to their
+        history buffer, so their columns are excluded from the batched operations.
+
+        Args:
+            group_name: The name of the group for which to compute the observations.
+
+        Returns:
+            The preallocated output buffer of the group. Shape is (num_envs, group_obs_dim).
+        """
+        group_obs = self._group_obs_fused_buffer[group_name]
+        # read attributes for each term
+        obs_terms = zip(
+            self._group_obs_term_names[group_name],
+            self._group_obs_term_cfgs[group_name],
+            self._group_obs_fused_term_slices[group_name],
+        )
+        # evaluate terms: compute into slice, custom modifiers, add noise
+        for term_name, term_cfg, term_slice in obs_terms:
+            term_obs = group_obs[:, term_slice]
+            # terms with history need the final values before they are stored in the history buffer
+            if term_cfg.history_length > 0:
+                history_buffer = self._group_obs_term_history_buffer[group_name][term_name]
+                history_buffer.append(self._compute_term(term_cfg))
+                term_obs.copy_(history_buffer.buffer.reshape(self._env.num_envs, -1))
+                continue
+            # compute term's value directly into the output buffer
+            term_obs.copy_(term_cfg.func(self._env, **term_cfg.params))
+            # apply post-processing
+            obs = term_obs
+            if term_cfg.modifiers is not None:
+                for modifier in term_cfg.modifiers:
+                    obs = modifier.func(obs, **modifier.params)
+            if term_cfg.noise:
+                obs = term_cfg.noise.func(obs, term_cfg.noise)
+            # write back the result if the post-processing was not performed in-place
+            if obs is not term_obs:
+                term_obs.copy_(obs)
+
+        # apply clipping and scaling for all the terms at once
+        clip_bounds = self._group_obs_fused_clip[group_name]
+        if clip_bounds is not None:
+            group_obs.clamp_(min=clip_bounds[0], max=clip_bounds[1])
+        scale = self._group_obs_fused_scale[group_name]
+        if scale is not None:
+            group_obs.mul_(scale)
+
+        return group_obs
+
+    def _prepare_fused_group_buffers(self):
+        """Prepares the preallocated output buffers for the observation groups with fused terms.
+
+        Raises:
+            ValueError: If a group with fused terms is not concatenated or contains terms that are not
+                one-dimensional.
+        """
+        # create buffers to store information for each fused observation group
+        self._group_obs_fused_buffer: dict[str, torch.Tensor] = dict()
+        self._group_obs_fused_term_slices: dict[str, list[slice]] = dict()
+        self._group_obs_fused_clip: dict[str, tuple[torch.Tensor, torch.Tensor] | None] = dict()
+        self._group_obs_fused_scale: dict[str, torch.Tensor | None] = dict()
+
+        for group_name, fuse_terms in self._group_obs_fuse_terms.items():
+            if not fuse_terms:
+                continue
+            # check that the group can be fused
+            if not self._group_obs_concatenate[group_name]:
+                raise ValueError(
+                    f"Unable to fuse observation terms in group '{group_name}' as the terms are not concatenated."
+                    " Please set 'concatenate_terms' to True or 'fuse_terms' to False in the group configuration."
+                )
+            group_term_dims = self._group_obs_term_dim[group_name]
+            if any(len(dims) != 1 for dims in group_term_dims):
+                raise ValueError(
+                    f"Unable to fuse observation terms in group '{group_name}'."
+                    f" The shapes of the terms are: {group_term_dims}."
+                    " All the terms must be one-dimensional (with flattened history) to be fused."
+                )
+            # allocate the output buffer
+            group_dim = self._group_obs_dim[group_name][0]
+            group_obs = torch.zeros(
+                (self._env.num_envs, group_dim), dtype=self._group_obs_fused_dtype[group_name], device=self._env.device
+            )
+            self._group_obs_fused_buffer[group_name] = group_obs
+            # compute the slice of each term and the per-column clipping bounds and scales
+            term_slices = list()
+            clip_min = torch.full((group_dim,), -float("inf"), dtype=group_obs.dtype, device=self._env.device)
+            clip_max = torch.full((group_dim,), float("inf"), dtype=group_obs.dtype, device=self._env.device)
+            scale = torch.ones(group_dim, device=self._env.device)
+            has_clip, has_scale = False, False
+            idx = 0
+            for term_cfg, dims in zip(self._group_obs_term_cfgs[group_name], group_term_dims):
+                term_slice = slice(idx, idx + dims[0])
+                term_slices.append(term_slice)
+                idx += dims[0]
+                # terms with history are clipped and scaled before they are stored in the history buffer
+                if term_cfg.history_length > 0:
+                    continue
+                if term_cfg.clip:
+                    clip_min[term_slice] = term_cfg.clip[0]
+                    clip_max[term_slice] = term_cfg.clip[1]
+                    has_clip = True
+                if term_cfg.scale is not None:
+                    scale[term_slice] = term_cfg.scale
+                    has_scale = True
+            # store the information for the group
+            self._group_obs_fused_term_slices[group_name] = term_slices
+            self._group_obs_fused_clip[group_name] = (clip_min, clip_max) if has_clip else None
+            self._group_obs_fused_scale[group_name] = scale if has_scale else None
+
     def _prepare_terms(self):
         """Prepares a list of observation terms functions."""
         # create buffers to store information for each observation group
@@ -347,6 +485,8 @@ class ObservationManager(ManagerBase):
         self._group_obs_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
         self._group_obs_class_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
         self._group_obs_concatenate: dict[str, bool] = dict()
+        self._group_obs_fuse_terms: dict[str, bool] = dict()
+        self._group_obs_fused_dtype: dict[str, torch.dtype] = dict()
         self._group_obs_term_history_buffer: dict[str, dict] = dict()
         # create a list to store modifiers that are classes
         # we store it as a separate list to only call reset on them and prevent unnecessary calls
@@ -376,6 +516,7 @@ class ObservationManager(ManagerBase):
             group_entry_history_buffer: dict[str, CircularBuffer] = dict()
             # read common config for the group
             self._group_obs_concatenate[group_name] = group_cfg.concatenate_terms
+            self._group_obs_fuse_terms[group_name] = group_cfg.fuse_terms
             # check if config is dict already
             if isinstance(group_cfg, dict):
                 group_cfg_items = group_cfg.items()
@@ -384,7 +525,13 @@ class ObservationManager(ManagerBase):
             # iterate over all the terms in each group
             for term_name, term_cfg in group_cfg_items:
                 # skip non-obs settings
-                if term_name in ["enable_corruption", "concatenate_terms", "history_length", "flatten_history_dim"]:
+                if term_name in [
+                    "enable_corruption",
+                    "concatenate_terms",
+                    "fuse_terms",
+                    "history_length",
+                    "flatten_history_dim",
+                ]:
                     continue
                 # check for non config
                 if term_cfg is None:
@@ -407,8 +554,15 @@ class ObservationManager(ManagerBase):
                 # add term config to list to list
                 self._group_obs_term_names[group_name].append(term_name)
                 self._group_obs_term_cfgs[group_name].append(term_cfg)
-                # call function the first time to fill up dimensions
-                obs_dims = tuple(term_cfg.func(self._env, **term_cfg.params).shape)
+                # call function the first time to fill up dimensions and data type
+                obs = term_cfg.func(self._env, **term_cfg.params)
+                obs_dims = tuple(obs.shape)
+                # the output buffer of fused groups follows the type promotion of concatenation
+                if group_name in self._group_obs_fused_dtype:
+                    obs_dtype = torch.promote_types(self._group_obs_fused_dtype[group_name], obs.dtype)
+                    self._group_obs_fused_dtype[group_name] = obs_dtype
+                else:
+                    self._group_obs_fused_dtype[group_name] = obs.dtype
                 # create history buffers and calculate history term dimensions
                 if term_cfg.history_length > 0:
                     group_entry_history_buffer[term_name] = CircularBuffer(
@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import enum
+import numpy as np
 import os
 import torch
 from collections.abc import Sequence
@@ -15,7 +16,7 @@ from prettytable import PrettyTable
 from typing import TYPE_CHECKING
 
 from isaaclab.utils import configclass
-from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+from isaaclab.utils.datasets import AsyncDatasetFileHandler, DatasetFileHandlerBase, EpisodeData, HDF5DatasetFileHandler
 
 from .manager_base import ManagerBase, ManagerTermBase
 from .manager_term_cfg import RecorderTermCfg
@@ -51,6 +52,31 @@ class RecorderManagerBaseCfg:
     export_in_record_pre_reset: bool = True
     """Whether to export episodes in the record_pre_reset call."""
 
+    export_async: bool = False
+    """Whether to write the exported episodes to the dataset files in a background thread. Defaults to False.
+
+    If True, the dataset file handlers are wrapped with :class:`~isaaclab.utils.datasets.AsyncDatasetFileHandler`.
+    The exported episodes are then copied into host memory and written by a dedicated thread, so that the
+    simulation does not wait for the data to be written to disk.
+    """
+
+    export_queue_size: int = 8
+    """The maximum number of exported episodes waiting to be written when :attr:`export_async` is True.
+    Defaults to 8.
+
+    If the queue is full, the export waits until the writer thread has taken an episode from the queue.
+    """
+
+    episode_chunk_length: int = 32
+    """The number of time steps buffered for all the environments before they are added to the episodes.
+    Defaults to 32.
+
+    The recorded values of all the environments are written into a shared buffer with a single operation
+    per key. The buffered time steps of an environment are appended to its episode once the buffer is full,
+    or when the episode is accessed or exported. Larger values reduce the number of per-environment copies
+    at the cost of memory, which is proportional to the number of environments times this value.
+    """
+
 
 class RecorderTerm(ManagerTermBase):
     """Base class for recorder terms.
@@ -155,19 +181,23 @@ class RecorderManager(ManagerBase):
         self._episodes: dict[int, EpisodeData] = dict()
         for env_id in range(env.num_envs):
             self._episodes[env_id] = EpisodeData()
+        # create buffers for the latest time steps of all environments indexed by the key
+        # note: these are initialized on the first call to :meth:`add_to_episodes` for each key
+        self._step_buffers: dict[str, torch.Tensor] = dict()
+        self._step_buffer_lengths: dict[str, np.ndarray] = dict()
 
         env_name = getattr(env.cfg, "env_name", None)
 
         self._dataset_file_handler = None
         if cfg.dataset_export_mode != DatasetExportMode.EXPORT_NONE:
-            self._dataset_file_handler = cfg.dataset_file_handler_class_type()
+            self._dataset_file_handler = self._create_dataset_file_handler()
             self._dataset_file_handler.create(
                 os.path.join(cfg.dataset_export_dir_path, cfg.dataset_filename), env_name=env_name
             )
 
         self._failed_episode_dataset_file_handler = None
         if cfg.dataset_export_mode == DatasetExportMode.EXPORT_SUCCEEDED_FAILED_IN_SEPARATE_FILES:
-            self._failed_episode_dataset_file_handler = cfg.dataset_file_handler_class_type()
+            self._failed_episode_dataset_file_handler = self._create_dataset_file_handler()
             self._failed_episode_dataset_file_handler.create(
                 os.path.join(cfg.dataset_export_dir_path, f"{cfg.dataset_filename}_failed"), env_name=env_name
             )
@@ -270,6 +300,9 @@ class RecorderManager(ManagerBase):
 
         for env_id in env_ids:
             self._episodes[env_id] = EpisodeData()
+        # discard the buffered time steps
+        for lengths in self._step_buffer_lengths.values():
+            lengths[env_ids] = 0
 
         # nothing to log here
         return {}
@@ -283,6 +316,8 @@ class RecorderManager(ManagerBase):
         Returns:
             The episode data for the given environment id.
         """
+        if env_id in self._episodes:
+            self._flush_step_buffers([env_id])
         return self._episodes.get(env_id, EpisodeData())
 
     def add_to_episodes(self, key: str, value: torch.Tensor | dict, env_ids: Sequence[int] | None = None):
@@ -313,11 +348,23 @@ class RecorderManager(ManagerBase):
                 self.add_to_episodes(f"{key}/{sub_key}", sub_value, env_ids)
             return
 
-        for value_index, env_id in enumerate(env_ids):
-            if env_id not in self._episodes:
-                self._episodes[env_id] = EpisodeData()
-                self._episodes[env_id].env_id = env_id
-            self._episodes[env_id].add(key, value[value_index])
+        # create the buffer for the key at the first call
+        if key not in self._step_buffers:
+            self._step_buffers[key] = torch.empty(
+                (self._env.num_envs, self.cfg.episode_chunk_length, *value.shape[1:]),
+                dtype=value.dtype,
+                device=value.device,
+            )
+            self._step_buffer_lengths[key] = np.zeros(self._env.num_envs, dtype=np.int64)
+        lengths = self._step_buffer_lengths[key]
+        env_ids = np.asarray(env_ids, dtype=np.int64)
+        # move the time steps of the environments with full buffers to their episodes
+        is_full = lengths[env_ids] == self.cfg.episode_chunk_length
+        if np.any(is_full):
+            self._flush_step_buffers(env_ids[is_full], keys=[key])
+        # write the values of all the environments at once
+        self._step_buffers[key][torch.from_numpy(env_ids), torch.from_numpy(lengths[env_ids])] = value
+        lengths[env_ids] += 1
 
     def set_success_to_episodes(self, env_ids: Sequence[int] | None, success_values: torch.Tensor):
         """Sets the task success values to the episodes for the given environment ids.
@@ -418,6 +465,9 @@ class RecorderManager(ManagerBase):
         if isinstance(env_ids, torch.Tensor):
             env_ids = env_ids.tolist()
 
+        # move the buffered time steps to the episodes
+        self._flush_step_buffers(env_ids)
+
         # Export episode data through dataset exporter
         need_to_flush = False
         for env_id in env_ids:
@@ -446,7 +496,9 @@ class RecorderManager(ManagerBase):
             # Reset the episode buffer for the given environment after export
             self._episodes[env_id] = EpisodeData()
 
-        if need_to_flush:
+        # note: asynchronous file handlers flush the file in their writer thread once all the queued episodes
+        #   are written, and raise the errors of the writer thread at the next export
+        if need_to_flush and not self.cfg.export_async:
             if self._dataset_file_handler is not None:
                 self._dataset_file_handler.flush()
             if self._failed_episode_dataset_file_handler is not None:
@@ -456,6 +508,29 @@ class RecorderManager(ManagerBase):
     Helper functions.
     """
 
+    def _create_dataset_file_handler(self) -> DatasetFileHandlerBase:
+        """Creates a dataset file handler of the configured type."""
+        dataset_file_handler = self.cfg.dataset_file_handler_class_type()
+        if self.cfg.export_async:
+            dataset_file_handler = AsyncDatasetFileHandler(dataset_file_handler, self.cfg.export_queue_size)
+        return dataset_file_handler
+
+    def _flush_step_buffers(self, env_ids: Sequence[int], keys: Sequence[str] | None = None):
+        """Appends the buffered time steps of the given environments to their episodes.
+
+        Args:
+            env_ids: The environment ids.
+            keys: The keys to flush. Defaults to None, in which case all the keys are considered.
+        """
+        if keys is None:
+            keys = self._step_buffers.keys()
+        for key in keys:
+            lengths = self._step_buffer_lengths[key]
+            for env_id in env_ids:
+                if lengths[env_id] > 0:
+                    self._episodes[env_id].extend(key, self._step_buffers[key][env_id, : lengths[env_id]])
+                    lengths[env_id] = 0
+
     def _prepare_terms(self):
         """Prepares a list of recorder terms."""
         # check if config is dict already
@@ -471,6 +546,9 @@ class RecorderManager(ManagerBase):
                 "dataset_export_dir_path",
                 "dataset_export_mode",
                 "export_in_record_pre_reset",
+                "export_async",
+                "export_queue_size",
+                "episode_chunk_length",
             ]:
                 continue
             # check if term config is None
@@ -35,6 +35,9 @@ class RewardManager(ManagerBase):
         of the environment. This is done to ensure that the computed reward terms are balanced with
         respect to the chosen time-step interval in the environment.
 
+    Internally, the values of all the terms are written into a single buffer of shape (num_envs, num_terms)
+    and weighted with a vector of the term weights. The net reward and the episodic sums of all the terms
+    are then updated with a constant number of operations, independent of the number of terms.
     """
 
     _env: ManagerBasedRLEnv
@@ -55,14 +58,15 @@ class RewardManager(ManagerBase):
         # call the base class constructor (this will parse the terms config)
         super().__init__(cfg, env)
         # prepare extra info to store individual reward term information
-        self._episode_sums = dict()
-        for term_name in self._term_names:
-            self._episode_sums[term_name] = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
+        self._episode_sums = torch.zeros((self.num_envs, len(self._term_names)), dtype=torch.float, device=self.device)
         # create buffer for managing reward per environment
         self._reward_buf = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
 
         # Buffer which stores the current step reward for each term for each environment
         self._step_reward = torch.zeros((self.num_envs, len(self._term_names)), dtype=torch.float, device=self.device)
+        # Buffer which stores the weights of the terms
+        self._term_weights = torch.zeros(len(self._term_names), dtype=torch.float, device=self.device)
+        self._update_term_weights()
 
     def __str__(self) -> str:
         """Returns: A string representation for reward manager."""
@@ -110,15 +114,15 @@ class RewardManager(ManagerBase):
         # resolve environment ids
         if env_ids is None:
             env_ids = slice(None)
+        # compute the average episodic sum of all the terms at once
+        # r_1 + r_2 + ... + r_n
+        episodic_sum_avg = torch.mean(self._episode_sums[env_ids], dim=0) / self._env.max_episode_length_s
         # store information
         extras = {}
-        for key in self._episode_sums.keys():
-            # store information
-            # r_1 + r_2 + ... + r_n
-            episodic_sum_avg = torch.mean(self._episode_sums[key][env_ids])
-            extras["Episode_Reward/" + key] = episodic_sum_avg / self._env.max_episode_length_s
-            # reset episodic sum
-            self._episode_sums[key][env_ids] = 0.0
+        for index, name in enumerate(self._term_names):
+            extras["Episode_Reward/" + name] = episodic_sum_avg[index]
+        # reset episodic sum
+        self._episode_sums[env_ids] = 0.0
         # reset all the reward terms
         for term_cfg in self._class_term_cfgs:
             term_cfg.func.reset(env_ids=env_ids)
@@ -137,22 +141,21 @@ class RewardManager(ManagerBase):
         Returns:
             The net reward signal of shape (num_envs,).
         """
-        # reset computation
-        self._reward_buf[:] = 0.0
-        # iterate over all the reward terms
-        for name, term_cfg in zip(self._term_names, self._term_cfgs):
-            # skip if weight is zero (kind of a micro-optimization)
-            if term_cfg.weight == 0.0:
-                continue
+        # update the weights if the term configurations were modified
+        if self._term_weights_list != [term_cfg.weight for term_cfg in self._term_cfgs]:
+            self._update_term_weights()
+        # iterate over all the reward terms with non-zero weight
+        for index in self._active_term_indices:
+            term_cfg = self._term_cfgs[index]
             # compute term's value
-            value = term_cfg.func(self._env, **term_cfg.params) * term_cfg.weight * dt
-            # update total reward
-            self._reward_buf += value
-            # update episodic sum
-            self._episode_sums[name] += value
-
-            # Update current reward for this step.
-            self._step_reward[:, self._term_names.index(name)] = value / dt
+            self._step_reward[:, index] = term_cfg.func(self._env, **term_cfg.params)
+        # apply the weights to obtain the current reward for this step
+        self._step_reward.mul_(self._term_weights)
+        # compute total reward
+        torch.sum(self._step_reward, dim=1, out=self._reward_buf)
+        self._reward_buf.mul_(dt)
+        # update episodic sum
+        self._episode_sums.add_(self._step_reward, alpha=dt)
 
         return self._reward_buf
 
@@ -174,6 +177,8 @@ class RewardManager(ManagerBase):
             raise ValueError(f"Reward term '{term_name}' not found.")
         # set the configuration
         self._term_cfgs[self._term_names.index(term_name)] = cfg
+        # update the weights of the terms
+        self._update_term_weights()
 
     def get_term_cfg(self, term_name: str) -> RewardTermCfg:
         """Gets the configuration for the specified term.
@@ -204,14 +209,25 @@ class RewardManager(ManagerBase):
             The active terms.
         """
         terms = []
+        step_reward = self._step_reward[env_idx].cpu().tolist()
         for idx, name in enumerate(self._term_names):
-            terms.append((name, [self._step_reward[env_idx, idx].cpu().item()]))
+            terms.append((name, [step_reward[idx]]))
         return terms
 
     """
     Helper functions.
     """
 
+    def _update_term_weights(self):
+        """Updates the weight vector and the indices of the terms with non-zero weight from the term configurations."""
+        self._term_weights_list = [term_cfg.weight for term_cfg in self._term_cfgs]
+        self._term_weights[:] = torch.tensor(self._term_weights_list, dtype=torch.float, device=self.device)
+        # skip terms with zero weight (kind of a micro-optimization)
+        self._active_term_indices = [idx for idx, weight in enumerate(self._term_weights_list) if weight != 0.0]
+        # clear the values of the skipped terms
+        zero_term_indices = [idx for idx, weight in enumerate(self._term_weights_list) if weight == 0.0]
+        self._step_reward[:, zero_term_indices] = 0.0
+
     def _prepare_terms(self):
         # check if config is dict already
         if isinstance(self.cfg, dict):
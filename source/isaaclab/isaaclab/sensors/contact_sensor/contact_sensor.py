@@ -74,6 +74,10 @@ class ContactSensor(SensorBase):
         self._data: ContactSensorData = ContactSensorData()
         # initialize self._body_physx_view for running in extension mode
         self._body_physx_view = None
+        # flag for whether the ordered history of net forces needs to be gathered from its ring buffer
+        self._is_history_outdated = False
+        # first-contact and first-air states computed since the last update, keyed by (dt, abs_tol)
+        self._first_transitions: dict[tuple[float, float], torch.Tensor] = dict()
 
     def __str__(self) -> str:
         """Returns: A string containing information about the instance."""
@@ -97,6 +101,9 @@ class ContactSensor(SensorBase):
     def data(self) -> ContactSensorData:
         # update sensors if needed
         self._update_outdated_buffers()
+        # order the history of net forces from its ring buffer if needed
+        if self._is_history_outdated:
+            self._update_net_forces_w_history()
         # return the data
         return self._data
 
@@ -141,18 +148,16 @@ class ContactSensor(SensorBase):
             env_ids = slice(None)
         # reset accumulative data buffers
         self._data.net_forces_w[env_ids] = 0.0
-        self._data.net_forces_w_history[env_ids] = 0.0
         if self.cfg.history_length > 0:
-            self._data.net_forces_w_history[env_ids] = 0.0
+            self._net_forces_w_ring[env_ids] = 0.0
+            self._is_history_outdated = True
         # reset force matrix
         if len(self.cfg.filter_prim_paths_expr) != 0:
             self._data.force_matrix_w[env_ids] = 0.0
-        # reset the current air time
+        # reset the air and contact times
         if self.cfg.track_air_time:
-            self._data.current_air_time[env_ids] = 0.0
-            self._data.last_air_time[env_ids] = 0.0
-            self._data.current_contact_time[env_ids] = 0.0
-            self._data.last_contact_time[env_ids] = 0.0
+            self._air_contact_time[:, env_ids] = 0.0
+            self._first_transitions.clear()
 
     def find_bodies(self, name_keys: str | Sequence[str], preserve_order: bool = False) -> tuple[list[int], list[str]]:
         """Find bodies in the articulation based on the name keys.
@@ -173,6 +178,10 @@ class ContactSensor(SensorBase):
         by comparing the current contact time with the given time period. If the contact time is less
         than the given time period, then the bodies are considered to be in contact.
 
+        The first-contact and first-air states are computed together and cached until the next update of
+        the sensor. Hence, the reward terms calling this function or :meth:`compute_first_air` with the same
+        arguments within a step share the same result.
+
         Note:
             The function assumes that :attr:`dt` is a factor of the sensor update time-step. In other
             words :math:`dt / dt_sensor = n`, where :math:`n` is a natural number. This is always true
@@ -186,21 +195,13 @@ class ContactSensor(SensorBase):
         Returns:
             A boolean tensor indicating the bodies that have established contact within the last
             :attr:`dt` seconds. Shape is (N, B), where N is the number of sensors and B is the
-            number of bodies in each sensor.
+            number of bodies in each sensor. The tensor is shared between the callers and must not
+            be modified in-place.
 
         Raises:
             RuntimeError: If the sensor is not configured to track contact time.
         """
-        # check if the sensor is configured to track contact time
-        if not self.cfg.track_air_time:
-            raise RuntimeError(
-                "The contact sensor is not configured to track contact time."
-                "Please enable the 'track_air_time' in the sensor configuration."
-            )
-        # check if the bodies are in contact
-        currently_in_contact = self.data.current_contact_time > 0.0
-        less_than_dt_in_contact = self.data.current_contact_time < (dt + abs_tol)
-        return currently_in_contact * less_than_dt_in_contact
+        return self._compute_first_transitions(dt, abs_tol)[1]
 
     def compute_first_air(self, dt: float, abs_tol: float = 1.0e-8) -> torch.Tensor:
         """Checks if bodies that have broken contact within the last :attr:`dt` seconds.
@@ -209,6 +210,10 @@ class ContactSensor(SensorBase):
         by comparing the current air time with the given time period. If the air time is less
         than the given time period, then the bodies are considered to not be in contact.
 
+        The first-contact and first-air states are computed together and cached until the next update of
+        the sensor. Hence, the reward terms calling this function or :meth:`compute_first_contact` with the
+        same arguments within a step share the same result.
+
         Note:
             It assumes that :attr:`dt` is a factor of the sensor update time-step. In other words,
             :math:`dt / dt_sensor = n`, where :math:`n` is a natural number. This is always true if
@@ -222,20 +227,12 @@ class ContactSensor(SensorBase):
         Returns:
             A boolean tensor indicating the bodies that have broken contact within the last :attr:`dt` seconds.
             Shape is (N, B), where N is the number of sensors and B is the number of bodies in each sensor.
+            The tensor is shared between the callers and must not be modified in-place.
 
         Raises:
             RuntimeError: If the sensor is not configured to track contact time.
         """
-        # check if the sensor is configured to track contact time
-        if not self.cfg.track_air_time:
-            raise RuntimeError(
-                "The contact sensor is not configured to track contact time."
-                "Please enable the 'track_air_time' in the sensor configuration."
-            )
-        # check if the sensor is configured to track contact time
-        currently_detached = self.data.current_air_time > 0.0
-        less_than_dt_detached = self.data.current_air_time < (dt + abs_tol)
-        return currently_detached * less_than_dt_detached
+        return self._compute_first_transitions(dt, abs_tol)[0]
 
     """
     Implementation.
@@ -292,6 +289,12 @@ class ContactSensor(SensorBase):
             self._data.net_forces_w_history = torch.zeros(
                 self._num_envs, self.cfg.history_length, self._num_bodies, 3, device=self._device
             )
+            # note: the history is written into a ring buffer, in which the most recent entry of each sensor
+            #   is at its head. The ordered history is only gathered from it when the data is read.
+            self._net_forces_w_ring = torch.zeros_like(self._data.net_forces_w_history)
+            self._history_head = torch.zeros(self._num_envs, dtype=torch.long, device=self._device)
+            self._history_offsets = torch.arange(self.cfg.history_length, device=self._device)
+            self._ALL_ENV_INDICES = torch.arange(self._num_envs, dtype=torch.long, device=self._device)
         else:
             self._data.net_forces_w_history = self._data.net_forces_w.unsqueeze(1)
         # -- pose of sensor origins
@@ -300,10 +303,13 @@ class ContactSensor(SensorBase):
             self._data.quat_w = torch.zeros(self._num_envs, self._num_bodies, 4, device=self._device)
         # -- air/contact time between contacts
         if self.cfg.track_air_time:
-            self._data.last_air_time = torch.zeros(self._num_envs, self._num_bodies, device=self._device)
-            self._data.current_air_time = torch.zeros(self._num_envs, self._num_bodies, device=self._device)
-            self._data.last_contact_time = torch.zeros(self._num_envs, self._num_bodies, device=self._device)
-            self._data.current_contact_time = torch.zeros(self._num_envs, self._num_bodies, device=self._device)
+            # note: the times are stacked as (current air, current contact, last air, last contact) to update
+            #   them together. The data buffers are views into the stacked buffer.
+            self._air_contact_time = torch.zeros(4, self._num_envs, self._num_bodies, device=self._device)
+            self._data.current_air_time = self._air_contact_time[0]
+            self._data.current_contact_time = self._air_contact_time[1]
+            self._data.last_air_time = self._air_contact_time[2]
+            self._data.last_contact_time = self._air_contact_time[3]
         # force matrix: (num_envs, num_bodies, num_filter_shapes, 3)
         if len(self.cfg.filter_prim_paths_expr) != 0:
             num_filters = self.contact_physx_view.filter_count
@@ -324,8 +330,11 @@ class ContactSensor(SensorBase):
         self._data.net_forces_w[env_ids, :, :] = net_forces_w.view(-1, self._num_bodies, 3)[env_ids]
         # update contact force history
         if self.cfg.history_length > 0:
-            self._data.net_forces_w_history[env_ids, 1:] = self._data.net_forces_w_history[env_ids, :-1].clone()
-            self._data.net_forces_w_history[env_ids, 0] = self._data.net_forces_w[env_ids]
+            # advance the head of the ring buffer and overwrite the oldest entry
+            env_indices = self._ALL_ENV_INDICES[env_ids]
+            self._history_head[env_ids] = (self._history_head[env_ids] + 1) % self.cfg.history_length
+            self._net_forces_w_ring[env_indices, self._history_head[env_ids]] = self._data.net_forces_w[env_ids]
+            self._is_history_outdated = True
 
         # obtain the contact force matrix
         if len(self.cfg.filter_prim_paths_expr) != 0:
@@ -349,28 +358,57 @@ class ContactSensor(SensorBase):
             elapsed_time = self._timestamp[env_ids] - self._timestamp_last_update[env_ids]
             # -- check contact state of bodies
             is_contact = torch.norm(self._data.net_forces_w[env_ids, :, :], dim=-1) > self.cfg.force_threshold
-            is_first_contact = (self._data.current_air_time[env_ids] > 0) * is_contact
-            is_first_detached = (self._data.current_contact_time[env_ids] > 0) * ~is_contact
-            # -- update the last contact time if body has just become in contact
-            self._data.last_air_time[env_ids] = torch.where(
-                is_first_contact,
-                self._data.current_air_time[env_ids] + elapsed_time.unsqueeze(-1),
-                self._data.last_air_time[env_ids],
-            )
-            # -- increment time for bodies that are not in contact
-            self._data.current_air_time[env_ids] = torch.where(
-                ~is_contact, self._data.current_air_time[env_ids] + elapsed_time.unsqueeze(-1), 0.0
-            )
-            # -- update the last contact time if body has just detached
-            self._data.last_contact_time[env_ids] = torch.where(
-                is_first_detached,
-                self._data.current_contact_time[env_ids] + elapsed_time.unsqueeze(-1),
-                self._data.last_contact_time[env_ids],
-            )
-            # -- increment time for bodies that are in contact
-            self._data.current_contact_time[env_ids] = torch.where(
-                is_contact, self._data.current_contact_time[env_ids] + elapsed_time.unsqueeze(-1), 0.0
+            # -- whether the air and the contact timers keep running
+            is_running = torch.stack([~is_contact, is_contact])
+            # -- increment the current air and contact times
+            current_time = self._air_contact_time[:2, env_ids]
+            incremented_time = current_time + elapsed_time.unsqueeze(-1)
+            # -- update the last air (contact) time if the body has just become in contact (detached)
+            is_first_transition = (current_time > 0) * ~is_running
+            last_time = torch.where(is_first_transition, incremented_time, self._air_contact_time[2:, env_ids])
+            # -- reset the current time of the timers that are stopped
+            current_time = torch.where(is_running, incremented_time, 0.0)
+            self._air_contact_time[:, env_ids] = torch.cat([current_time, last_time])
+            # -- invalidate the first-contact and first-air states
+            self._first_transitions.clear()
+
+    def _compute_first_transitions(self, dt: float, abs_tol: float) -> torch.Tensor:
+        """Computes the first-air and first-contact states of the bodies within the last :attr:`dt` seconds.
+
+        The states are cached until the next update of the sensor.
+
+        Args:
+            dt: The time period since the contact was established or broken.
+            abs_tol: The absolute tolerance for the comparison.
+
+        Returns:
+            A boolean tensor with the first-air and first-contact states stacked. Shape is (2, N, B).
+
+        Raises:
+            RuntimeError: If the sensor is not configured to track contact time.
+        """
+        # check if the sensor is configured to track contact time
+        if not self.cfg.track_air_time:
+            raise RuntimeError(
+                "The contact sensor is not configured to track contact time."
+                "Please enable the 'track_air_time' in the sensor configuration."
             )
+        # update sensors if needed
+        self._update_outdated_buffers()
+        # compute the states if they are not cached
+        key = (dt, abs_tol)
+        if key not in self._first_transitions:
+            current_time = self._air_contact_time[:2]
+            self._first_transitions[key] = (current_time > 0.0) * (current_time < (dt + abs_tol))
+        return self._first_transitions[key]
+
+    def _update_net_forces_w_history(self):
+        """Gathers the history of net forces, ordered from the most recent, from its ring buffer."""
+        # indices of the entries of the ring buffer from the most recent to the oldest
+        ring_indices = (self._history_head.unsqueeze(1) - self._history_offsets) % self.cfg.history_length
+        ring_indices = ring_indices.view(self._num_envs, -1, 1, 1).expand(-1, -1, self._num_bodies, 3)
+        torch.gather(self._net_forces_w_ring, 1, ring_indices, out=self._data.net_forces_w_history)
+        self._is_history_outdated = False
 
     def _set_debug_vis_impl(self, debug_vis: bool):
         # set visibility of markers
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import numpy as np
 import re
 import torch
@@ -21,7 +22,7 @@ import isaaclab.sim as sim_utils
 from isaaclab.markers import VisualizationMarkers
 from isaaclab.terrains.trimesh.utils import make_plane
 from isaaclab.utils.math import convert_quat, quat_apply, quat_apply_yaw
-from isaaclab.utils.warp import convert_to_warp_mesh, raycast_mesh
+from isaaclab.utils.warp import compute_mesh_instance_bounds, convert_to_warp_mesh, raycast_mesh, raycast_mesh_instances
 
 from ..sensor_base import SensorBase
 from .ray_caster_data import RayCasterData
@@ -38,12 +39,14 @@ class RayCaster(SensorBase):
     a set of meshes with a given ray pattern.
 
     The meshes are parsed from the list of primitive paths provided in the configuration. These are then
-    converted to warp meshes and stored in the `warp_meshes` list. The ray-caster then ray-casts against
+    converted to warp meshes and stored in the `meshes` dictionary. The ray-caster then ray-casts against
     these warp meshes using the ray pattern provided in the configuration.
 
-    .. note::
-        Currently, only static meshes are supported. Extending the warp mesh to support dynamic meshes
-        is a work in progress.
+    If there is more than a single static mesh, the meshes are handled as instances of a combined scene.
+    Each instance refers to a warp mesh and a transform from the mesh frame to the world frame. A bounding
+    volume hierarchy (BVH) over the bounding boxes of the instances is used to ray-cast all the rays against
+    all the instances in a single kernel launch. The transforms of the dynamic meshes (see
+    :attr:`RayCasterCfg.dynamic_mesh_prim_paths`) are read at every update and the BVH is refit accordingly.
     """
 
     cfg: RayCasterCfg
@@ -71,6 +74,10 @@ class RayCaster(SensorBase):
         self._data = RayCasterData()
         # the warp meshes used for raycasting.
         self.meshes: dict[str, wp.Mesh] = {}
+        # the BVH over the mesh instances (None if ray-casting against a single static mesh)
+        self._mesh_instance_bvh: wp.Bvh | None = None
+        # the views to track the poses of the dynamic mesh instances and their indices in the instances
+        self._dynamic_mesh_views: list[tuple[XFormPrim | physx.RigidBodyView, slice]] = list()
 
     def __str__(self) -> str:
         """Returns: A string containing information about the instance."""
@@ -149,48 +156,53 @@ class RayCaster(SensorBase):
         self._initialize_rays_impl()
 
     def _initialize_warp_meshes(self):
-        # check number of mesh prims provided
-        if len(self.cfg.mesh_prim_paths) != 1:
-            raise NotImplementedError(
-                f"RayCaster currently only supports one mesh prim. Received: {len(self.cfg.mesh_prim_paths)}"
-            )
+        # check that the dynamic meshes are ray-cast against
+        for mesh_prim_path in self.cfg.dynamic_mesh_prim_paths:
+            if mesh_prim_path not in self.cfg.mesh_prim_paths:
+                raise ValueError(
+                    f"The dynamic mesh prim path '{mesh_prim_path}' is not in the mesh prim paths:"
+                    f" {self.cfg.mesh_prim_paths}."
+                )
+
+        # the warp meshes by hash of their geometry
+        # note: this allows sharing the same warp mesh between instances with the same geometry
+        warp_meshes: dict[str, wp.Mesh] = dict()
+        # the warp mesh and the local bounding box of each mesh instance
+        instance_meshes: list[wp.Mesh] = list()
+        instance_bounds: list[np.ndarray] = list()
+        self._dynamic_mesh_views = list()
 
         # read prims to ray-cast
         for mesh_prim_path in self.cfg.mesh_prim_paths:
-            # check if the prim is a plane - handle PhysX plane as a special case
-            # if a plane exists then we need to create an infinite mesh that is a plane
-            mesh_prim = sim_utils.get_first_matching_child_prim(
-                mesh_prim_path, lambda prim: prim.GetTypeName() == "Plane"
-            )
-            # if we did not find a plane then we need to read the mesh
-            if mesh_prim is None:
-                # obtain the mesh prim
-                mesh_prim = sim_utils.get_first_matching_child_prim(
-                    mesh_prim_path, lambda prim: prim.GetTypeName() == "Mesh"
-                )
-                # check if valid
-                if mesh_prim is None or not mesh_prim.IsValid():
-                    raise RuntimeError(f"Invalid mesh prim path: {mesh_prim_path}")
-                # cast into UsdGeomMesh
-                mesh_prim = UsdGeom.Mesh(mesh_prim)
-                # read the vertices and faces
-                points = np.asarray(mesh_prim.GetPointsAttr().Get())
-                transform_matrix = np.array(omni.usd.get_world_transform_matrix(mesh_prim)).T
-                points = np.matmul(points, transform_matrix[:3, :3].T)
-                points += transform_matrix[:3, 3]
-                indices = np.asarray(mesh_prim.GetFaceVertexIndicesAttr().Get())
-                wp_mesh = convert_to_warp_mesh(points, indices, device=self.device)
-                # print info
-                omni.log.info(
-                    f"Read mesh prim: {mesh_prim.GetPath()} with {len(points)} vertices and {len(indices)} faces."
+            # resolve the prims matching the path
+            is_dynamic = mesh_prim_path in self.cfg.dynamic_mesh_prim_paths
+            if is_dynamic:
+                # note: the instances follow the order of the prims in the view
+                view = self._create_dynamic_mesh_view(mesh_prim_path)
+                prim_paths = view.prim_paths
+                self._dynamic_mesh_views.append(
+                    (view, slice(len(instance_meshes), len(instance_meshes) + len(prim_paths)))
                 )
             else:
-                mesh = make_plane(size=(2e6, 2e6), height=0.0, center_zero=True)
-                wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
-                # print info
-                omni.log.info(f"Created infinite plane mesh prim: {mesh_prim.GetPath()}.")
+                prim_paths = [prim.GetPath().pathString for prim in sim_utils.find_matching_prims(mesh_prim_path)]
+            # check if valid
+            if len(prim_paths) == 0:
+                raise RuntimeError(f"Invalid mesh prim path: {mesh_prim_path}")
+
+            for prim_path in prim_paths:
+                # read the mesh of the prim
+                # note: dynamic meshes are expressed in the frame of the prim, static meshes in the world frame
+                points, indices = self._read_mesh(prim_path, in_prim_frame=is_dynamic)
+                # create the warp mesh if no mesh with the same geometry exists
+                mesh_hash = hashlib.sha1(points.tobytes() + indices.tobytes()).hexdigest()
+                if mesh_hash not in warp_meshes:
+                    warp_meshes[mesh_hash] = convert_to_warp_mesh(points, indices, device=self.device)
+                # add the mesh instance
+                instance_meshes.append(warp_meshes[mesh_hash])
+                instance_bounds.append(np.stack([points.min(axis=0), points.max(axis=0)]))
             # add the warp mesh to the list
-            self.meshes[mesh_prim_path] = wp_mesh
+            # note: for paths matching several prims, the mesh of the first prim is stored
+            self.meshes[mesh_prim_path] = instance_meshes[-len(prim_paths)]
 
         # throw an error if no meshes are found
         if all([mesh_prim_path not in self.meshes for mesh_prim_path in self.cfg.mesh_prim_paths]):
@@ -198,6 +210,36 @@ class RayCaster(SensorBase):
                 f"No meshes found for ray-casting! Please check the mesh prim paths: {self.cfg.mesh_prim_paths}"
             )
 
+        # create the scene of mesh instances if there is more than a single static mesh
+        if len(instance_meshes) == 1 and len(self._dynamic_mesh_views) == 0:
+            self._mesh_instance_bvh = None
+            return
+        num_instances = len(instance_meshes)
+        self._mesh_ids = wp.array([mesh.id for mesh in instance_meshes], dtype=wp.uint64, device=self.device)
+        # the transforms of the instances as position and quaternion (x, y, z, w)
+        # note: the static meshes are in the world frame, so their transform is the identity
+        self._mesh_instance_transforms = torch.zeros(num_instances, 7, device=self.device)
+        self._mesh_instance_transforms[:, 6] = 1.0
+        # the bounding boxes of the instances in the mesh and world frames
+        instance_bounds = torch.tensor(np.stack(instance_bounds), dtype=torch.float, device=self.device)
+        self._mesh_instance_local_lowers = instance_bounds[:, 0].contiguous()
+        self._mesh_instance_local_uppers = instance_bounds[:, 1].contiguous()
+        self._mesh_instance_lowers = torch.zeros(num_instances, 3, device=self.device)
+        self._mesh_instance_uppers = torch.zeros(num_instances, 3, device=self.device)
+        # read the poses of the dynamic meshes and compute the bounding boxes
+        self._update_mesh_instances()
+        wp.synchronize_device(self.device)
+        # build the BVH over the bounding boxes
+        # note: the BVH keeps a reference to the bounds arrays, which share the memory of the tensors
+        self._mesh_instance_bvh = wp.Bvh(
+            wp.from_torch(self._mesh_instance_lowers, dtype=wp.vec3),
+            wp.from_torch(self._mesh_instance_uppers, dtype=wp.vec3),
+        )
+        # print info
+        omni.log.info(
+            f"Created scene of {num_instances} mesh instances ({len(warp_meshes)} unique meshes) for ray-casting."
+        )
+
     def _initialize_rays_impl(self):
         # compute ray stars and directions
         self.ray_starts, self.ray_directions = self.cfg.pattern_cfg.func(self.cfg.pattern_cfg, self._device)
@@ -251,13 +293,9 @@ class RayCaster(SensorBase):
             ray_starts_w += pos_w.unsqueeze(1)
             ray_directions_w = quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
         # ray cast and store the hits
-        # TODO: Make this work for multiple meshes?
-        self._data.ray_hits_w[env_ids] = raycast_mesh(
-            ray_starts_w,
-            ray_directions_w,
-            max_dist=self.cfg.max_distance,
-            mesh=self.meshes[self.cfg.mesh_prim_paths[0]],
-        )[0]
+        self._data.ray_hits_w[env_ids] = self._raycast(ray_starts_w, ray_directions_w, max_dist=self.cfg.max_distance)[
+            0
+        ]
 
     def _set_debug_vis_impl(self, debug_vis: bool):
         # set visibility of markers
@@ -275,6 +313,144 @@ class RayCaster(SensorBase):
         # show ray hit positions
         self.ray_visualizer.visualize(self._data.ray_hits_w.view(-1, 3))
 
+    """
+    Helper functions.
+    """
+
+    def _raycast(
+        self,
+        ray_starts_w: torch.Tensor,
+        ray_directions_w: torch.Tensor,
+        max_dist: float,
+        return_distance: bool = False,
+        return_normal: bool = False,
+    ) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
+        """Ray-cast against the meshes.
+
+        If there is a single static mesh, the rays are ray-cast against it directly. Otherwise, the poses of the
+        dynamic meshes are updated and the rays are ray-cast against all the mesh instances.
+
+        Args:
+            ray_starts_w: The starting positions of the rays in the world frame. Shape is (N, B, 3).
+            ray_directions_w: The directions of the rays in the world frame. Shape is (N, B, 3).
+            max_dist: The maximum distance to ray-cast.
+            return_distance: Whether to return the distance of the ray hits. Defaults to False.
+            return_normal: Whether to return the normal of the mesh faces at the ray hits. Defaults to False.
+
+        Returns:
+            The ray hit positions, distances, normals and face ids, as returned by
+            :func:`isaaclab.utils.warp.raycast_mesh`.
+        """
+        if self._mesh_instance_bvh is None:
+            return raycast_mesh(
+                ray_starts_w,
+                ray_directions_w,
+                max_dist=max_dist,
+                mesh=self.meshes[self.cfg.mesh_prim_paths[0]],
+                return_distance=return_distance,
+                return_normal=return_normal,
+            )
+        # update the poses of the dynamic meshes
+        if len(self._dynamic_mesh_views) > 0:
+            self._update_mesh_instances()
+        return raycast_mesh_instances(
+            ray_starts_w,
+            ray_directions_w,
+            bvh=self._mesh_instance_bvh,
+            mesh_ids=self._mesh_ids,
+            mesh_transforms=self._mesh_instance_transforms,
+            max_dist=max_dist,
+            return_distance=return_distance,
+            return_normal=return_normal,
+        )
+
+    def _update_mesh_instances(self):
+        """Update the transforms of the dynamic mesh instances and the bounding boxes of the instances."""
+        # read the poses of the dynamic meshes
+        for view, instance_ids in self._dynamic_mesh_views:
+            if isinstance(view, XFormPrim):
+                pos_w, quat_w = view.get_world_poses()
+                transforms = torch.cat([pos_w, convert_quat(quat_w, to="xyzw")], dim=-1)
+            else:
+                transforms = view.get_transforms()
+            self._mesh_instance_transforms[instance_ids] = transforms.to(self.device)
+        # compute the bounding boxes and refit the BVH
+        compute_mesh_instance_bounds(
+            self._mesh_instance_local_lowers,
+            self._mesh_instance_local_uppers,
+            self._mesh_instance_transforms,
+            self._mesh_instance_lowers,
+            self._mesh_instance_uppers,
+            bvh=self._mesh_instance_bvh,
+        )
+
+    def _create_dynamic_mesh_view(self, mesh_prim_path: str) -> XFormPrim | physx.RigidBodyView:
+        """Create the view to track the poses of the prims matching a dynamic mesh prim path.
+
+        Args:
+            mesh_prim_path: The prim path expression of the dynamic meshes.
+
+        Returns:
+            The physics view of the rigid bodies if the prims are rigid bodies. Otherwise, the XForm view.
+        """
+        prim = sim_utils.find_first_matching_prim(mesh_prim_path)
+        if prim is None:
+            raise RuntimeError(f"Invalid mesh prim path: {mesh_prim_path}")
+        if prim.HasAPI(UsdPhysics.RigidBodyAPI):
+            return self._physics_sim_view.create_rigid_body_view(mesh_prim_path.replace(".*", "*"))
+        omni.log.warn(
+            f"The dynamic mesh prim at path {prim.GetPath().pathString} is not a rigid body! Using XFormPrim."
+        )
+        return XFormPrim(mesh_prim_path, reset_xform_properties=False)
+
+    def _read_mesh(self, prim_path: str, in_prim_frame: bool) -> tuple[np.ndarray, np.ndarray]:
+        """Read the vertices and faces of the first mesh in the sub-tree of a prim.
+
+        Args:
+            prim_path: The path of the prim.
+            in_prim_frame: Whether to express the vertices in the frame of the prim. Otherwise, they are
+                expressed in the world frame.
+
+        Returns:
+            The vertices of the mesh, shape (N, 3), and the vertex indices of the faces, shape (M, 3).
+        """
+        # check if the prim is a plane - handle PhysX plane as a special case
+        # if a plane exists then we need to create an infinite mesh that is a plane
+        mesh_prim = sim_utils.get_first_matching_child_prim(prim_path, lambda prim: prim.GetTypeName() == "Plane")
+        # if we did not find a plane then we need to read the mesh
+        if mesh_prim is None:
+            # obtain the mesh prim
+            mesh_prim = sim_utils.get_first_matching_child_prim(prim_path, lambda prim: prim.GetTypeName() == "Mesh")
+            # check if valid
+            if mesh_prim is None or not mesh_prim.IsValid():
+                raise RuntimeError(f"Invalid mesh prim path: {prim_path}")
+            # cast into UsdGeomMesh
+            mesh_prim = UsdGeom.Mesh(mesh_prim)
+            # read the vertices and faces
+            points = np.asarray(mesh_prim.GetPointsAttr().Get())
+            transform_matrix = np.array(omni.usd.get_world_transform_matrix(mesh_prim)).T
+            # express the transform in the frame of the prim
+            # note: the scale of the prim is kept in the vertices since the tracked pose is a rigid transform
+            if in_prim_frame:
+                prim_transform_matrix = np.array(
+                    omni.usd.get_world_transform_matrix(sim_utils.find_first_matching_prim(prim_path))
+                ).T
+                prim_transform_matrix[:3, :3] /= np.linalg.norm(prim_transform_matrix[:3, :3], axis=0)
+                transform_matrix = np.linalg.inv(prim_transform_matrix) @ transform_matrix
+            points = np.matmul(points, transform_matrix[:3, :3].T)
+            points += transform_matrix[:3, 3]
+            indices = np.asarray(mesh_prim.GetFaceVertexIndicesAttr().Get()).reshape(-1, 3)
+            # print info
+            omni.log.info(
+                f"Read mesh prim: {mesh_prim.GetPath()} with {len(points)} vertices and {len(indices)} faces."
+            )
+        else:
+            mesh = make_plane(size=(2e6, 2e6), height=0.0, center_zero=True)
+            points, indices = np.asarray(mesh.vertices), np.asarray(mesh.faces)
+            # print info
+            omni.log.info(f"Created infinite plane mesh prim: {mesh_prim.GetPath()}.")
+        return points.astype(np.float32), indices.astype(np.int32)
+
     """
     Internal simulation callbacks.
     """
@@ -286,3 +462,4 @@ class RayCaster(SensorBase):
         # set all existing views to None to invalidate them
         self._physics_sim_view = None
         self._view = None
+        self._dynamic_mesh_views = list()
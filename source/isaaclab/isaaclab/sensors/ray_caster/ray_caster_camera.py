@@ -15,7 +15,6 @@ from isaacsim.core.prims import XFormPrim
 
 import isaaclab.utils.math as math_utils
 from isaaclab.sensors.camera import CameraData
-from isaaclab.utils.warp import raycast_mesh
 
 from .ray_caster import RayCaster
 
@@ -275,12 +274,9 @@ class RayCasterCamera(RayCaster):
         # to the image plane and distance to the camera to the maximum distance afterwards in-order to
         # match the USD camera behavior.
 
-        # TODO: Make ray-casting work for multiple meshes?
-        # necessary for regular dictionaries.
-        self.ray_hits_w, ray_depth, ray_normal, _ = raycast_mesh(
+        self.ray_hits_w, ray_depth, ray_normal, _ = self._raycast(
             ray_starts_w,
             ray_directions_w,
-            mesh=self.meshes[self.cfg.mesh_prim_paths[0]],
             max_dist=1e6,
             return_distance=any(
                 [name in self.cfg.data_types for name in ["distance_to_image_plane", "distance_to_camera"]]
@@ -35,9 +35,23 @@ class RayCasterCfg(SensorBaseCfg):
     mesh_prim_paths: list[str] = MISSING
     """The list of mesh primitive paths to ray cast against.
 
-    Note:
-        Currently, only a single static mesh is supported. We are working on supporting multiple
-        static meshes and dynamic meshes.
+    The paths can be regular expressions, for example ``"/World/envs/env_.*/Obstacle"``, in which case the
+    meshes of all the matching prims are used. For each matching prim, the first mesh (or plane) prim in
+    its sub-tree is ray-cast against.
+
+    If more than one mesh is found, or if any of the meshes is dynamic, the meshes are ray-cast against as
+    instances of a combined scene in a single kernel launch. The meshes with the same geometry share a single
+    warp mesh.
+    """
+
+    dynamic_mesh_prim_paths: list[str] = list()
+    """The mesh primitive paths (from :attr:`mesh_prim_paths`) of the meshes that move. Defaults to an empty list.
+
+    The poses of the prims matching these paths are read at every update of the sensor, and the meshes are
+    moved along with them. For prims with a rigid body, the poses are read from the physics view. Otherwise,
+    they are read from USD, which is slower.
+
+    The meshes of the other paths are assumed to be static and their poses are only read at initialization.
     """
 
     offset: OffsetCfg = OffsetCfg()
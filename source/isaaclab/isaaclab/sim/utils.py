@@ -17,7 +17,7 @@ import isaacsim.core.utils.stage as stage_utils
 import omni.kit.commands
 import omni.log
 from isaacsim.core.cloner import Cloner
-from pxr import PhysxSchema, Sdf, Usd, UsdGeom, UsdPhysics, UsdShade
+from pxr import PhysxSchema, Sdf, Tf, Usd, UsdGeom, UsdPhysics, UsdShade
 
 # from Isaac Sim 4.2 onwards, pxr.Semantics is deprecated
 try:
@@ -674,6 +674,11 @@ def find_matching_prims(prim_path_regex: str, stage: Usd.Stage | None = None) ->
         prim_path_regex: The regex expression for prim path.
         stage: The stage where the prim exists. Defaults to None, in which case the current stage is used.
 
+    Each token of the expression (i.e. the part between two '/') is matched against the names of the
+    children of the prims matching the previous tokens. The children of the prims are read from an index
+    of the stage hierarchy, which is kept up-to-date with the changes of the stage. Literal tokens are
+    looked up directly, and the matches of the other tokens are memoized.
+
     Returns:
         A list of prims that match input expression.
 
@@ -686,22 +691,16 @@ def find_matching_prims(prim_path_regex: str, stage: Usd.Stage | None = None) ->
     # get current stage
     if stage is None:
         stage = stage_utils.get_current_stage()
-    # need to wrap the token patterns in '^' and '$' to prevent matching anywhere in the string
+    # obtain the index of the stage hierarchy
+    index = _PrimPathIndex.get(stage)
     tokens = prim_path_regex.split("/")[1:]
-    tokens = [f"^{token}$" for token in tokens]
     # iterate over all prims in stage (breath-first search)
-    all_prims = [stage.GetPseudoRoot()]
-    output_prims = []
-    for index, token in enumerate(tokens):
-        token_compiled = re.compile(token)
-        for prim in all_prims:
-            for child in prim.GetAllChildren():
-                if token_compiled.match(child.GetName()) is not None:
-                    output_prims.append(child)
-        if index < len(tokens) - 1:
-            all_prims = output_prims
-            output_prims = []
-    return output_prims
+    nodes = index.find(tokens)
+    # the prims can expire if the stage is modified without notices (for instance, by a layer reload)
+    if not all(node.prim.IsValid() for node in nodes):
+        index.clear()
+        nodes = index.find(tokens)
+    return [node.prim for node in nodes]
 
 
 def find_matching_prim_paths(prim_path_regex: str, stage: Usd.Stage | None = None) -> list[str]:
@@ -862,3 +861,122 @@ def select_usd_variants(prim_path: str, variants: object | dict[str, str], stage
                 f"Setting variant selection '{variant_selection}' for variant set '{variant_set_name}' on"
                 f" prim '{prim_path}'."
             )
+
+
+"""
+USD Stage traversal - Index.
+"""
+
+
+class _PrimPathIndexNode:
+    """A node of the index of the stage hierarchy, corresponding to a prim."""
+
+    __slots__ = ("prim", "children", "matches")
+
+    def __init__(self, prim: Usd.Prim):
+        self.prim = prim
+        # children of the prim by name. Read from the stage at the first access.
+        self.children: dict[str, _PrimPathIndexNode] | None = None
+        # children of the prim matching the non-literal tokens
+        self.matches: dict[str, list[_PrimPathIndexNode]] = dict()
+
+    def get_children(self) -> dict[str, _PrimPathIndexNode]:
+        """Returns the children of the prim by name."""
+        if self.children is None:
+            self.children = {child.GetName(): _PrimPathIndexNode(child) for child in self.prim.GetAllChildren()}
+        return self.children
+
+    def get_matches(self, token: str) -> list[_PrimPathIndexNode]:
+        """Returns the children of the prim whose name matches the token."""
+        # literal token: direct lookup
+        if _is_literal_token(token):
+            child = self.get_children().get(token)
+            return [child] if child is not None else []
+        # regex token: memoized matches
+        matches = self.matches.get(token)
+        if matches is None:
+            children = self.get_children()
+            if token.endswith(".*") and _is_literal_token(token[:-2]):
+                # prefix token, for instance 'env_.*'
+                prefix = token[:-2]
+                matches = [child for name, child in children.items() if name.startswith(prefix)]
+            else:
+                # need to wrap the token patterns in '^' and '$' to prevent matching anywhere in the string
+                token_compiled = _compile_token(f"^{token}$")
+                matches = [child for name, child in children.items() if token_compiled.match(name) is not None]
+            self.matches[token] = matches
+        return matches
+
+    def invalidate(self):
+        """Discards the children of the prim read from the stage."""
+        self.children = None
+        self.matches.clear()
+
+
+class _PrimPathIndex:
+    """An index of the hierarchy of a stage to resolve the prim path expressions.
+
+    The index is a tree of the prim names, whose nodes read the children of their prim from the stage at the
+    first access. It listens to the :class:`Usd.Notice.ObjectsChanged` notices of the stage and discards the
+    children of the parent of each resynced prim, i.e. of each prim that was added, removed or recomposed.
+    """
+
+    _instance: _PrimPathIndex | None = None
+    """The index of the last stage used."""
+
+    def __init__(self, stage: Usd.Stage):
+        self.stage = stage
+        self._root = _PrimPathIndexNode(stage.GetPseudoRoot())
+        # listen to the changes of the stage
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    @classmethod
+    def get(cls, stage: Usd.Stage) -> _PrimPathIndex:
+        """Returns the index of the stage, creating it if needed."""
+        if cls._instance is None or cls._instance.stage != stage:
+            if cls._instance is not None:
+                cls._instance._listener.Revoke()
+            cls._instance = cls(stage)
+        return cls._instance
+
+    def find(self, tokens: list[str]) -> list[_PrimPathIndexNode]:
+        """Returns the nodes of the prims whose path matches the tokens."""
+        nodes = [self._root]
+        for token in tokens:
+            nodes = [match for node in nodes for match in node.get_matches(token)]
+        return nodes
+
+    def clear(self):
+        """Discards all the prims read from the stage."""
+        self._root = _PrimPathIndexNode(self.stage.GetPseudoRoot())
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, sender: Usd.Stage):
+        """Discards the children of the parents of the resynced prims."""
+        for path in notice.GetResyncedPaths():
+            # the properties do not change the hierarchy
+            if not path.IsAbsoluteRootOrPrimPath():
+                continue
+            if path.IsAbsoluteRootPath():
+                self.clear()
+                return
+            # find the node of the parent prim, if it was read from the stage
+            node = self._root
+            for prefix in path.GetParentPath().GetPrefixes():
+                if node.children is None:
+                    break
+                node = node.children.get(prefix.name)
+                if node is None:
+                    break
+            else:
+                node.invalidate()
+
+
+def _is_literal_token(token: str) -> bool:
+    """Checks whether a token of a prim path expression has no special regex characters."""
+    return re.escape(token) == token
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_token(pattern: str) -> re.Pattern:
+    """Compiles the regex pattern of a token of a prim path expression."""
+    return re.compile(pattern)
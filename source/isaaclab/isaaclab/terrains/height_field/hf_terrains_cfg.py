@@ -28,6 +28,12 @@ class HfTerrainBaseCfg(SubTerrainBaseCfg):
     slope_threshold: float | None = None
     """The slope threshold above which surfaces are made vertical. Defaults to None,
     in which case no correction is applied."""
+    flat_block_size: int | None = None
+    """The size (in number of cells) of the flat blocks merged into two triangles. Defaults to None,
+    in which case the mesh is not decimated.
+
+    Please refer to :func:`~isaaclab.terrains.height_field.utils.convert_height_field_to_mesh` for more details.
+    """
 
 
 """
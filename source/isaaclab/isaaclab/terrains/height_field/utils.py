@@ -60,7 +60,7 @@ def height_field_to_mesh(func: Callable) -> Callable:
 
         # convert to trimesh
         vertices, triangles = convert_height_field_to_mesh(
-            heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold
+            heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold, cfg.flat_block_size
         )
         mesh = trimesh.Trimesh(vertices=vertices, faces=triangles)
         # compute origin
@@ -77,7 +77,11 @@ def height_field_to_mesh(func: Callable) -> Callable:
 
 
 def convert_height_field_to_mesh(
-    height_field: np.ndarray, horizontal_scale: float, vertical_scale: float, slope_threshold: float | None = None
+    height_field: np.ndarray,
+    horizontal_scale: float,
+    vertical_scale: float,
+    slope_threshold: float | None = None,
+    flat_block_size: int | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Convert a height-field array to a triangle mesh represented by vertices and triangles.
 
@@ -102,12 +106,21 @@ def convert_height_field_to_mesh(
                   /  |
         (x_1,y_1)A---A'(x_1',y_1)
 
+    Optionally, the flat regions of the mesh can be decimated. For this, the cells of the height field are
+    grouped into square blocks of :obj:`flat_block_size` cells along each axis, starting from the first row and
+    column. If all the vertices of a block have the same height and are not moved by the slope correction,
+    the triangles of the block are replaced by two triangles spanning the block. The vertices that are no
+    longer used by any triangle are removed. Since the vertices of the neighboring blocks on the edges of
+    a decimated block lie on these edges, the resulting mesh has no gaps.
+
     Args:
         height_field: The input height-field array.
         horizontal_scale: The discretization of the terrain along the x and y axis.
         vertical_scale: The discretization of the terrain along the z axis.
         slope_threshold: The slope threshold above which surfaces are made vertical.
             Defaults to None, in which case no correction is applied.
+        flat_block_size: The size (in number of cells) of the flat blocks merged into two triangles.
+            Defaults to None, in which case the mesh is not decimated.
 
     Returns:
         The vertices and triangles of the mesh:
@@ -125,6 +138,8 @@ def convert_height_field_to_mesh(
     # copy height field to avoid modifying the original array
     hf = height_field.copy()
 
+    # whether the vertices are moved by the slope correction
+    is_moved = np.zeros((num_rows, num_cols), dtype=bool)
     # correct vertical surfaces above the slope threshold
     if slope_threshold is not None:
         # scale slope threshold based on the horizontal and vertical scale
@@ -148,6 +163,7 @@ def convert_height_field_to_mesh(
         )
         xx += (move_x + move_corners * (move_x == 0)) * horizontal_scale
         yy += (move_y + move_corners * (move_y == 0)) * horizontal_scale
+        is_moved = (move_x != 0) | (move_y != 0) | (move_corners != 0)
 
     # create vertices for the mesh
     vertices = np.zeros((num_rows * num_cols, 3), dtype=np.float32)
@@ -155,19 +171,65 @@ def convert_height_field_to_mesh(
     vertices[:, 1] = yy.flatten()
     vertices[:, 2] = hf.flatten() * vertical_scale
     # create triangles for the mesh
-    triangles = -np.ones((2 * (num_rows - 1) * (num_cols - 1), 3), dtype=np.uint32)
-    for i in range(num_rows - 1):
-        ind0 = np.arange(0, num_cols - 1) + i * num_cols
-        ind1 = ind0 + 1
-        ind2 = ind0 + num_cols
-        ind3 = ind2 + 1
-        start = 2 * i * (num_cols - 1)
-        stop = start + 2 * (num_cols - 1)
-        triangles[start:stop:2, 0] = ind0
-        triangles[start:stop:2, 1] = ind3
-        triangles[start:stop:2, 2] = ind1
-        triangles[start + 1 : stop : 2, 0] = ind0
-        triangles[start + 1 : stop : 2, 1] = ind2
-        triangles[start + 1 : stop : 2, 2] = ind3
+    # note: each cell (i, j) is split into the two triangles (ind0, ind3, ind1) and (ind0, ind2, ind3)
+    ind0 = np.arange(num_rows * num_cols, dtype=np.uint32).reshape(num_rows, num_cols)[:-1, :-1]
+    cell_triangles = _triangulate_cells(ind0, ind0 + 1, ind0 + num_cols, ind0 + num_cols + 1)
+
+    # decimate the flat regions
+    if flat_block_size is not None and flat_block_size > 1:
+        b = flat_block_size
+        num_block_rows, num_block_cols = (num_rows - 1) // b, (num_cols - 1) // b
+        # find the flat cells, i.e. the cells whose vertices have the same height and are not moved
+        is_flat_cell = (
+            (hf[:-1, :-1] == hf[1:, :-1])
+            & (hf[:-1, :-1] == hf[:-1, 1:])
+            & (hf[:-1, :-1] == hf[1:, 1:])
+            & ~(is_moved[:-1, :-1] | is_moved[1:, :-1] | is_moved[:-1, 1:] | is_moved[1:, 1:])
+        )
+        # find the flat blocks, i.e. the blocks with only flat cells
+        # note: the cells of a block are connected, so all the vertices of a flat block have the same height
+        is_flat_block = (
+            is_flat_cell[: num_block_rows * b, : num_block_cols * b]
+            .reshape(num_block_rows, b, num_block_cols, b)
+            .all(axis=(1, 3))
+        )
+        # mark the cells of the flat blocks
+        is_decimated_cell = np.zeros((num_rows - 1, num_cols - 1), dtype=bool)
+        is_decimated_cell[: num_block_rows * b, : num_block_cols * b] = np.repeat(
+            np.repeat(is_flat_block, b, axis=0), b, axis=1
+        )
+        # create the triangles of the flat blocks from the corners of the blocks
+        block_ind0 = ind0[: num_block_rows * b : b, : num_block_cols * b : b][is_flat_block]
+        block_triangles = _triangulate_cells(
+            block_ind0, block_ind0 + b, block_ind0 + b * num_cols, block_ind0 + b * num_cols + b
+        )
+        triangles = np.concatenate([cell_triangles[~is_decimated_cell].reshape(-1, 3), block_triangles.reshape(-1, 3)])
+        # remove the unused vertices
+        is_used = np.zeros(num_rows * num_cols, dtype=bool)
+        is_used[triangles] = True
+        new_vertex_ids = np.cumsum(is_used, dtype=np.uint32) - 1
+        vertices = vertices[is_used]
+        triangles = new_vertex_ids[triangles]
+    else:
+        triangles = cell_triangles.reshape(-1, 3)
 
     return vertices, triangles
+
+
+def _triangulate_cells(ind0: np.ndarray, ind1: np.ndarray, ind2: np.ndarray, ind3: np.ndarray) -> np.ndarray:
+    """Split quadrilateral cells into two triangles.
+
+    The vertices of each cell are ordered as ``ind0`` (x, y), ``ind1`` (x, y + dy), ``ind2`` (x + dx, y) and
+    ``ind3`` (x + dx, y + dy).
+
+    Returns:
+        The triangles of the cells. Shape is (*ind0.shape, 2, 3).
+    """
+    triangles = np.empty((*ind0.shape, 2, 3), dtype=np.uint32)
+    triangles[..., 0, 0] = ind0
+    triangles[..., 0, 1] = ind3
+    triangles[..., 0, 2] = ind1
+    triangles[..., 1, 0] = ind0
+    triangles[..., 1, 1] = ind2
+    triangles[..., 1, 2] = ind3
+    return triangles
@@ -5,8 +5,10 @@
 
 import numpy as np
 import os
+import threading
 import torch
 import trimesh
+from concurrent.futures import ThreadPoolExecutor
 
 import omni.log
 
@@ -66,7 +68,14 @@ class TerrainGenerator:
     If the flag :attr:`~TerrainGeneratorCfg.use_cache` is set to True, the terrains are cached based on their
     sub-terrain configurations. This means that if the same sub-terrain configuration is used
     multiple times, the terrain is only generated once and then reused. This is useful when
-    generating complex sub-terrains that take a long time to generate.
+    generating complex sub-terrains that take a long time to generate. If the seed is set, the complete
+    terrain is cached as well based on the terrain generator configuration. In that case, the terrain mesh,
+    origins and flat patches are loaded from a single file when the same configuration is used again.
+    Since the sub-terrains are then not available separately, :attr:`terrain_meshes` only contains the
+    combined terrain mesh.
+
+    The sub-terrain meshes can be generated in parallel in a pool of processes by setting the parameter
+    :attr:`~TerrainGeneratorCfg.num_workers`.
 
     .. attention::
 
@@ -141,6 +150,17 @@ class TerrainGenerator:
         self.terrain_meshes = list()
         self.terrain_origins = np.zeros((self.cfg.num_rows, self.cfg.num_cols, 3))
 
+        # load the complete terrain from cache if it exists
+        # note: the terrain is only cached if the seed is set since it is not reproducible otherwise
+        terrain_cache_filename = None
+        if self.cfg.use_cache and self.cfg.seed is not None:
+            terrain_hash = dict_to_md5_hash(self.cfg.to_dict())
+            terrain_cache_filename = os.path.join(self.cfg.cache_dir, f"terrain_{terrain_hash}.npz")
+            if os.path.exists(terrain_cache_filename):
+                with Timer("[INFO] Loading terrains from cache took"):
+                    self._load_terrain_from_cache(terrain_cache_filename)
+                return
+
         # parse configuration and add sub-terrains
         # create terrains based on curriculum or randomly
         if self.cfg.curriculum:
@@ -178,6 +198,10 @@ class TerrainGenerator:
         for name, value in self.flat_patches.items():
             self.flat_patches[name] = value + terrain_origins_torch
 
+        # save the complete terrain to cache
+        if terrain_cache_filename is not None:
+            self._save_terrain_to_cache(terrain_cache_filename)
+
     def __str__(self):
         """Return a string representation of the terrain generator."""
         msg = "Terrain Generator:"
@@ -208,6 +232,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # randomly sample sub-terrains
+        sub_terrains = list()
         for index in range(self.cfg.num_rows * self.cfg.num_cols):
             # coordinate index of the sub-terrain
             (sub_row, sub_col) = np.unravel_index(index, (self.cfg.num_rows, self.cfg.num_cols))
@@ -215,10 +240,10 @@ class TerrainGenerator:
             sub_index = self.np_rng.choice(len(proportions), p=proportions)
             # randomly sample difficulty parameter
             difficulty = self.np_rng.uniform(*self.cfg.difficulty_range)
-            # generate terrain
-            mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_index])
-            # add to sub-terrains
-            self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_index])
+            sub_terrains.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_index]))
+
+        # generate the terrains and add them to the sub-terrains
+        self._generate_sub_terrains(sub_terrains)
 
     def _generate_curriculum_terrains(self):
         """Add terrains based on the difficulty parameter."""
@@ -237,6 +262,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # curriculum-based sub-terrains
+        sub_terrains = list()
         for sub_col in range(self.cfg.num_cols):
             for sub_row in range(self.cfg.num_rows):
                 # vary the difficulty parameter linearly over the number of rows
@@ -248,15 +274,81 @@ class TerrainGenerator:
                 lower, upper = self.cfg.difficulty_range
                 difficulty = (sub_row + self.np_rng.uniform()) / self.cfg.num_rows
                 difficulty = lower + (upper - lower) * difficulty
-                # generate terrain
-                mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_indices[sub_col]])
-                # add to sub-terrains
-                self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_indices[sub_col]])
+                sub_terrains.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_indices[sub_col]]))
+
+        # generate the terrains and add them to the sub-terrains
+        self._generate_sub_terrains(sub_terrains)
 
     """
     Internal helper functions.
     """
 
+    def _generate_sub_terrains(self, sub_terrains: list[tuple[int, int, float, SubTerrainBaseCfg]]):
+        """Generate the sub-terrain meshes and add them to the list of sub-terrains.
+
+        If the number of workers is greater than 1, the meshes are generated in a pool of threads.
+
+        Args:
+            sub_terrains: The row index, column index, difficulty and configuration of each sub-terrain.
+        """
+        # note: threads are used instead of processes since forking the simulation app is not safe, and the
+        #   other start methods re-import the main module, which launches the simulation app again
+        if self.cfg.num_workers > 1:
+            # prepare the configuration of the sub-terrains
+            sub_terrain_cfgs = [self._get_sub_terrain_cfg(difficulty, cfg) for _, _, difficulty, cfg in sub_terrains]
+            # sample a seed for each sub-terrain
+            seeds = self.np_rng.integers(2**32, size=len(sub_terrains)).tolist()
+            cache_dir = self.cfg.cache_dir if self.cfg.use_cache else None
+            # generate the meshes in a pool of threads
+            with ThreadPoolExecutor(self.cfg.num_workers) as executor:
+                results = executor.map(
+                    _generate_sub_terrain_mesh, sub_terrain_cfgs, [cache_dir] * len(sub_terrains), seeds
+                )
+                for (sub_row, sub_col, _, cfg), (mesh, origin) in zip(sub_terrains, results):
+                    self._add_sub_terrain(mesh, origin, sub_row, sub_col, cfg)
+        else:
+            for sub_row, sub_col, difficulty, cfg in sub_terrains:
+                # generate terrain
+                mesh, origin = self._get_terrain_mesh(difficulty, cfg)
+                # add to sub-terrains
+                self._add_sub_terrain(mesh, origin, sub_row, sub_col, cfg)
+
+    def _load_terrain_from_cache(self, file_path: str):
+        """Load the complete terrain from the cache.
+
+        Args:
+            file_path: The path to the cache file.
+        """
+        with np.load(file_path) as data:
+            vertex_colors = data["vertex_colors"] if "vertex_colors" in data else None
+            self.terrain_mesh = trimesh.Trimesh(
+                vertices=data["vertices"], faces=data["faces"], vertex_colors=vertex_colors, process=False
+            )
+            self.terrain_origins = data["terrain_origins"]
+            for key in data.files:
+                if key.startswith("flat_patches/"):
+                    name = key[len("flat_patches/") :]
+                    self.flat_patches[name] = torch.tensor(data[key], dtype=torch.float, device=self.device)
+        # the sub-terrains are not stored separately
+        self.terrain_meshes = [self.terrain_mesh]
+
+    def _save_terrain_to_cache(self, file_path: str):
+        """Save the complete terrain to the cache.
+
+        Args:
+            file_path: The path to the cache file.
+        """
+        data = {
+            "vertices": self.terrain_mesh.vertices,
+            "faces": self.terrain_mesh.faces,
+            "terrain_origins": self.terrain_origins,
+        }
+        if self.cfg.color_scheme != "none":
+            data["vertex_colors"] = self.terrain_mesh.visual.vertex_colors
+        for name, value in self.flat_patches.items():
+            data[f"flat_patches/{name}"] = value.cpu().numpy()
+        _save_npz(file_path, data)
+
     def _add_terrain_border(self):
         """Add a surrounding border over all the sub-terrains into the terrain meshes."""
         # border parameters
@@ -327,6 +419,23 @@ class TerrainGenerator:
         # add origin to the list
         self.terrain_origins[row, col] = origin + transform[:3, -1]
 
+    def _get_sub_terrain_cfg(self, difficulty: float, cfg: SubTerrainBaseCfg) -> SubTerrainBaseCfg:
+        """Create the configuration of a sub-terrain with the input difficulty parameter.
+
+        Args:
+            difficulty: The difficulty parameter.
+            cfg: The configuration of the sub-terrain.
+
+        Returns:
+            A copy of the configuration with the difficulty and seed of the sub-terrain.
+        """
+        # copy the configuration
+        cfg = cfg.copy()
+        # add other parameters to the sub-terrain configuration
+        cfg.difficulty = float(difficulty)
+        cfg.seed = self.cfg.seed
+        return cfg
+
     def _get_terrain_mesh(self, difficulty: float, cfg: SubTerrainBaseCfg) -> tuple[trimesh.Trimesh, np.ndarray]:
         """Generate a sub-terrain mesh based on the input difficulty parameter.
 
@@ -344,44 +453,101 @@ class TerrainGenerator:
         Returns:
             The sub-terrain mesh and origin.
         """
-        # copy the configuration
-        cfg = cfg.copy()
-        # add other parameters to the sub-terrain configuration
-        cfg.difficulty = float(difficulty)
-        cfg.seed = self.cfg.seed
-        # generate hash for the sub-terrain
-        sub_terrain_hash = dict_to_md5_hash(cfg.to_dict())
-        # generate the file name
-        sub_terrain_cache_dir = os.path.join(self.cfg.cache_dir, sub_terrain_hash)
-        sub_terrain_obj_filename = os.path.join(sub_terrain_cache_dir, "mesh.obj")
-        sub_terrain_csv_filename = os.path.join(sub_terrain_cache_dir, "origin.csv")
+        cfg = self._get_sub_terrain_cfg(difficulty, cfg)
+        return _generate_sub_terrain_mesh(cfg, self.cfg.cache_dir if self.cfg.use_cache else None)
+
+
+"""
+Sub-terrain generation.
+"""
+
+_RNG_LOCK = threading.Lock()
+"""Lock for the global random number generators of NumPy and PyTorch, which are used by the terrain functions."""
+
+
+def _generate_sub_terrain_mesh(
+    cfg: SubTerrainBaseCfg, cache_dir: str | None, seed: int | None = None
+) -> tuple[trimesh.Trimesh, np.ndarray]:
+    """Generate a sub-terrain mesh, or load it from the cache if it exists.
+
+    This function can be executed in a pool of threads. Since the terrain functions sample from the global
+    random number generators of NumPy and PyTorch, they are executed one at a time.
+
+    Args:
+        cfg: The configuration of the sub-terrain, including its difficulty and seed.
+        cache_dir: The directory of the cache. If None, caching is disabled.
+        seed: The seed of the global NumPy and PyTorch random number generators for the generation. Defaults to
+            None, in which case the random number generators are not seeded. Otherwise, their states are restored
+            after the generation.
+
+    Returns:
+        The sub-terrain mesh and origin.
+    """
+    # generate hash for the sub-terrain
+    # note: the seed of the generation is part of the hash since the terrain depends on it
+    sub_terrain_dict = cfg.to_dict()
+    if seed is not None:
+        sub_terrain_dict["generation_seed"] = seed
+    sub_terrain_hash = dict_to_md5_hash(sub_terrain_dict)
+    # generate the file name
+    if cache_dir is not None:
+        sub_terrain_cache_dir = os.path.join(cache_dir, sub_terrain_hash)
+        sub_terrain_mesh_filename = os.path.join(sub_terrain_cache_dir, "mesh.npz")
         sub_terrain_meta_filename = os.path.join(sub_terrain_cache_dir, "cfg.yaml")
 
         # check if hash exists - if true, load the mesh and origin and return
-        if self.cfg.use_cache and os.path.exists(sub_terrain_obj_filename):
+        if os.path.exists(sub_terrain_mesh_filename):
             # load existing mesh
-            mesh = trimesh.load_mesh(sub_terrain_obj_filename, process=False)
-            origin = np.loadtxt(sub_terrain_csv_filename, delimiter=",")
+            with np.load(sub_terrain_mesh_filename) as data:
+                mesh = trimesh.Trimesh(vertices=data["vertices"], faces=data["faces"], process=False)
+                origin = data["origin"]
             # return the generated mesh
             return mesh, origin
 
-        # generate the terrain
-        meshes, origin = cfg.function(difficulty, cfg)
-        mesh = trimesh.util.concatenate(meshes)
-        # offset mesh such that they are in their center
-        transform = np.eye(4)
-        transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
-        mesh.apply_transform(transform)
-        # change origin to be in the center of the sub-terrain
-        origin += transform[0:3, -1]
-
-        # if caching is enabled, save the mesh and origin
-        if self.cfg.use_cache:
-            # create the cache directory
-            os.makedirs(sub_terrain_cache_dir, exist_ok=True)
-            # save the data
-            mesh.export(sub_terrain_obj_filename)
-            np.savetxt(sub_terrain_csv_filename, origin, delimiter=",", header="x,y,z")
-            dump_yaml(sub_terrain_meta_filename, cfg)
-        # return the generated mesh
-        return mesh, origin
+    # generate the terrain
+    with _RNG_LOCK:
+        if seed is None:
+            meshes, origin = cfg.function(cfg.difficulty, cfg)
+        else:
+            rng_state = np.random.get_state()
+            with torch.random.fork_rng():
+                np.random.seed(seed)
+                torch.manual_seed(seed)
+                try:
+                    meshes, origin = cfg.function(cfg.difficulty, cfg)
+                finally:
+                    np.random.set_state(rng_state)
+    mesh = trimesh.util.concatenate(meshes)
+    # offset mesh such that they are in their center
+    transform = np.eye(4)
+    transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
+    mesh.apply_transform(transform)
+    # change origin to be in the center of the sub-terrain
+    origin += transform[0:3, -1]
+
+    # if caching is enabled, save the mesh and origin
+    if cache_dir is not None:
+        # create the cache directory
+        os.makedirs(sub_terrain_cache_dir, exist_ok=True)
+        # save the data
+        _save_npz(sub_terrain_mesh_filename, {"vertices": mesh.vertices, "faces": mesh.faces, "origin": origin})
+        dump_yaml(sub_terrain_meta_filename, cfg)
+    # return the generated mesh
+    return mesh, origin
+
+
+def _save_npz(file_path: str, data: dict[str, np.ndarray]):
+    """Save the arrays into a NumPy archive.
+
+    The archive is first written to a temporary file and then renamed, so that concurrent readers
+    never see a partially written archive.
+
+    Args:
+        file_path: The path to the archive.
+        data: The arrays to save.
+    """
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    tmp_file_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_file_path, "wb") as f:
+        np.savez(f, **data)
+    os.replace(tmp_file_path, file_path)
@@ -194,6 +194,22 @@ class TerrainGeneratorCfg:
     If enabled, the generated terrains are stored in the cache directory. When generating terrains, the cache
     is checked to see if the terrain already exists. If it does, the terrain is loaded from the cache. Otherwise,
     the terrain is generated and stored in the cache. Caching can be used to speed up terrain generation.
+
+    If the :attr:`seed` is set, the complete terrain (i.e. the combined mesh, the origins and the flat patches of
+    the sub-terrains) is cached as well, based on the entire terrain generator configuration.
+    """
+
+    num_workers: int = 1
+    """Number of threads used to generate the sub-terrains in parallel. Defaults to 1.
+
+    If greater than 1, the sub-terrain meshes are generated, loaded from and saved to the cache in a pool of threads.
+    In that case, the random number generators of NumPy and PyTorch are seeded for each sub-terrain, so that the generated terrains
+    only depend on the :attr:`seed` and not on the number of threads. However, the terrains differ from the ones
+    generated by a single thread. The seeds are part of the cache keys of the sub-terrains.
+
+    Note:
+        The terrain functions use the global random number generators of NumPy and PyTorch. Thus, they are executed
+        one at a time, and the states of the generators are restored after each of them. The flat patches are always sampled in the main thread.
     """
 
     cache_dir: str = "/tmp/isaaclab/terrains"
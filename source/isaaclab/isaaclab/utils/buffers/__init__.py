@@ -8,3 +8,4 @@
 from .circular_buffer import CircularBuffer
 from .delay_buffer import DelayBuffer
 from .timestamped_buffer import TimestampedBuffer
+from .timestamped_property import TimestampedPropertyStats, timestamped_property
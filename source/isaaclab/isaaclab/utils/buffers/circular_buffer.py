@@ -16,7 +16,10 @@ class CircularBuffer:
     multi-environment settings, where each environment has its own data.
 
     The shape of the appended data is expected to be (batch_size, ...), where the first dimension is the
-    batch dimension. Correspondingly, the shape of the ring buffer is (max_len, batch_size, ...).
+    batch dimension. Correspondingly, the shape of the ring buffer is (batch_size, max_len, ...).
+
+    All operations are performed on the device and do not require any synchronization with the host. The
+    ordered history returned by :attr:`buffer` is gathered in a single operation using precomputed indices.
     """
 
     def __init__(self, max_len: int, batch_size: int, device: str):
@@ -37,12 +40,21 @@ class CircularBuffer:
         self._device = device
         self._ALL_INDICES = torch.arange(batch_size, device=device)
 
-        # max length tensor for comparisons
+        # max length for comparisons
+        self._max_length = max_len
         self._max_len = torch.full((batch_size,), max_len, dtype=torch.int, device=device)
         # number of data pushes passed since the last call to :meth:`reset`
         self._num_pushes = torch.zeros(batch_size, dtype=torch.long, device=device)
+        # whether some batches have no pushes since the last call to :meth:`reset`
+        # note: this is tracked on the host to avoid reading the number of pushes from the device
+        self._has_empty_batches = True
         # the pointer to the current head of the circular buffer (-1 means not initialized)
         self._pointer: int = -1
+        # indices to gather the buffer in oldest to newest order for each value of the pointer
+        # note: the row at index p holds the indices p+1, p+2, ..., p+max_len (modulo max_len)
+        self._ordered_indices = torch.remainder(
+            torch.arange(max_len, device=device).unsqueeze(1) + torch.arange(1, max_len + 1, device=device), max_len
+        )
         # the actual buffer for data storage
         # note: this is initialized on the first call to :meth:`append`
         self._buffer: torch.Tensor = None  # type: ignore
@@ -64,7 +76,7 @@ class CircularBuffer:
     @property
     def max_length(self) -> int:
         """The maximum length of the ring buffer."""
-        return int(self._max_len[0].item())
+        return self._max_length
 
     @property
     def current_length(self) -> torch.Tensor:
@@ -81,9 +93,7 @@ class CircularBuffer:
         Returns:
             Complete circular buffer with most recent entry at the end and oldest entry at the beginning of dimension 1. The shape is [batch_size, max_length, data.shape[1:]].
         """
-        buf = self._buffer.clone()
-        buf = torch.roll(buf, shifts=self.max_length - self._pointer - 1, dims=0)
-        return torch.transpose(buf, dim0=0, dim1=1)
+        return torch.index_select(self._buffer, dim=1, index=self._ordered_indices[self._pointer])
 
     """
     Operations.
@@ -100,9 +110,12 @@ class CircularBuffer:
             batch_ids = slice(None)
         # reset the number of pushes for the specified batch indices
         self._num_pushes[batch_ids] = 0
+        # mark the buffer for filling on the next append
+        if isinstance(batch_ids, slice) or len(batch_ids) > 0:
+            self._has_empty_batches = True
         if self._buffer is not None:
             # set buffer at batch_id reset indices to 0.0 so that the buffer() getter returns the cleared circular buffer after reset.
-            self._buffer[:, batch_ids, :] = 0.0
+            self._buffer[batch_ids] = 0.0
 
     def append(self, data: torch.Tensor):
         """Append the data to the circular buffer.
@@ -118,19 +131,23 @@ class CircularBuffer:
         if data.shape[0] != self.batch_size:
             raise ValueError(f"The input data has {data.shape[0]} environments while expecting {self.batch_size}")
 
+        # move the data to the buffer device
+        data = data.to(self._device)
         # at the first call, initialize the buffer size
         if self._buffer is None:
             self._pointer = -1
-            self._buffer = torch.empty((self.max_length, *data.shape), dtype=data.dtype, device=self._device)
+            self._buffer = torch.empty(
+                (self.batch_size, self.max_length, *data.shape[1:]), dtype=data.dtype, device=self._device
+            )
         # move the head to the next slot
         self._pointer = (self._pointer + 1) % self.max_length
         # add the new data to the last layer
-        self._buffer[self._pointer] = data.to(self._device)
-        # Check for batches with zero pushes and initialize all values in batch to first append
-        if 0 in self._num_pushes.tolist():
-            fill_ids = [i for i, x in enumerate(self._num_pushes.tolist()) if x == 0]
-            self._num_pushes.tolist().index(0) if 0 in self._num_pushes.tolist() else None
-            self._buffer[:, fill_ids, :] = data.to(self._device)[fill_ids]
+        self._buffer[:, self._pointer] = data
+        # initialize all values of the batches with zero pushes to the first append
+        if self._has_empty_batches:
+            is_first_push = (self._num_pushes == 0).view(-1, *([1] * data.dim()))
+            torch.where(is_first_push, data.unsqueeze(1), self._buffer, out=self._buffer)
+            self._has_empty_batches = False
         # increment number of number of pushes for all batches
         self._num_pushes += 1
 
@@ -155,7 +172,7 @@ class CircularBuffer:
         if len(key) != self.batch_size:
             raise ValueError(f"The argument 'key' has length {key.shape[0]}, while expecting {self.batch_size}")
         # check if the buffer is empty
-        if torch.any(self._num_pushes == 0) or self._buffer is None:
+        if self._has_empty_batches or self._buffer is None:
             raise RuntimeError("Attempting to retrieve data on an empty circular buffer. Please append data first.")
 
         # admissible lag
@@ -163,4 +180,4 @@ class CircularBuffer:
         # the index in the circular buffer (pointer points to the last+1 index)
         index_in_buffer = torch.remainder(self._pointer - valid_keys, self.max_length)
         # return output
-        return self._buffer[index_in_buffer, self._ALL_INDICES]
+        return self._buffer[self._ALL_INDICES, index_in_buffer]
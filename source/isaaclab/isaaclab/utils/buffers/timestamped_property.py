@@ -0,0 +1,189 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .timestamped_buffer import TimestampedBuffer
+
+
+@dataclass
+class TimestampedPropertyStats:
+    """Counters of the accesses to a :class:`timestamped_property`."""
+
+    hits: int = 0
+    """Number of accesses that returned the memoized value."""
+
+    misses: int = 0
+    """Number of accesses that computed the value."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the accesses that returned the memoized value. Zero if the property was not accessed."""
+        num_accesses = self.hits + self.misses
+        return self.hits / num_accesses if num_accesses > 0 else 0.0
+
+
+@dataclass
+class _TimestampedPropertyEntry:
+    """Memoized value of a :class:`timestamped_property` for an instance of its owner."""
+
+    value: Any = None
+    """The memoized value."""
+
+    timestamp: float = -1.0
+    """Simulation timestamp of the owner at the computation of the value."""
+
+    dependencies: tuple[tuple[float, torch.Tensor | None, int], ...] | None = None
+    """Timestamp, data and version of the data of each dependency at the computation of the value."""
+
+    stats: TimestampedPropertyStats = None  # type: ignore
+    """The access counters of the property."""
+
+
+class timestamped_property:
+    """A read-only property that is computed at most once per simulation timestamp of its owner.
+
+    Derived quantities of the data containers (for instance, velocities expressed in the base frame) are
+    often read by several observation, reward and termination terms in the same step. This decorator
+    memoizes the value of such a quantity and recomputes it only if one of the following changed since
+    its last computation:
+
+    * the simulation timestamp of the owner, i.e. its ``_sim_timestamp`` attribute,
+    * the timestamp or the data of a :class:`TimestampedBuffer` of the owner that the quantity depends on,
+    * the version counter of the data of such a buffer, which is increased by PyTorch at every in-place
+      modification. This captures the writes of new states into the buffers, for instance at a reset.
+
+    The memoized value is shared between the callers, so it must not be modified in-place.
+
+    .. code-block:: python
+
+        class MyData:
+            def __init__(self):
+                self._sim_timestamp = 0.0
+                self._root_state_w = TimestampedBuffer()
+
+            @timestamped_property(dependencies=("_root_state_w",))
+            def root_lin_vel_b(self) -> torch.Tensor:
+                return math_utils.quat_rotate_inverse(self.root_state_w[:, 3:7], self.root_state_w[:, 7:10])
+
+    The number of memoized and computed accesses of the properties of an instance is reported by
+    :meth:`get_stats`.
+    """
+
+    def __init__(self, func: Callable[[Any], Any] | None = None, *, dependencies: tuple[str, ...] = ()):
+        """Initializes the property.
+
+        Args:
+            func: The function computing the quantity. Defaults to None, in which case the instance is
+                used as a decorator.
+            dependencies: The attribute names of the timestamped buffers of the owner that the quantity
+                depends on. Defaults to an empty tuple.
+        """
+        self._func = None
+        self._dependencies = dependencies
+        self._name = None
+        if func is not None:
+            self(func)
+
+    def __call__(self, func: Callable[[Any], Any]) -> timestamped_property:
+        """Sets the function computing the quantity."""
+        self._func = func
+        self.__doc__ = func.__doc__
+        self._name = func.__name__
+        return self
+
+    def __set_name__(self, owner: type, name: str):
+        self._name = name
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        # return the descriptor when accessed from the class
+        if obj is None:
+            return self
+        # obtain the memoized entry of the instance
+        entry = self._entries(obj).get(self._name)
+        if entry is None:
+            entry = _TimestampedPropertyEntry(stats=TimestampedPropertyStats())
+            self._entries(obj)[self._name] = entry
+        # check whether the memoized value is up-to-date
+        dependencies = self._dependency_states(obj)
+        if entry.timestamp == obj._sim_timestamp and self._is_same(entry.dependencies, dependencies):
+            entry.stats.hits += 1
+            return entry.value
+        # compute the value
+        # note: the dependencies are read after the computation since it may refresh the buffers
+        entry.value = self._func(obj)
+        entry.timestamp = obj._sim_timestamp
+        entry.dependencies = self._dependency_states(obj)
+        entry.stats.misses += 1
+        return entry.value
+
+    def __set__(self, obj: Any, value: Any):
+        raise AttributeError(f"The property '{self._name}' is read-only.")
+
+    """
+    Operations.
+    """
+
+    @staticmethod
+    def get_stats(obj: Any) -> dict[str, TimestampedPropertyStats]:
+        """Returns the access counters of the timestamped properties of an instance.
+
+        Args:
+            obj: The instance owning the properties.
+
+        Returns:
+            A dictionary mapping the names of the accessed properties to their counters.
+        """
+        return {name: entry.stats for name, entry in timestamped_property._entries(obj).items()}
+
+    @staticmethod
+    def reset_stats(obj: Any):
+        """Resets the access counters of the timestamped properties of an instance.
+
+        Args:
+            obj: The instance owning the properties.
+        """
+        for entry in timestamped_property._entries(obj).values():
+            entry.stats = TimestampedPropertyStats()
+
+    """
+    Helper functions.
+    """
+
+    @staticmethod
+    def _entries(obj: Any) -> dict[str, _TimestampedPropertyEntry]:
+        """Returns the memoized entries of an instance, creating them if needed."""
+        try:
+            return obj.__dict__["_timestamped_property_entries"]
+        except KeyError:
+            entries = obj.__dict__["_timestamped_property_entries"] = dict()
+            return entries
+
+    def _dependency_states(self, obj: Any) -> tuple[tuple[float, torch.Tensor | None, int], ...]:
+        """Returns the timestamp, data and version of the data of each dependency of the property."""
+        states = list()
+        for name in self._dependencies:
+            buffer: TimestampedBuffer = getattr(obj, name)
+            version = buffer.data._version if buffer.data is not None else -1
+            states.append((buffer.timestamp, buffer.data, version))
+        return tuple(states)
+
+    @staticmethod
+    def _is_same(
+        states: tuple[tuple[float, torch.Tensor | None, int], ...] | None,
+        other_states: tuple[tuple[float, torch.Tensor | None, int], ...],
+    ) -> bool:
+        """Checks whether two states of the dependencies are the same."""
+        if states is None:
+            return False
+        return all(
+            timestamp == other_timestamp and data is other_data and version == other_version
+            for (timestamp, data, version), (other_timestamp, other_data, other_version) in zip(states, other_states)
+        )
@@ -7,6 +7,7 @@
 Submodule for datasets classes and methods.
 """
 
+from .async_dataset_file_handler import AsyncDatasetFileHandler
 from .dataset_file_handler_base import DatasetFileHandlerBase
 from .episode_data import EpisodeData
-from .hdf5_dataset_file_handler import HDF5DatasetFileHandler
+from .hdf5_dataset_file_handler import HDF5DatasetFileHandler, HDF5GroupView
@@ -0,0 +1,188 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import queue
+import threading
+import torch
+from collections.abc import Mapping
+
+from .dataset_file_handler_base import DatasetFileHandlerBase
+from .episode_data import EpisodeData
+
+
+class AsyncDatasetFileHandler(DatasetFileHandlerBase):
+    """Dataset file handler that writes the episodes of another file handler in a background thread.
+
+    When an episode is written, its data is copied into host memory and the copy is put into a bounded
+    queue. A dedicated writer thread takes the episodes from the queue and writes them with the wrapped
+    file handler. For data on a CUDA device, the copies are performed asynchronously into pinned host
+    memory, so that writing an episode does not synchronize with the device.
+
+    If the queue is full, :meth:`write_episode` blocks until the writer thread has taken an episode from
+    the queue. The writer thread flushes the file to disk whenever it has written all the queued episodes,
+    so that the exported episodes are not lost if the process stops before :meth:`close` is called. An error
+    raised while writing an episode is raised again by the next call to :meth:`write_episode`, :meth:`flush`
+    or :meth:`close`. The methods :meth:`flush` and :meth:`close` wait until all the queued episodes are
+    written. All the other operations are forwarded to the wrapped file handler.
+    """
+
+    def __init__(self, dataset_file_handler: DatasetFileHandlerBase, max_queue_size: int = 8):
+        """Initializes the asynchronous dataset file handler.
+
+        Args:
+            dataset_file_handler: The file handler used to write the episodes.
+            max_queue_size: The maximum number of episodes waiting to be written. Defaults to 8.
+        """
+        self._dataset_file_handler = dataset_file_handler
+        self._queue: queue.Queue[tuple[EpisodeData, torch.cuda.Event | None] | None] = queue.Queue(max_queue_size)
+        self._writer_thread: threading.Thread | None = None
+        self._writer_exception: Exception | None = None
+
+    def __del__(self):
+        """Destructor for the file handler."""
+        self.close()
+
+    """
+    Properties
+    """
+
+    @property
+    def dataset_file_handler(self) -> DatasetFileHandlerBase:
+        """The file handler used to write the episodes."""
+        return self._dataset_file_handler
+
+    """
+    Operations.
+    """
+
+    def open(self, file_path: str, mode: str = "r"):
+        """Open an existing dataset file."""
+        self._dataset_file_handler.open(file_path, mode)
+
+    def create(self, file_path: str, env_name: str = None):
+        """Create a new dataset file."""
+        self._dataset_file_handler.create(file_path, env_name)
+
+    def get_env_name(self) -> str | None:
+        """Get the environment name."""
+        return self._dataset_file_handler.get_env_name()
+
+    def load_episode(self, *args, **kwargs) -> EpisodeData | None:
+        """Load episode data from the file.
+
+        The pending episodes are written before loading.
+        """
+        self._wait_for_writer()
+        return self._dataset_file_handler.load_episode(*args, **kwargs)
+
+    def get_num_episodes(self) -> int:
+        """Get number of episodes in the file.
+
+        The pending episodes are written before counting.
+        """
+        self._wait_for_writer()
+        return self._dataset_file_handler.get_num_episodes()
+
+    def write_episode(self, episode: EpisodeData):
+        """Queue an episode for writing to the dataset.
+
+        The data of the episode is copied, so the episode can be modified after this call.
+
+        Args:
+            episode: The episode data to add.
+
+        Raises:
+            RuntimeError: If writing a previously queued episode failed.
+        """
+        self._raise_if_writer_failed()
+        if episode.is_empty():
+            return
+        # start the writer thread at the first call
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._run_writer, daemon=True)
+            self._writer_thread.start()
+
+        # copy the episode data into host memory
+        episode_copy = EpisodeData()
+        episode_copy.data = self._copy_to_host(episode.data)
+        episode_copy.seed = episode.seed
+        episode_copy.env_id = episode.env_id
+        episode_copy.success = episode.success
+        # record an event to know when the asynchronous copies are done
+        copy_event = None
+        if torch.cuda.is_available() and torch.cuda.is_initialized():
+            copy_event = torch.cuda.Event()
+            copy_event.record()
+        # put the episode in the queue (blocks if the queue is full)
+        self._queue.put((episode_copy, copy_event))
+
+    def flush(self):
+        """Write all the queued episodes and flush the file to disk."""
+        self._wait_for_writer()
+        self._dataset_file_handler.flush()
+
+    def close(self):
+        """Write all the queued episodes, stop the writer thread and close the file."""
+        if self._writer_thread is not None:
+            self._queue.join()
+            # stop the writer thread
+            self._queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+        self._dataset_file_handler.close()
+        self._raise_if_writer_failed()
+
+    """
+    Helper functions.
+    """
+
+    def _copy_to_host(self, data: Mapping | torch.Tensor) -> dict | torch.Tensor:
+        """Copy the nested episode data into host memory.
+
+        Tensors on a CUDA device are copied asynchronously into pinned host memory. Tensors on the host are cloned.
+        """
+        if isinstance(data, Mapping):
+            return {key: self._copy_to_host(value) for key, value in data.items()}
+        if data.is_cuda:
+            host_data = torch.empty(data.shape, dtype=data.dtype, pin_memory=True)
+            host_data.copy_(data, non_blocking=True)
+            return host_data
+        return data.clone()
+
+    def _run_writer(self):
+        """Write the queued episodes until the stop signal is received."""
+        while True:
+            item = self._queue.get()
+            try:
+                # check for the stop signal
+                if item is None:
+                    return
+                # skip remaining episodes after a failure
+                if self._writer_exception is not None:
+                    continue
+                episode, copy_event = item
+                if copy_event is not None:
+                    copy_event.synchronize()
+                self._dataset_file_handler.write_episode(episode)
+                # flush the file to disk once all the queued episodes are written
+                if self._queue.empty():
+                    self._dataset_file_handler.flush()
+            except Exception as e:
+                self._writer_exception = e
+            finally:
+                self._queue.task_done()
+
+    def _wait_for_writer(self):
+        """Wait until all the queued episodes are written."""
+        self._queue.join()
+        self._raise_if_writer_failed()
+
+    def _raise_if_writer_failed(self):
+        """Raise an error if writing an episode in the writer thread failed."""
+        if self._writer_exception is not None:
+            exception, self._writer_exception = self._writer_exception, None
+            raise RuntimeError("Failed to write an episode in the background writer thread.") from exception
@@ -6,14 +6,25 @@
 from __future__ import annotations
 
 import torch
+from collections.abc import Mapping
 
 
 class EpisodeData:
-    """Class to store episode data."""
+    """Class to store episode data.
+
+    The data of each key is stored in a tensor whose first dimension is the time step. To avoid copying the
+    whole episode whenever a new time step is added, the tensors are allocated with spare capacity that grows
+    geometrically, and the :attr:`data` dictionary holds views of the filled part of these tensors.
+    """
+
+    MIN_CAPACITY = 32
+    """The minimum number of time steps allocated for the data of a key."""
 
     def __init__(self) -> None:
         """Initializes episode data class."""
         self._data = dict()
+        # the storage tensors with spare capacity indexed by the full key
+        self._storage: dict[str, torch.Tensor] = dict()
         self._next_action_index = 0
         self._next_state_index = 0
         self._seed = None
@@ -29,6 +40,7 @@ class EpisodeData:
     def data(self, data: dict):
         """Set the episode data."""
         self._data = data
+        self._storage = dict()
 
     @property
     def seed(self):
@@ -100,22 +112,26 @@ class EpisodeData:
                 self.add(f"{key}/{sub_key}", sub_value)
             return
 
-        sub_keys = key.split("/")
-        current_dataset_pointer = self._data
-        for sub_key_index in range(len(sub_keys)):
-            if sub_key_index == len(sub_keys) - 1:
-                # Add value to the final dict layer
-                if sub_keys[sub_key_index] not in current_dataset_pointer:
-                    current_dataset_pointer[sub_keys[sub_key_index]] = value.unsqueeze(0).clone()
-                else:
-                    current_dataset_pointer[sub_keys[sub_key_index]] = torch.cat(
-                        (current_dataset_pointer[sub_keys[sub_key_index]], value.unsqueeze(0))
-                    )
-                break
-            # key index
-            if sub_keys[sub_key_index] not in current_dataset_pointer:
-                current_dataset_pointer[sub_keys[sub_key_index]] = dict()
-            current_dataset_pointer = current_dataset_pointer[sub_keys[sub_key_index]]
+        self._append(key, value.unsqueeze(0))
+
+    def extend(self, key: str, value: torch.Tensor | dict):
+        """Add a sequence of time steps for a key to the dataset.
+
+        This is equivalent to calling :meth:`add` for each element of the value along its first dimension,
+        but copies the data only once.
+
+        Args:
+            key: The key name. It can be nested by using the "/" character.
+            value: The corresponding values of tensor type or of dict type. The shape of a tensor in the
+                value is (num_steps, ...).
+        """
+        # check datatype
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                self.extend(f"{key}/{sub_key}", sub_value)
+            return
+
+        self._append(key, value)
 
     def get_initial_state(self) -> torch.Tensor | None:
         """Get the initial state from the dataset."""
@@ -146,7 +162,7 @@ class EpisodeData:
         states = self._data["states"]
 
         def get_state_helper(states, state_index) -> dict | torch.Tensor | None:
-            if isinstance(states, dict):
+            if isinstance(states, Mapping):
                 output_state = dict()
                 for key, value in states.items():
                     output_state[key] = get_state_helper(value, state_index)
@@ -169,3 +185,49 @@ class EpisodeData:
         if state is not None:
             self._next_state_index += 1
         return state
+
+    """
+    Helper functions.
+    """
+
+    def _to_dict(self, data: Mapping) -> dict:
+        """Convert the nested mapping of the data into nested dictionaries."""
+        return {key: self._to_dict(value) if isinstance(value, Mapping) else value for key, value in data.items()}
+
+    def _append(self, key: str, values: torch.Tensor):
+        """Append the values along the first dimension to the data of the given key.
+
+        Args:
+            key: The key name. It can be nested by using the "/" character.
+            values: The values to append. Shape is (num_steps, ...).
+        """
+        # convert read-only views of the data (e.g. lazily loaded episodes) into dictionaries
+        if not isinstance(self._data, dict):
+            self._data = self._to_dict(self._data)
+
+        sub_keys = key.split("/")
+        # create the nested dictionaries
+        current_dataset_pointer = self._data
+        for sub_key in sub_keys[:-1]:
+            if sub_key not in current_dataset_pointer:
+                current_dataset_pointer[sub_key] = dict()
+            current_dataset_pointer = current_dataset_pointer[sub_key]
+        # obtain the storage of the key
+        if sub_keys[-1] in current_dataset_pointer:
+            length = len(current_dataset_pointer[sub_keys[-1]])
+            # note: data set through the setter is used as storage without spare capacity
+            storage = self._storage.get(key, current_dataset_pointer[sub_keys[-1]])
+        else:
+            length = 0
+            storage = values
+        # grow the storage geometrically if the values do not fit
+        new_length = length + len(values)
+        if key not in self._storage or new_length > len(storage):
+            capacity = max(new_length, 2 * length, self.MIN_CAPACITY)
+            new_storage = torch.empty((capacity, *storage.shape[1:]), dtype=storage.dtype, device=storage.device)
+            new_storage[:length] = storage[:length]
+            storage = new_storage
+            self._storage[key] = storage
+        # add values to the final dict layer
+        storage[length:new_length] = values
+        current_dataset_pointer[sub_keys[-1]] = storage[:new_length]
@@ -3,26 +3,102 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+from __future__ import annotations
+
 import h5py
 import json
 import numpy as np
 import os
+import re
 import torch
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Mapping
 
 from .dataset_file_handler_base import DatasetFileHandlerBase
 from .episode_data import EpisodeData
 
 
+class HDF5GroupView(Mapping):
+    """Read-only dictionary view of an HDF5 group that loads the datasets as tensors on demand.
+
+    A dataset is read from the file and converted into a tensor the first time it is accessed. The loaded
+    tensors are cached, so that subsequent accesses do not read from the file again. Sub-groups are returned
+    as views as well. The file must remain open while the view is used.
+    """
+
+    def __init__(self, h5_group: h5py.Group, device: str):
+        """Initializes the view.
+
+        Args:
+            h5_group: The HDF5 group to view.
+            device: The device on which the tensors are created.
+        """
+        self._h5_group = h5_group
+        self._device = device
+        self._cache: dict[str, torch.Tensor | HDF5GroupView] = dict()
+
+    def __getitem__(self, key: str) -> torch.Tensor | HDF5GroupView:
+        if key not in self._cache:
+            item = self._h5_group[key]
+            if isinstance(item, h5py.Group):
+                self._cache[key] = HDF5GroupView(item, self._device)
+            else:
+                # Converting the dataset to numpy array greatly improves the performance
+                # when converting to torch tensor
+                self._cache[key] = torch.tensor(np.array(item), device=self._device)
+        return self._cache[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._h5_group)
+
+    def __len__(self) -> int:
+        return len(self._h5_group)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._h5_group
+
+
 class HDF5DatasetFileHandler(DatasetFileHandlerBase):
-    """HDF5 dataset file handler for storing and loading episode data."""
+    """HDF5 dataset file handler for storing and loading episode data.
+
+    By default, the data of each key of an episode is stored as a contiguous dataset. Optionally, the datasets
+    can be chunked along the time dimension and compressed. Chunked datasets are created as resizable along
+    the time dimension.
+
+    The files created by the handler contain an ``index`` group that stores the name, the success flag and the
+    number of samples of each written episode. It allows selecting the episodes by their success flag without
+    iterating over the episode groups.
+    """
+
+    def __init__(
+        self,
+        compression: str | None = None,
+        compression_opts: int | None = None,
+        chunk_length: int | None = None,
+        key_compression: dict[str, str | None] | None = None,
+    ):
+        """Initializes the HDF5 dataset file handler.
 
-    def __init__(self):
-        """Initializes the HDF5 dataset file handler."""
+        Args:
+            compression: The compression filter of the datasets, i.e. ``"gzip"`` or ``"lzf"``. Defaults to None,
+                in which case the datasets are not compressed.
+            compression_opts: The compression level (0-9) used with the ``"gzip"`` filter. Defaults to None,
+                in which case the default level of h5py is used.
+            chunk_length: The number of time steps in a chunk of the datasets. Defaults to None, in which case
+                only compressed datasets are chunked, with a chunk shape selected by h5py.
+            key_compression: The compression filters for specific keys, which override :attr:`compression`.
+                The keys are regular expressions matched against the full key of the data, for example
+                ``"obs/.*_rgb"``. A value of None disables the compression for the matching keys. Defaults to None.
+        """
         self._hdf5_file_stream = None
         self._hdf5_data_group = None
+        self._hdf5_index_group = None
         self._demo_count = 0
         self._env_args = {}
+        # dataset layout settings
+        self._compression = compression
+        self._compression_opts = compression_opts
+        self._chunk_length = chunk_length
+        self._key_compression = key_compression if key_compression is not None else dict()
 
     def open(self, file_path: str, mode: str = "r"):
         """Open an existing dataset file."""
@@ -31,6 +107,8 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         self._hdf5_file_stream = h5py.File(file_path, mode)
         self._hdf5_data_group = self._hdf5_file_stream["data"]
         self._demo_count = len(self._hdf5_data_group)
+        # note: files written without the index are read by iterating over the episode groups
+        self._hdf5_index_group = self._hdf5_file_stream.get("index")
 
     def create(self, file_path: str, env_name: str = None):
         """Create a new dataset file."""
@@ -48,6 +126,12 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         self._hdf5_data_group.attrs["total"] = 0
         self._demo_count = 0
 
+        # set up the episode index in the file
+        self._hdf5_index_group = self._hdf5_file_stream.create_group("index")
+        self._hdf5_index_group.create_dataset("episode_names", (0,), dtype=h5py.string_dtype(), maxshape=(None,))
+        self._hdf5_index_group.create_dataset("success", (0,), dtype=np.int8, maxshape=(None,))
+        self._hdf5_index_group.create_dataset("num_samples", (0,), dtype=np.int64, maxshape=(None,))
+
         # set environment arguments
         # the environment type (we use gym environment type) is set to be compatible with robomimic
         # Ref: https://github.com/ARISE-Initiative/robomimic/blob/master/robomimic/envs/env_base.py#L15
@@ -81,10 +165,29 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
             return env_args["env_name"]
         return None
 
-    def get_episode_names(self) -> Iterable[str]:
-        """Get the names of the episodes in the file."""
+    def get_episode_names(self, success: bool | None = None) -> Iterable[str]:
+        """Get the names of the episodes in the file.
+
+        Args:
+            success: The success flag of the episodes to select. Defaults to None, in which case all the
+                episodes are selected.
+
+        Returns:
+            The names of the selected episodes.
+        """
         self._raise_if_not_initialized()
-        return self._hdf5_data_group.keys()
+        if success is None:
+            return self._hdf5_data_group.keys()
+        # select the episodes using the index of the file
+        if self._hdf5_index_group is not None:
+            episode_names = self._hdf5_index_group["episode_names"].asstr()[()]
+            return episode_names[self._hdf5_index_group["success"][()] == int(success)].tolist()
+        # otherwise, read the success flag of each episode
+        return [
+            name
+            for name, h5_episode_group in self._hdf5_data_group.items()
+            if "success" in h5_episode_group.attrs and bool(h5_episode_group.attrs["success"]) == success
+        ]
 
     def get_num_episodes(self) -> int:
         """Get number of episodes in the file."""
@@ -99,8 +202,19 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
     Operations.
     """
 
-    def load_episode(self, episode_name: str, device: str) -> EpisodeData | None:
-        """Load episode data from the file."""
+    def load_episode(self, episode_name: str, device: str, lazy: bool = False) -> EpisodeData | None:
+        """Load episode data from the file.
+
+        Args:
+            episode_name: The name of the episode.
+            device: The device on which the data is loaded.
+            lazy: Whether to load the data of each key only when it is accessed. Defaults to False.
+                If True, the data of the episode is a :class:`HDF5GroupView` and the file must remain
+                open while the episode is used.
+
+        Returns:
+            The episode data. None if the episode is not found.
+        """
         self._raise_if_not_initialized()
         if episode_name not in self._hdf5_data_group:
             return None
@@ -119,7 +233,10 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
                     data[key] = torch.tensor(np.array(group[key]), device=device)
             return data
 
-        episode.data = load_dataset_helper(h5_episode_group)
+        if lazy:
+            episode.data = HDF5GroupView(h5_episode_group, device)
+        else:
+            episode.data = load_dataset_helper(h5_episode_group)
 
         if "seed" in h5_episode_group.attrs:
             episode.seed = h5_episode_group.attrs["seed"]
@@ -142,7 +259,8 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
             return
 
         # create episode group based on demo count
-        h5_episode_group = self._hdf5_data_group.create_group(f"demo_{self._demo_count}")
+        episode_name = f"demo_{self._demo_count}"
+        h5_episode_group = self._hdf5_data_group.create_group(episode_name)
 
         # store number of steps taken
         if "actions" in episode.data:
@@ -156,21 +274,32 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         if episode.success is not None:
             h5_episode_group.attrs["success"] = episode.success
 
-        def create_dataset_helper(group, key, value):
+        def create_dataset_helper(group, key, value, full_key):
             """Helper method to create dataset that contains recursive dict objects."""
-            if isinstance(value, dict):
+            if isinstance(value, Mapping):
                 key_group = group.create_group(key)
                 for sub_key, sub_value in value.items():
-                    create_dataset_helper(key_group, sub_key, sub_value)
+                    create_dataset_helper(key_group, sub_key, sub_value, f"{full_key}/{sub_key}")
             else:
-                group.create_dataset(key, data=value.cpu().numpy())
+                self._create_dataset(group, key, value.cpu().numpy(), full_key)
 
         for key, value in episode.data.items():
-            create_dataset_helper(h5_episode_group, key, value)
+            create_dataset_helper(h5_episode_group, key, value, key)
 
         # increment total step counts
         self._hdf5_data_group.attrs["total"] += h5_episode_group.attrs["num_samples"]
 
+        # add the episode to the index
+        if self._hdf5_index_group is not None:
+            success = -1 if episode.success is None else int(bool(episode.success))
+            for index_key, index_value in zip(
+                ("episode_names", "success", "num_samples"),
+                (episode_name, success, h5_episode_group.attrs["num_samples"]),
+            ):
+                index_dataset = self._hdf5_index_group[index_key]
+                index_dataset.resize((len(index_dataset) + 1,))
+                index_dataset[-1] = index_value
+
         # increment total demo counts
         self._demo_count += 1
 
@@ -185,6 +314,37 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         if self._hdf5_file_stream is not None:
             self._hdf5_file_stream.close()
             self._hdf5_file_stream = None
+            self._hdf5_index_group = None
+
+    def _create_dataset(self, group: h5py.Group, key: str, data: np.ndarray, full_key: str):
+        """Create a dataset with the configured layout.
+
+        Args:
+            group: The group in which the dataset is created.
+            key: The name of the dataset.
+            data: The data of the dataset. Shape is (num_steps, ...).
+            full_key: The full key of the data in the episode, used to resolve the compression filter.
+        """
+        # resolve the compression filter of the key
+        compression = self._compression
+        for key_pattern, key_compression in self._key_compression.items():
+            if re.fullmatch(key_pattern, full_key):
+                compression = key_compression
+                break
+        compression_opts = self._compression_opts if compression == "gzip" else None
+        # datasets are contiguous unless they are compressed or the chunk length is set
+        if compression is None and self._chunk_length is None or data.ndim == 0:
+            group.create_dataset(key, data=data)
+            return
+        chunks = (self._chunk_length, *data.shape[1:]) if self._chunk_length is not None else True
+        group.create_dataset(
+            key,
+            data=data,
+            chunks=chunks,
+            maxshape=(None, *data.shape[1:]),
+            compression=compression,
+            compression_opts=compression_opts,
+        )
 
     def _raise_if_not_initialized(self):
         """Raise an error if the dataset file handler is not initialized."""
@@ -1683,18 +1683,24 @@ def interpolate_rotations(R1, R2, num_steps, axis_angle=True):
     """
     Interpolate between two rotation matrices.
 
+    The interpolation is computed for all the steps (and all the pairs of rotations, if a batch is given)
+    at once.
+
     Args:
-        R1 (torch.Tensor): The first rotation matrix (4x4).
-        R2 (torch.Tensor): The second rotation matrix (4x4).
+        R1 (torch.Tensor): The first rotation matrix. Shape is (..., 3, 3).
+        R2 (torch.Tensor): The second rotation matrix. Shape is (..., 3, 3).
         num_steps (int): The number of desired interpolated rotations (excluding start and end).
         axis_angle (bool, optional): If True, interpolate in axis-angle representation. Else, use slerp. Defaults to True.
 
     Returns:
-        torch.Tensor: A stack of interpolated rotation matrices (shape: (num_steps + 1, 4, 4)),
+        torch.Tensor: A stack of interpolated rotation matrices (shape: (num_steps + 1, ..., 3, 3)),
                       including the start and end rotations.
     """
     assert isinstance(R1, torch.Tensor), "Input must be a torch tensor"
     assert isinstance(R2, torch.Tensor), "Input must be a torch tensor"
+    batch_shape = R1.shape[:-2]
+    # interpolation coefficient of each step, broadcastable against the batch
+    steps = torch.arange(num_steps, dtype=R1.dtype, device=R1.device).view((num_steps,) + (1,) * len(batch_shape))
     if axis_angle:
         # delta rotation expressed as axis-angle
         delta_rot_mat = torch.matmul(R2, R1.transpose(-1, -2))
@@ -1702,28 +1708,36 @@ def interpolate_rotations(R1, R2, num_steps, axis_angle=True):
         delta_axis_angle = axis_angle_from_quat(delta_quat)
 
         # Grab angle
-        delta_angle = torch.linalg.norm(delta_axis_angle)
+        delta_angle = torch.linalg.norm(delta_axis_angle, dim=-1)
 
         # fix the axis, and chunk the angle up into steps
         rot_step_size = delta_angle / num_steps
 
         # convert into delta rotation matrices, and then convert to absolute rotations
-        if delta_angle < 0.05:
-            # small angle - don't bother with interpolation
-            rot_steps = torch.stack([R2 for _ in range(num_steps)])
-        else:
-            # make sure that axis is a unit vector
-            delta_axis = delta_axis_angle / delta_angle
-            delta_rot_steps = [
-                matrix_from_quat(quat_from_angle_axis(i * rot_step_size, delta_axis)) for i in range(num_steps)
-            ]
-            rot_steps = torch.stack([torch.matmul(delta_rot_steps[i], R1) for i in range(num_steps)])
+        # note: the axis is not a unit vector for small angles, but the result is discarded below
+        delta_axis = delta_axis_angle / delta_angle.unsqueeze(-1)
+        angles = steps * rot_step_size
+        delta_rot_steps = matrix_from_quat(quat_from_angle_axis(angles, delta_axis.expand(angles.shape + (3,))))
+        rot_steps = torch.matmul(delta_rot_steps, R1)
+        # small angle - don't bother with interpolation
+        is_small_angle = (delta_angle < 0.05)[..., None, None]
+        rot_steps = torch.where(is_small_angle, R2.expand_as(rot_steps), rot_steps)
     else:
         q1 = quat_from_matrix(R1)
         q2 = quat_from_matrix(R2)
-        rot_steps = torch.stack(
-            [matrix_from_quat(quat_slerp(q1, q2, tau=float(i) / num_steps)) for i in range(num_steps)]
-        )
+        # invert the rotation to take the shortest path
+        d = torch.sum(q1 * q2, dim=-1, keepdim=True)
+        q2 = torch.where(d < 0.0, -q2, q2)
+        d = torch.abs(d)
+        angle = torch.acos(torch.clamp(d, -1, 1))
+        # spherical linear interpolation of all the steps
+        tau = (steps / num_steps).unsqueeze(-1)
+        q_steps = (q1 * torch.sin((1.0 - tau) * angle) + q2 * torch.sin(tau * angle)) / torch.sin(angle)
+        # the rotations are the same - return the first one
+        eps = torch.finfo(q1.dtype).eps * 4.0
+        is_same = (torch.abs(d - 1.0) < eps) | (angle < eps)
+        q_steps = torch.where(is_same, q1.expand_as(q_steps), q_steps)
+        rot_steps = matrix_from_quat(q_steps)
 
     # add in endpoint
     rot_steps = torch.cat([rot_steps, R2[None]], dim=0)
@@ -1735,18 +1749,22 @@ def interpolate_poses(pose_1, pose_2, num_steps=None, step_size=None, perturb=Fa
     """
     Linear interpolation between two poses.
 
+    The interpolation is computed for all the steps (and all the pairs of poses, if a batch is given) at once.
+
     Args:
-        pose_1 (torch.tensor): 4x4 start pose
-        pose_2 (torch.tensor): 4x4 end pose
+        pose_1 (torch.tensor): start pose. Shape is (..., 4, 4).
+        pose_2 (torch.tensor): end pose. Shape is (..., 4, 4).
         num_steps (int): if provided, specifies the number of desired interpolated points (not excluding
             the start and end points). Passing 0 corresponds to no interpolation, and passing None
             means that @step_size must be provided to determine the number of interpolated points.
         step_size (float): if provided, will be used to infer the number of steps, by taking the norm
-            of the delta position vector, and dividing it by the step size
+            of the delta position vector, and dividing it by the step size. For a batch of poses, the
+            largest norm of the batch is used.
         perturb (bool): if True, randomly move all the interpolated position points in a uniform, non-overlapping grid.
 
     Returns:
-        pose_steps (torch.tensor): array of shape (N + 2, 3) corresponding to the interpolated pose path, where N is @num_steps
+        pose_steps (torch.tensor): array of shape (N + 2, ..., 4, 4) corresponding to the interpolated pose path,
+            where N is @num_steps
         num_steps (int): the number of interpolated points (N) in the path
     """
     assert isinstance(pose_1, torch.Tensor), "Input must be a torch tensor"
@@ -1758,16 +1776,13 @@ def interpolate_poses(pose_1, pose_2, num_steps=None, step_size=None, perturb=Fa
 
     if num_steps == 0:
         # skip interpolation
-        return (
-            torch.cat([pos1[None], pos2[None]], dim=0),
-            torch.cat([rot1[None], rot2[None]], dim=0),
-            num_steps,
-        )
+        return torch.stack([pose_1, pose_2]), num_steps
 
     delta_pos = pos2 - pos1
     if num_steps is None:
-        assert torch.norm(delta_pos) > 0
-        num_steps = math.ceil(torch.norm(delta_pos) / step_size)
+        delta_norm = torch.max(torch.linalg.norm(delta_pos, dim=-1))
+        assert delta_norm > 0
+        num_steps = math.ceil(delta_norm / step_size)
 
     num_steps += 1  # include starting pose
     assert num_steps >= 2
@@ -1779,7 +1794,8 @@ def interpolate_poses(pose_1, pose_2, num_steps=None, step_size=None, perturb=Fa
         # move the interpolation grid points by up to a half-size forward or backward
         perturbations = torch.rand(num_steps - 2) - 0.5
         grid[1:-1] += perturbations
-    pos_steps = torch.stack([pos1 + grid[i] * pos_step_size for i in range(num_steps)])
+    grid = grid.to(device=pos1.device, dtype=pos1.dtype).view((num_steps,) + (1,) * pos1.dim())
+    pos_steps = pos1 + grid * pos_step_size
 
     # add in endpoint
     pos_steps = torch.cat([pos_steps, pos2[None]], dim=0)
@@ -1807,16 +1823,13 @@ def transform_poses_from_frame_A_to_frame_B(src_poses, frame_A, frame_B):
         transformed_eef_poses (torch.tensor): transformed pose sequence (shape [T, 4, 4])
     """
 
-    # transform source end effector poses to be relative to source object frame
-    src_poses_rel_frame_B = pose_in_A_to_pose_in_B(
-        pose_in_A=src_poses,
-        pose_A_in_B=pose_inv(frame_B[None]),
-    )
+    # transformation expressing the poses relative to the source object frame in the current object frame
+    frame_B_to_frame_A = pose_in_A_to_pose_in_B(pose_in_A=pose_inv(frame_B), pose_A_in_B=frame_A)
 
-    # apply relative poses to current object frame to obtain new target eef poses
+    # apply the transformation to the whole segment at once to obtain new target eef poses
     transformed_poses = pose_in_A_to_pose_in_B(
-        pose_in_A=src_poses_rel_frame_B,
-        pose_A_in_B=frame_A[None],
+        pose_in_A=src_poses,
+        pose_A_in_B=frame_B_to_frame_A[None],
     )
     return transformed_poses
 
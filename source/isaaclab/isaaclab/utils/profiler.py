@@ -0,0 +1,323 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sub-module for a profiler that measures the time spent in named sections of a step."""
+
+from __future__ import annotations
+
+import json
+import time
+import torch
+from collections import deque
+from collections.abc import Callable
+from prettytable import PrettyTable
+from typing import Any
+
+
+class StepProfiler:
+    """A profiler for the time spent in named sections of a repeated step.
+
+    A section is timed between the calls to :meth:`start` and :meth:`stop` with its name. Sections can also be
+    timed with the context manager returned by :meth:`section`, or by wrapping a callable with :meth:`wrap`.
+    The times of a section are summed over each step, which is ended by calling :meth:`step`. The statistics
+    of a section are computed over the times of the last :attr:`window_size` steps.
+
+    For a CUDA device, the sections are timed with CUDA events recorded on the current stream. The elapsed
+    times are only read once the events have completed, which is checked without blocking at the end of each
+    step. Thus, profiling does not synchronize the host with the device. On the CPU, the sections are timed
+    with :func:`time.perf_counter`.
+
+    .. code-block:: python
+
+        from isaaclab.utils.profiler import StepProfiler
+
+        profiler = StepProfiler(device="cuda:0")
+
+        for _ in range(100):
+            with profiler.section("compute"):
+                compute()
+            profiler.step()
+
+        print(profiler.to_table())
+
+    """
+
+    def __init__(self, device: str = "cpu", window_size: int = 100):
+        """Initializes the profiler.
+
+        Args:
+            device: The device on which the profiled operations are executed. Defaults to "cpu".
+            window_size: The number of steps over which the statistics are computed. Defaults to 100.
+
+        Raises:
+            ValueError: If the window size is less than 1.
+        """
+        if window_size < 1:
+            raise ValueError(f"The window size of the profiler must be at least 1. Received: {window_size}.")
+        self._use_cuda_events = torch.device(device).type == "cuda"
+        self._window_size = window_size
+        # times of the sections summed per step (in milliseconds)
+        self._section_times: dict[str, deque[float]] = dict()
+        # start markers of the running sections
+        self._running_sections: dict[str, Any] = dict()
+        # finished sections whose time has not been read yet: (step index, name, start marker, end marker)
+        self._pending_sections: deque[tuple[int, str, Any, Any]] = deque()
+        # times of the sections of the step that is being collected
+        self._collected_step_index = 0
+        self._collected_step_times: dict[str, float] = dict()
+        # index of the current step
+        self._step_index = 0
+        # reusable objects
+        self._event_pool: list[torch.cuda.Event] = list()
+        self._section_contexts: dict[str, _ProfilerSection] = dict()
+
+    def __str__(self) -> str:
+        """Returns the table of the statistics of the sections."""
+        return self.to_table()
+
+    """
+    Properties
+    """
+
+    @property
+    def window_size(self) -> int:
+        """The number of steps over which the statistics are computed."""
+        return self._window_size
+
+    @property
+    def num_steps(self) -> int:
+        """The number of steps ended with :meth:`step`."""
+        return self._step_index
+
+    """
+    Operations - Timing.
+    """
+
+    def start(self, name: str):
+        """Start timing a section.
+
+        Args:
+            name: The name of the section.
+
+        Raises:
+            RuntimeError: If the section is already running.
+        """
+        if name in self._running_sections:
+            raise RuntimeError(f"Profiler section '{name}' is already running.")
+        self._running_sections[name] = self._record()
+
+    def stop(self, name: str):
+        """Stop timing a section.
+
+        Args:
+            name: The name of the section.
+
+        Raises:
+            RuntimeError: If the section is not running.
+        """
+        if name not in self._running_sections:
+            raise RuntimeError(f"Profiler section '{name}' is not running.")
+        start = self._running_sections.pop(name)
+        self._pending_sections.append((self._step_index, name, start, self._record()))
+
+    def section(self, name: str) -> _ProfilerSection:
+        """Get a context manager that times a section.
+
+        Args:
+            name: The name of the section.
+
+        Returns:
+            The context manager of the section. It is created once per name and can be reused.
+        """
+        if name not in self._section_contexts:
+            self._section_contexts[name] = _ProfilerSection(self, name)
+        return self._section_contexts[name]
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """Wrap a callable so that each of its calls is timed as a section.
+
+        The attributes of the callable are accessible through the wrapper. This allows wrapping instances of
+        classes that implement :meth:`__call__`, such as class-based manager terms.
+
+        Args:
+            name: The name of the section.
+            func: The callable to wrap.
+
+        Returns:
+            The wrapped callable.
+        """
+        return _ProfiledCallable(self, name, func)
+
+    def step(self):
+        """End the current step and collect the times of the finished sections.
+
+        This does not wait for the device. The times of sections that have not finished on the device yet are
+        collected at a later step.
+        """
+        self._step_index += 1
+        self._collect(wait=False)
+
+    def synchronize(self):
+        """Wait for the device and collect the times of all the finished sections."""
+        if self._use_cuda_events:
+            torch.cuda.synchronize()
+        self._collect(wait=True)
+
+    def reset(self):
+        """Clear the collected times of all the sections."""
+        # discard the sections whose time has not been read yet
+        if self._use_cuda_events:
+            for _, _, start, end in self._pending_sections:
+                self._event_pool.extend((start, end))
+        self._pending_sections.clear()
+        self._section_times.clear()
+        self._collected_step_times.clear()
+        self._collected_step_index = self._step_index
+
+    """
+    Operations - Export.
+    """
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        """Get the statistics of the sections over the last steps.
+
+        Returns:
+            The statistics of each section, sorted by name. The statistics are the mean, minimum, maximum and last
+            time (in milliseconds) per step, and the number of steps that are used.
+        """
+        stats = dict()
+        for name in sorted(self._section_times):
+            times = self._section_times[name]
+            stats[name] = {
+                "mean_ms": sum(times) / len(times),
+                "min_ms": min(times),
+                "max_ms": max(times),
+                "last_ms": times[-1],
+                "num_steps": len(times),
+            }
+        return stats
+
+    def get_log(self, prefix: str = "Profile/") -> dict[str, float]:
+        """Get the mean time (in milliseconds) per step of each section for logging.
+
+        Args:
+            prefix: The prefix of the keys. Defaults to "Profile/".
+
+        Returns:
+            The mean time of each section, with the prefixed section names as keys.
+        """
+        return {f"{prefix}{name}": sum(times) / len(times) for name, times in self._section_times.items()}
+
+    def to_table(self) -> str:
+        """Get the statistics of the sections as a table.
+
+        Returns:
+            The table of the statistics as a string.
+        """
+        table = PrettyTable()
+        table.title = f"Step Profile (last {self._window_size} steps)"
+        table.field_names = ["Section", "Mean (ms)", "Min (ms)", "Max (ms)", "Last (ms)", "Steps"]
+        table.align["Section"] = "l"
+        for name, stats in self.get_stats().items():
+            table.add_row([
+                name,
+                f"{stats['mean_ms']:.4f}",
+                f"{stats['min_ms']:.4f}",
+                f"{stats['max_ms']:.4f}",
+                f"{stats['last_ms']:.4f}",
+                stats["num_steps"],
+            ])
+        return table.get_string()
+
+    def to_json(self, **kwargs) -> str:
+        """Get the statistics of the sections as a JSON string.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to :func:`json.dumps`.
+
+        Returns:
+            The statistics of the sections (see :meth:`get_stats`) as a JSON string.
+        """
+        return json.dumps(self.get_stats(), **kwargs)
+
+    """
+    Helper functions.
+    """
+
+    def _record(self) -> torch.cuda.Event | float:
+        """Record a time marker on the current stream of the device or on the host."""
+        if not self._use_cuda_events:
+            return time.perf_counter()
+        event = self._event_pool.pop() if self._event_pool else torch.cuda.Event(enable_timing=True)
+        event.record()
+        return event
+
+    def _collect(self, wait: bool):
+        """Read the times of the finished sections and add them to the statistics of their steps."""
+        while self._pending_sections:
+            step_index, name, start, end = self._pending_sections[0]
+            # read the elapsed time
+            if self._use_cuda_events:
+                if not wait and not end.query():
+                    break
+                elapsed_time = start.elapsed_time(end)
+                self._event_pool.extend((start, end))
+            else:
+                elapsed_time = (end - start) * 1000.0
+            self._pending_sections.popleft()
+            # sum the time over the step of the section
+            if step_index != self._collected_step_index:
+                self._flush_step_times()
+                self._collected_step_index = step_index
+            self._collected_step_times[name] = self._collected_step_times.get(name, 0.0) + elapsed_time
+        # add the times of the last step once it has ended and all its sections are collected
+        if not self._pending_sections and self._collected_step_index < self._step_index:
+            self._flush_step_times()
+            self._collected_step_index = self._step_index
+
+    def _flush_step_times(self):
+        """Add the summed times of the collected step to the statistics of the sections."""
+        for name, elapsed_time in self._collected_step_times.items():
+            if name not in self._section_times:
+                self._section_times[name] = deque(maxlen=self._window_size)
+            self._section_times[name].append(elapsed_time)
+        self._collected_step_times.clear()
+
+
+class _ProfilerSection:
+    """Context manager that times a section of a :class:`StepProfiler`."""
+
+    def __init__(self, profiler: StepProfiler, name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._profiler.start(self._name)
+
+    def __exit__(self, *exc_info):
+        self._profiler.stop(self._name)
+
+
+class _ProfiledCallable:
+    """Callable that times the calls of another callable with a :class:`StepProfiler`."""
+
+    def __init__(self, profiler: StepProfiler, name: str, func: Callable):
+        self._profiler = profiler
+        self._name = name
+        self._func = func
+
+    def __call__(self, *args, **kwargs):
+        self._profiler.start(self._name)
+        try:
+            return self._func(*args, **kwargs)
+        finally:
+            self._profiler.stop(self._name)
+
+    def __getattr__(self, name: str) -> Any:
+        # forward the attributes of the wrapped callable (for instance, the reset of class-based terms)
+        # note: the check avoids an infinite recursion if the wrapper is not initialized (e.g. when copied)
+        if name == "_func":
+            raise AttributeError(name)
+        return getattr(self._func, name)
@@ -6,6 +6,7 @@
 """Sub-module containing utilities for transforming strings and regular expressions."""
 
 import ast
+import functools
 import importlib
 import inspect
 import re
@@ -214,61 +215,9 @@ def resolve_matching_names(
     if isinstance(keys, str):
         keys = [keys]
     # find matching patterns
-    index_list = []
-    names_list = []
-    key_idx_list = []
-    # book-keeping to check that we always have a one-to-one mapping
-    # i.e. each target string should match only one regular expression
-    target_strings_match_found = [None for _ in range(len(list_of_strings))]
-    keys_match_found = [[] for _ in range(len(keys))]
-    # loop over all target strings
-    for target_index, potential_match_string in enumerate(list_of_strings):
-        for key_index, re_key in enumerate(keys):
-            if re.fullmatch(re_key, potential_match_string):
-                # check if match already found
-                if target_strings_match_found[target_index]:
-                    raise ValueError(
-                        f"Multiple matches for '{potential_match_string}':"
-                        f" '{target_strings_match_found[target_index]}' and '{re_key}'!"
-                    )
-                # add to list
-                target_strings_match_found[target_index] = re_key
-                index_list.append(target_index)
-                names_list.append(potential_match_string)
-                key_idx_list.append(key_index)
-                # add for regex key
-                keys_match_found[key_index].append(potential_match_string)
-    # reorder keys if they should be returned in order of the query keys
-    if preserve_order:
-        reordered_index_list = [None] * len(index_list)
-        global_index = 0
-        for key_index in range(len(keys)):
-            for key_idx_position, key_idx_entry in enumerate(key_idx_list):
-                if key_idx_entry == key_index:
-                    reordered_index_list[key_idx_position] = global_index
-                    global_index += 1
-        # reorder index and names list
-        index_list_reorder = [None] * len(index_list)
-        names_list_reorder = [None] * len(index_list)
-        for idx, reorder_idx in enumerate(reordered_index_list):
-            index_list_reorder[reorder_idx] = index_list[idx]
-            names_list_reorder[reorder_idx] = names_list[idx]
-        # update
-        index_list = index_list_reorder
-        names_list = names_list_reorder
-    # check that all regular expressions are matched
-    if not all(keys_match_found):
-        # make this print nicely aligned for debugging
-        msg = "\n"
-        for key, value in zip(keys, keys_match_found):
-            msg += f"\t{key}: {value}\n"
-        msg += f"Available strings: {list_of_strings}\n"
-        # raise error
-        raise ValueError(
-            f"Not all regular expressions are matched! Please check that the regular expressions are correct: {msg}"
-        )
+    index_list, names_list, _ = _resolve_matching_names(tuple(keys), tuple(list_of_strings), preserve_order)
     # return
-    return index_list, names_list
+    return list(index_list), list(names_list)
 
 
 def resolve_matching_names_values(
@@ -306,63 +255,96 @@ def resolve_matching_names_values(
     if not isinstance(data, dict):
         raise TypeError(f"Input argument `data` should be a dictionary. Received: {data}")
     # find matching patterns
+    index_list, names_list, key_index_list = _resolve_matching_names(
+        tuple(data.keys()), tuple(list_of_strings), preserve_order
+    )
+    # obtain the values of the matched keys
+    values = list(data.values())
+    values_list = [values[key_index] for key_index in key_index_list]
+    # return
+    return list(index_list), list(names_list), values_list
+
+
+"""
+Regex operations - Helper functions.
+"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compiles a regular expression. The compiled expressions are cached."""
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_matching_names(
+    keys: tuple[str, ...], list_of_strings: tuple[str, ...], preserve_order: bool
+) -> tuple[tuple[int, ...], tuple[str, ...], tuple[int, ...]]:
+    """Match the query regular expressions against the strings and return the matched indices, names and key indices.
+
+    This implements :func:`resolve_matching_names` and :func:`resolve_matching_names_values`. The results are
+    memoized on the query regular expressions and the strings, since the same joint and body names are resolved by
+    many terms and actuators at the construction of an environment.
+
+    Args:
+        keys: The regular expressions to match the strings in the list.
+        list_of_strings: The strings to match.
+        preserve_order: Whether to preserve the order of the query keys in the returned values.
+
+    Returns:
+        A tuple containing the matched indices, the matched names and the index of the key matching each name.
+
+    Raises:
+        ValueError: When multiple matches are found for a string in the list.
+        ValueError: When not all regular expressions are matched.
+    """
+    compiled_keys = [_compile_pattern(re_key) for re_key in keys]
+    # find matching patterns
     index_list = []
     names_list = []
-    values_list = []
     key_idx_list = []
     # book-keeping to check that we always have a one-to-one mapping
     # i.e. each target string should match only one regular expression
     target_strings_match_found = [None for _ in range(len(list_of_strings))]
-    keys_match_found = [[] for _ in range(len(data))]
+    keys_match_found = [[] for _ in range(len(keys))]
     # loop over all target strings
     for target_index, potential_match_string in enumerate(list_of_strings):
-        for key_index, (re_key, value) in enumerate(data.items()):
-            if re.fullmatch(re_key, potential_match_string):
+        for key_index, compiled_key in enumerate(compiled_keys):
+            if compiled_key.fullmatch(potential_match_string):
                 # check if match already found
                 if target_strings_match_found[target_index]:
                     raise ValueError(
                         f"Multiple matches for '{potential_match_string}':"
-                        f" '{target_strings_match_found[target_index]}' and '{re_key}'!"
+                        f" '{target_strings_match_found[target_index]}' and '{keys[key_index]}'!"
                     )
                 # add to list
-                target_strings_match_found[target_index] = re_key
+                target_strings_match_found[target_index] = keys[key_index]
                 index_list.append(target_index)
                 names_list.append(potential_match_string)
-                values_list.append(value)
                 key_idx_list.append(key_index)
                 # add for regex key
                 keys_match_found[key_index].append(potential_match_string)
-    # reorder keys if they should be returned in order of the query keys
-    if preserve_order:
-        reordered_index_list = [None] * len(index_list)
-        global_index = 0
-        for key_index in range(len(data)):
-            for key_idx_position, key_idx_entry in enumerate(key_idx_list):
-                if key_idx_entry == key_index:
-                    reordered_index_list[key_idx_position] = global_index
-                    global_index += 1
-        # reorder index and names list
-        index_list_reorder = [None] * len(index_list)
-        names_list_reorder = [None] * len(index_list)
-        values_list_reorder = [None] * len(index_list)
-        for idx, reorder_idx in enumerate(reordered_index_list):
-            index_list_reorder[reorder_idx] = index_list[idx]
-            names_list_reorder[reorder_idx] = names_list[idx]
-            values_list_reorder[reorder_idx] = values_list[idx]
-        # update
-        index_list = index_list_reorder
-        names_list = names_list_reorder
-        values_list = values_list_reorder
     # check that all regular expressions are matched
     if not all(keys_match_found):
         # make this print nicely aligned for debugging
         msg = "\n"
-        for key, value in zip(data.keys(), keys_match_found):
+        for key, value in zip(keys, keys_match_found):
             msg += f"\t{key}: {value}\n"
-        msg += f"Available strings: {list_of_strings}\n"
+        msg += f"Available strings: {list(list_of_strings)}\n"
         # raise error
         raise ValueError(
             f"Not all regular expressions are matched! Please check that the regular expressions are correct: {msg}"
         )
+    # reorder keys if they should be returned in order of the query keys
+    if preserve_order:
+        # group the matches by key, keeping the order of the strings within each key
+        matches_per_key = [[] for _ in range(len(keys))]
+        for match_idx, key_index in enumerate(key_idx_list):
+            matches_per_key[key_index].append(match_idx)
+        reordered_matches = [match_idx for matches in matches_per_key for match_idx in matches]
+        # reorder index and names list
+        index_list = [index_list[match_idx] for match_idx in reordered_matches]
+        names_list = [names_list[match_idx] for match_idx in reordered_matches]
+        key_idx_list = [key_idx_list[match_idx] for match_idx in reordered_matches]
     # return
-    return index_list, names_list, values_list
+    return tuple(index_list), tuple(names_list), tuple(key_idx_list)
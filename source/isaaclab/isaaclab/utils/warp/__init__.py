@@ -5,4 +5,4 @@
 
 """Sub-module containing operations based on warp."""
 
-from .ops import convert_to_warp_mesh, raycast_mesh
+from .ops import compute_mesh_instance_bounds, convert_to_warp_mesh, raycast_mesh, raycast_mesh_instances
@@ -75,6 +75,132 @@ def raycast_mesh_kernel(
             ray_face_id[tid] = f
 
 
+@wp.kernel(enable_backward=False)
+def raycast_mesh_instances_kernel(
+    bvh: wp.uint64,
+    mesh_ids: wp.array(dtype=wp.uint64),
+    mesh_transforms: wp.array(dtype=wp.transform),
+    ray_starts: wp.array(dtype=wp.vec3),
+    ray_directions: wp.array(dtype=wp.vec3),
+    ray_hits: wp.array(dtype=wp.vec3),
+    ray_distance: wp.array(dtype=wp.float32),
+    ray_normal: wp.array(dtype=wp.vec3),
+    ray_face_id: wp.array(dtype=wp.int32),
+    max_dist: float = 1e6,
+    return_distance: int = False,
+    return_normal: int = False,
+    return_face_id: int = False,
+):
+    """Performs ray-casting against a set of mesh instances.
+
+    The mesh instances are found with the bounding volume hierarchy (BVH) over their world-frame bounding boxes.
+    Each ray is transformed into the frames of the instances whose bounding box it intersects, and ray-cast
+    against the corresponding mesh. The closest hit over all the instances is stored.
+
+    The transforms of the instances must be rigid (i.e. without scaling), so that the hit distances are the
+    same in the frames of the instances and in the world frame.
+
+    Args:
+        bvh: The BVH over the bounding boxes of the mesh instances.
+        mesh_ids: The ids of the warp meshes of the instances. Shape is (M,).
+        mesh_transforms: The transforms of the instances from their mesh frame to the world frame. Shape is (M,).
+        ray_starts: The input ray start positions. Shape is (N, 3).
+        ray_directions: The input ray directions. Shape is (N, 3).
+        ray_hits: The output ray hit positions. Shape is (N, 3).
+        ray_distance: The output ray hit distances. Shape is (N,), if `return_distance` is True. Otherwise,
+            this array is not used.
+        ray_normal: The output ray hit normals. Shape is (N, 3), if `return_normal` is True. Otherwise,
+            this array is not used.
+        ray_face_id: The output ray hit face ids. Shape is (N,), if `return_face_id` is True. Otherwise,
+            this array is not used.
+        max_dist: The maximum ray-cast distance. Defaults to 1e6.
+        return_distance: Whether to return the ray hit distances. Defaults to False.
+        return_normal: Whether to return the ray hit normals. Defaults to False`.
+        return_face_id: Whether to return the ray hit face ids. Defaults to False.
+    """
+    # get the thread id
+    tid = wp.tid()
+    ray_start = ray_starts[tid]
+    ray_direction = ray_directions[tid]
+
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+
+    # closest hit over all the instances
+    closest_t = float(max_dist)
+    closest_n = wp.vec3()
+    closest_f = int(0)
+    closest_instance = int(-1)
+
+    # iterate over the instances whose bounding box is intersected by the ray
+    query = wp.bvh_query_ray(bvh, ray_start, ray_direction)
+    instance = int(0)
+    while wp.bvh_query_next(query, instance):
+        # transform the ray into the frame of the instance
+        transform = mesh_transforms[instance]
+        inv_transform = wp.transform_inverse(transform)
+        local_start = wp.transform_point(inv_transform, ray_start)
+        local_direction = wp.transform_vector(inv_transform, ray_direction)
+        # ray cast against the mesh of the instance up to the closest hit so far
+        hit_success = wp.mesh_query_ray(
+            mesh_ids[instance], local_start, local_direction, closest_t, t, u, v, sign, n, f
+        )
+        if hit_success and t < closest_t:
+            closest_t = t
+            closest_n = wp.transform_vector(transform, n)
+            closest_f = f
+            closest_instance = instance
+
+    # if the ray hit, store the hit data
+    if closest_instance >= 0:
+        ray_hits[tid] = ray_start + closest_t * ray_direction
+        if return_distance == 1:
+            ray_distance[tid] = closest_t
+        if return_normal == 1:
+            ray_normal[tid] = closest_n
+        if return_face_id == 1:
+            ray_face_id[tid] = closest_f
+
+
+@wp.kernel(enable_backward=False)
+def compute_mesh_instance_bounds_kernel(
+    local_lowers: wp.array(dtype=wp.vec3),
+    local_uppers: wp.array(dtype=wp.vec3),
+    mesh_transforms: wp.array(dtype=wp.transform),
+    lowers: wp.array(dtype=wp.vec3),
+    uppers: wp.array(dtype=wp.vec3),
+):
+    """Computes the world-frame axis-aligned bounding boxes of a set of mesh instances.
+
+    Args:
+        local_lowers: The lower corners of the bounding boxes in the mesh frames. Shape is (M, 3).
+        local_uppers: The upper corners of the bounding boxes in the mesh frames. Shape is (M, 3).
+        mesh_transforms: The transforms of the instances from their mesh frame to the world frame. Shape is (M,).
+        lowers: The output lower corners of the bounding boxes in the world frame. Shape is (M, 3).
+        uppers: The output upper corners of the bounding boxes in the world frame. Shape is (M, 3).
+    """
+    # get the thread id
+    tid = wp.tid()
+    transform = mesh_transforms[tid]
+
+    # transform the center of the box
+    center = wp.transform_point(transform, 0.5 * (local_lowers[tid] + local_uppers[tid]))
+    half_extents = 0.5 * (local_uppers[tid] - local_lowers[tid])
+    # compute the half extents of the rotated box along the world axes
+    rot = wp.quat_to_matrix(wp.transform_get_rotation(transform))
+    extents = wp.vec3(
+        wp.abs(rot[0, 0]) * half_extents[0] + wp.abs(rot[0, 1]) * half_extents[1] + wp.abs(rot[0, 2]) * half_extents[2],
+        wp.abs(rot[1, 0]) * half_extents[0] + wp.abs(rot[1, 1]) * half_extents[1] + wp.abs(rot[1, 2]) * half_extents[2],
+        wp.abs(rot[2, 0]) * half_extents[0] + wp.abs(rot[2, 1]) * half_extents[1] + wp.abs(rot[2, 2]) * half_extents[2],
+    )
+    lowers[tid] = center - extents
+    uppers[tid] = center + extents
+
+
 @wp.kernel(enable_backward=False)
 def reshape_tiled_image(
     tiled_image_buffer: Any,
@@ -8,6 +8,7 @@
 # needed to import for allowing type-hinting: torch.Tensor | None
 from __future__ import annotations
 
+import contextlib
 import numpy as np
 import torch
 
@@ -127,6 +128,165 @@ def raycast_mesh(
     return ray_hits.to(device).view(shape), ray_distance, ray_normal, ray_face_id
 
 
+def raycast_mesh_instances(
+    ray_starts: torch.Tensor,
+    ray_directions: torch.Tensor,
+    bvh: wp.Bvh,
+    mesh_ids: wp.array,
+    mesh_transforms: torch.Tensor,
+    max_dist: float = 1e6,
+    return_distance: bool = False,
+    return_normal: bool = False,
+    return_face_id: bool = False,
+) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
+    """Performs ray-casting against a set of mesh instances.
+
+    All the rays are ray-cast against all the instances in a single kernel launch. The instances intersected
+    by each ray are found with a bounding volume hierarchy (BVH) over their world-frame bounding boxes, which
+    can be updated with :func:`compute_mesh_instance_bounds` when the instances move.
+
+    Note that the `ray_starts` and `ray_directions`, and `ray_hits` should have compatible shapes
+    and data types to ensure proper execution. Additionally, they all must be in the world frame.
+
+    Args:
+        ray_starts: The starting position of the rays. Shape (N, 3).
+        ray_directions: The ray directions for each ray. Shape (N, 3).
+        bvh: The warp BVH over the world-frame bounding boxes of the instances.
+        mesh_ids: The ids of the warp meshes of the instances. Shape (M,).
+        mesh_transforms: The rigid transforms of the instances from their mesh frame to the world frame,
+            as position and quaternion (x, y, z, w). Shape (M, 7).
+        max_dist: The maximum distance to ray-cast. Defaults to 1e6.
+        return_distance: Whether to return the distance of the ray until it hits the mesh. Defaults to False.
+        return_normal: Whether to return the normal of the mesh face the ray hits. Defaults to False.
+        return_face_id: Whether to return the face id of the mesh face the ray hits. Defaults to False.
+
+    Returns:
+        The ray hit position. Shape (N, 3).
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit distance. Shape (N,).
+            Will only return if :attr:`return_distance` is True, else returns None.
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit normal. Shape (N, 3).
+            Will only return if :attr:`return_normal` is True else returns None.
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit face id. Shape (N,).
+            Will only return if :attr:`return_face_id` is True else returns None.
+            The returned tensor contains :obj:`int(-1)` for missed hits.
+    """
+    # extract device and shape information
+    shape = ray_starts.shape
+    device = ray_starts.device
+    # device of the BVH
+    torch_device = wp.device_to_torch(bvh.device)
+    # reshape the tensors
+    ray_starts = ray_starts.to(torch_device).view(-1, 3).contiguous()
+    ray_directions = ray_directions.to(torch_device).view(-1, 3).contiguous()
+    num_rays = ray_starts.shape[0]
+    # create output tensor for the ray hits
+    ray_hits = torch.full((num_rays, 3), float("inf"), device=torch_device).contiguous()
+
+    # map the memory to warp arrays
+    ray_starts_wp = wp.from_torch(ray_starts, dtype=wp.vec3)
+    ray_directions_wp = wp.from_torch(ray_directions, dtype=wp.vec3)
+    ray_hits_wp = wp.from_torch(ray_hits, dtype=wp.vec3)
+    mesh_transforms_wp = wp.from_torch(mesh_transforms.to(torch_device).contiguous(), dtype=wp.transform)
+
+    if return_distance:
+        ray_distance = torch.full((num_rays,), float("inf"), device=torch_device).contiguous()
+        ray_distance_wp = wp.from_torch(ray_distance, dtype=wp.float32)
+    else:
+        ray_distance = None
+        ray_distance_wp = wp.empty((1,), dtype=wp.float32, device=torch_device)
+
+    if return_normal:
+        ray_normal = torch.full((num_rays, 3), float("inf"), device=torch_device).contiguous()
+        ray_normal_wp = wp.from_torch(ray_normal, dtype=wp.vec3)
+    else:
+        ray_normal = None
+        ray_normal_wp = wp.empty((1,), dtype=wp.vec3, device=torch_device)
+
+    if return_face_id:
+        ray_face_id = torch.ones((num_rays,), dtype=torch.int32, device=torch_device).contiguous() * (-1)
+        ray_face_id_wp = wp.from_torch(ray_face_id, dtype=wp.int32)
+    else:
+        ray_face_id = None
+        ray_face_id_wp = wp.empty((1,), dtype=wp.int32, device=torch_device)
+
+    # launch the warp kernel
+    wp.launch(
+        kernel=kernels.raycast_mesh_instances_kernel,
+        dim=num_rays,
+        inputs=[
+            bvh.id,
+            mesh_ids,
+            mesh_transforms_wp,
+            ray_starts_wp,
+            ray_directions_wp,
+            ray_hits_wp,
+            ray_distance_wp,
+            ray_normal_wp,
+            ray_face_id_wp,
+            float(max_dist),
+            int(return_distance),
+            int(return_normal),
+            int(return_face_id),
+        ],
+        device=bvh.device,
+        stream=_get_torch_stream(torch_device),
+    )
+
+    if return_distance:
+        ray_distance = ray_distance.to(device).view(shape[0], shape[1])
+    if return_normal:
+        ray_normal = ray_normal.to(device).view(shape)
+    if return_face_id:
+        ray_face_id = ray_face_id.to(device).view(shape[0], shape[1])
+
+    return ray_hits.to(device).view(shape), ray_distance, ray_normal, ray_face_id
+
+
+def compute_mesh_instance_bounds(
+    local_lowers: torch.Tensor,
+    local_uppers: torch.Tensor,
+    mesh_transforms: torch.Tensor,
+    lowers: torch.Tensor,
+    uppers: torch.Tensor,
+    bvh: wp.Bvh | None = None,
+):
+    """Computes the world-frame axis-aligned bounding boxes of a set of mesh instances.
+
+    The bounding boxes are written in-place into :attr:`lowers` and :attr:`uppers`. If a warp BVH built
+    over these tensors is provided, it is refit to the new bounding boxes.
+
+    Args:
+        local_lowers: The lower corners of the bounding boxes in the mesh frames. Shape (M, 3).
+        local_uppers: The upper corners of the bounding boxes in the mesh frames. Shape (M, 3).
+        mesh_transforms: The rigid transforms of the instances from their mesh frame to the world frame,
+            as position and quaternion (x, y, z, w). Shape (M, 7).
+        lowers: The output lower corners of the bounding boxes in the world frame. Shape (M, 3).
+        uppers: The output upper corners of the bounding boxes in the world frame. Shape (M, 3).
+        bvh: The warp BVH over :attr:`lowers` and :attr:`uppers` to refit. Defaults to None.
+    """
+    stream = _get_torch_stream(lowers.device)
+    wp.launch(
+        kernel=kernels.compute_mesh_instance_bounds_kernel,
+        dim=local_lowers.shape[0],
+        inputs=[
+            wp.from_torch(local_lowers.contiguous(), dtype=wp.vec3),
+            wp.from_torch(local_uppers.contiguous(), dtype=wp.vec3),
+            wp.from_torch(mesh_transforms.contiguous(), dtype=wp.transform),
+            wp.from_torch(lowers, dtype=wp.vec3),
+            wp.from_torch(uppers, dtype=wp.vec3),
+        ],
+        device=wp.device_from_torch(lowers.device),
+        stream=stream,
+    )
+    # refit the BVH on the same stream as the bounding boxes computation
+    if bvh is not None:
+        with wp.ScopedStream(stream) if stream is not None else contextlib.nullcontext():
+            bvh.refit()
+
+
 def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -> wp.Mesh:
     """Create a warp mesh object with a mesh defined from vertices and triangles.
 
@@ -143,3 +303,20 @@ def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -
         points=wp.array(points.astype(np.float32), dtype=wp.vec3, device=device),
         indices=wp.array(indices.astype(np.int32).flatten(), dtype=wp.int32, device=device),
     )
+
+
+"""
+Helper functions.
+"""
+
+
+def _get_torch_stream(device: str | torch.device) -> wp.Stream | None:
+    """Get the warp stream of the current torch stream on the device.
+
+    Launching the kernels on this stream orders them with the torch operations, without synchronizing
+    the device. For CPU devices, None is returned so that the default behavior of warp is used.
+    """
+    device = torch.device(device)
+    if device.type != "cuda":
+        return None
+    return wp.stream_from_torch(torch.cuda.current_stream(device))
@@ -0,0 +1,181 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+from isaaclab.actuators import (
+    DCMotorCfg,
+    DelayedPDActuatorCfg,
+    FusedActuatorGroup,
+    IdealPDActuatorCfg,
+    ImplicitActuatorCfg,
+    fuse_actuator_groups,
+)
+from isaaclab.utils.types import ArticulationActions
+
+NUM_ENVS = 16
+NUM_JOINTS = 14
+
+
+class TestFusedActuatorGroup(unittest.TestCase):
+    """Test fixture for the fused evaluation of actuator groups."""
+
+    def test_fused_matches_per_group(self):
+        """Test that the fused evaluation gives exactly the same results as the evaluation of each group."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                actuators = self._create_actuators(device)
+                fused_actuators = self._create_actuators(device)
+                evaluators = fuse_actuator_groups(list(fused_actuators.values()), NUM_JOINTS, device)
+                # the groups of the same model are fused
+                self.assertEqual(len(evaluators), 4)
+                self.assertTrue(all(isinstance(evaluator, FusedActuatorGroup) for evaluator in evaluators))
+
+                buffers = self._create_buffers(device)
+                fused_buffers = self._create_buffers(device)
+                for step in range(10):
+                    # reset some environments with the same random delays
+                    if step % 4 == 0:
+                        env_ids = torch.arange(0, NUM_ENVS, 3, device=device)
+                        for group in (actuators, fused_actuators):
+                            torch.manual_seed(step)
+                            for actuator in group.values():
+                                actuator.reset(env_ids)
+                    # modify the gains in-place as done by the randomization events
+                    if step == 5:
+                        for group in (actuators, fused_actuators):
+                            group["legs_front"].stiffness[:2] *= 2.0
+                            group["arm"].damping = torch.full_like(group["arm"].damping, 3.0)
+                    # sample the targets and the joint state
+                    data = {key: torch.randn(NUM_ENVS, NUM_JOINTS, device=device) for key in buffers["targets"]}
+                    self._apply_actuator_model(list(actuators.values()), buffers, data)
+                    self._apply_actuator_model(evaluators, fused_buffers, data)
+                    # check the results
+                    for name in ("joint_pos", "joint_vel", "joint_effort"):
+                        self.assertTrue(torch.equal(fused_buffers["sim"][name], buffers["sim"][name]))
+                    for name in ("computed_torque", "applied_torque", "soft_joint_vel_limits"):
+                        self.assertTrue(torch.equal(fused_buffers[name], buffers[name]))
+                    for name, actuator in actuators.items():
+                        self.assertTrue(torch.equal(fused_actuators[name].applied_effort, actuator.applied_effort))
+
+    def test_overlapping_groups(self):
+        """Test that groups sharing joints cannot be fused."""
+        cfg = IdealPDActuatorCfg(joint_names_expr=[".*"], stiffness=1.0, damping=0.1, effort_limit=10.0)
+        actuators = [
+            cfg.class_type(cfg, ["a", "b"], torch.tensor([0, 1]), NUM_ENVS, "cpu"),
+            cfg.class_type(cfg, ["b", "c"], torch.tensor([1, 2]), NUM_ENVS, "cpu"),
+        ]
+        with self.assertRaises(ValueError):
+            fuse_actuator_groups(actuators, 3, "cpu")
+
+    """
+    Helper functions.
+    """
+
+    def _create_actuators(self, device: str) -> dict:
+        """Create the actuator groups over the joints of an articulation."""
+        torch.manual_seed(0)
+        cfgs = {
+            "legs_front": (
+                DCMotorCfg(
+                    joint_names_expr=[".*"],
+                    saturation_effort=120.0,
+                    effort_limit=80.0,
+                    velocity_limit=7.5,
+                    stiffness={".*_hip": 40.0, ".*_knee": 30.0},
+                    damping=0.5,
+                ),
+                [0, 3, 6],
+            ),
+            "arm": (IdealPDActuatorCfg(joint_names_expr=[".*"], stiffness=10.0, damping=1.0, effort_limit=5.0), [1, 2]),
+            "legs_rear": (
+                DCMotorCfg(
+                    joint_names_expr=[".*"],
+                    saturation_effort=90.3,
+                    effort_limit=60.0,
+                    velocity_limit=9.1,
+                    stiffness=25.0,
+                    damping=0.7,
+                ),
+                [4, 7],
+            ),
+            "gripper": (
+                IdealPDActuatorCfg(joint_names_expr=[".*"], stiffness=3.3, damping=0.1, effort_limit=1.7),
+                [5],
+            ),
+            "neck": (
+                DelayedPDActuatorCfg(
+                    joint_names_expr=[".*"], stiffness=8.0, damping=0.2, effort_limit=4.0, min_delay=0, max_delay=3
+                ),
+                [8],
+            ),
+            "tail": (
+                DelayedPDActuatorCfg(
+                    joint_names_expr=[".*"], stiffness=6.0, damping=0.4, effort_limit=2.0, min_delay=1, max_delay=2
+                ),
+                [9, 10],
+            ),
+            "wheel": (ImplicitActuatorCfg(joint_names_expr=[".*"], stiffness=0.0, damping=2.0), [11]),
+            "ears": (ImplicitActuatorCfg(joint_names_expr=[".*"], stiffness=5.0, damping=0.3), [12, 13]),
+        }
+        actuators = dict()
+        for name, (cfg, joint_ids) in cfgs.items():
+            joint_names = [f"{name}_{idx}_{'hip' if idx % 2 else 'knee'}" for idx in joint_ids]
+            actuators[name] = cfg.class_type(cfg, joint_names, torch.tensor(joint_ids, device=device), NUM_ENVS, device)
+        return actuators
+
+    def _create_buffers(self, device: str) -> dict:
+        """Create the buffers of the articulation that are read and written by the actuator models."""
+
+        def zeros():
+            return torch.zeros(NUM_ENVS, NUM_JOINTS, device=device)
+
+        return {
+            "targets": {"joint_pos_target": None, "joint_vel_target": None, "joint_effort_target": None},
+            "sim": {"joint_pos": zeros(), "joint_vel": zeros(), "joint_effort": zeros()},
+            "computed_torque": zeros(),
+            "applied_torque": zeros(),
+            "soft_joint_vel_limits": zeros(),
+        }
+
+    def _apply_actuator_model(self, evaluators: list, buffers: dict, data: dict):
+        """Evaluate the actuator models as done by the articulation."""
+        joint_pos, joint_vel = data["joint_pos_target"] * 0.5, data["joint_vel_target"] * 2.0
+        for actuator in evaluators:
+            control_action = ArticulationActions(
+                joint_positions=data["joint_pos_target"][:, actuator.joint_indices],
+                joint_velocities=data["joint_vel_target"][:, actuator.joint_indices],
+                joint_efforts=data["joint_effort_target"][:, actuator.joint_indices],
+                joint_indices=actuator.joint_indices,
+            )
+            control_action = actuator.compute(
+                control_action,
+                joint_pos=joint_pos[:, actuator.joint_indices],
+                joint_vel=joint_vel[:, actuator.joint_indices],
+            )
+            if control_action.joint_positions is not None:
+                buffers["sim"]["joint_pos"][:, actuator.joint_indices] = control_action.joint_positions
+            if control_action.joint_velocities is not None:
+                buffers["sim"]["joint_vel"][:, actuator.joint_indices] = control_action.joint_velocities
+            if control_action.joint_efforts is not None:
+                buffers["sim"]["joint_effort"][:, actuator.joint_indices] = control_action.joint_efforts
+            buffers["computed_torque"][:, actuator.joint_indices] = actuator.computed_effort
+            buffers["applied_torque"][:, actuator.joint_indices] = actuator.applied_effort
+            buffers["soft_joint_vel_limits"][:, actuator.joint_indices] = actuator.velocity_limit
+
+
+if __name__ == "__main__":
+    run_tests()
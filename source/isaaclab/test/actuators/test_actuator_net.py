@@ -0,0 +1,174 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import os
+import tempfile
+import torch
+import unittest
+
+from isaaclab.actuators import ActuatorNetLSTMCfg, ActuatorNetMLPCfg
+from isaaclab.utils.types import ArticulationActions
+
+NUM_ENVS = 8
+NUM_JOINTS = 3
+
+
+class _LSTMNetwork(torch.nn.Module):
+    """LSTM network with the interface of the actuator networks."""
+
+    def __init__(self):
+        super().__init__()
+        self.lstm = torch.nn.LSTM(2, 8, num_layers=2, batch_first=True)
+        self.linear = torch.nn.Linear(8, 1)
+
+    def forward(
+        self, x: torch.Tensor, hidden_states: tuple[torch.Tensor, torch.Tensor]
+    ) -> tuple[torch.Tensor, tuple[torch.Tensor, torch.Tensor]]:
+        y, (h, c) = self.lstm(x, hidden_states)
+        return self.linear(y), (h, c)
+
+
+class TestActuatorNet(unittest.TestCase):
+    """Test fixture for the actuator models based on neural networks."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        torch.manual_seed(0)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_mlp_history(self):
+        """Test that the inputs of the MLP are gathered from the history as with a shifted history."""
+        for device in ("cuda:0", "cpu"):
+            for input_order in ("pos_vel", "vel_pos"):
+                with self.subTest(device=device, input_order=input_order):
+                    network = torch.nn.Sequential(torch.nn.Linear(6, 16), torch.nn.Softsign(), torch.nn.Linear(16, 1))
+                    cfg = self._mlp_cfg(self._save_network(torch.jit.script(network)), input_order)
+                    actuator = cfg.class_type(
+                        cfg, [f"joint_{i}" for i in range(NUM_JOINTS)], slice(None), NUM_ENVS, device
+                    )
+                    network = network.to(device)
+                    # reference history that is shifted at every step
+                    pos_history = torch.zeros(NUM_ENVS, 6, NUM_JOINTS, device=device)
+                    vel_history = torch.zeros_like(pos_history)
+                    for step in range(12):
+                        if step == 7:
+                            actuator.reset([1, 4])
+                            pos_history[[1, 4]] = 0.0
+                            vel_history[[1, 4]] = 0.0
+                        control_action, joint_pos, joint_vel = self._sample_inputs(device)
+                        pos_history = pos_history.roll(1, 1)
+                        pos_history[:, 0] = control_action.joint_positions - joint_pos
+                        vel_history = vel_history.roll(1, 1)
+                        vel_history[:, 0] = joint_vel
+                        pos_input = (pos_history[:, cfg.input_idx].transpose(1, 2) * cfg.pos_scale).reshape(-1, 3)
+                        vel_input = (vel_history[:, cfg.input_idx].transpose(1, 2) * cfg.vel_scale).reshape(-1, 3)
+                        inputs = [pos_input, vel_input] if input_order == "pos_vel" else [vel_input, pos_input]
+                        with torch.no_grad():
+                            expected_effort = network(torch.cat(inputs, dim=1)).view(NUM_ENVS, NUM_JOINTS)
+                        # compute the effort with the actuator model
+                        actuator.compute(control_action, joint_pos, joint_vel)
+                        torch.testing.assert_close(actuator.computed_effort, expected_effort * cfg.torque_scale)
+
+    def test_mlp_half_precision(self):
+        """Test that the MLP can be evaluated in half precision."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                network_file = self._save_network(torch.jit.script(torch.nn.Linear(6, 1)))
+                efforts = dict()
+                for network_dtype in ("float32", "bfloat16"):
+                    cfg = self._mlp_cfg(network_file, "pos_vel", network_dtype=network_dtype)
+                    actuator = cfg.class_type(
+                        cfg, [f"joint_{i}" for i in range(NUM_JOINTS)], slice(None), NUM_ENVS, device
+                    )
+                    torch.manual_seed(1)
+                    for _ in range(3):
+                        actuator.compute(*self._sample_inputs(device))
+                    efforts[network_dtype] = actuator.computed_effort
+                self.assertEqual(efforts["bfloat16"].dtype, torch.float32)
+                torch.testing.assert_close(efforts["bfloat16"], efforts["float32"], atol=0.05, rtol=0.05)
+
+    def test_lstm(self):
+        """Test that the LSTM carries its hidden states over the steps and resets them."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                network = _LSTMNetwork()
+                cfg = ActuatorNetLSTMCfg(
+                    joint_names_expr=[".*"],
+                    network_file=self._save_network(torch.jit.script(network)),
+                    saturation_effort=120.0,
+                    effort_limit=80.0,
+                    velocity_limit=7.5,
+                )
+                actuator = cfg.class_type(cfg, [f"joint_{i}" for i in range(NUM_JOINTS)], slice(None), NUM_ENVS, device)
+                network = network.to(device)
+                # reference hidden states
+                hidden_states = (
+                    torch.zeros(2, NUM_ENVS * NUM_JOINTS, 8, device=device),
+                    torch.zeros(2, NUM_ENVS * NUM_JOINTS, 8, device=device),
+                )
+                for step in range(5):
+                    if step == 3:
+                        actuator.reset([0, 5])
+                        for state in hidden_states:
+                            state.view(2, NUM_ENVS, NUM_JOINTS, 8)[:, [0, 5]] = 0.0
+                    control_action, joint_pos, joint_vel = self._sample_inputs(device)
+                    inputs = torch.stack([control_action.joint_positions - joint_pos, joint_vel], dim=-1)
+                    with torch.no_grad():
+                        expected_effort, hidden_states = network(inputs.view(-1, 1, 2), hidden_states)
+                    actuator.compute(control_action, joint_pos, joint_vel)
+                    torch.testing.assert_close(actuator.computed_effort, expected_effort.view(NUM_ENVS, NUM_JOINTS))
+
+    """
+    Helper functions.
+    """
+
+    def _save_network(self, network: torch.jit.ScriptModule) -> str:
+        """Save a TorchScript network into the temporary directory."""
+        network_file = os.path.join(self.temp_dir.name, f"network_{len(os.listdir(self.temp_dir.name))}.pt")
+        torch.jit.save(network, network_file)
+        return network_file
+
+    def _mlp_cfg(self, network_file: str, input_order: str, network_dtype: str = "float32") -> ActuatorNetMLPCfg:
+        """Create the configuration of an MLP actuator model with three history inputs."""
+        return ActuatorNetMLPCfg(
+            joint_names_expr=[".*"],
+            network_file=network_file,
+            network_dtype=network_dtype,
+            pos_scale=-1.5,
+            vel_scale=0.2,
+            torque_scale=60.0,
+            input_order=input_order,
+            input_idx=[0, 2, 5],
+            saturation_effort=120.0,
+            effort_limit=80.0,
+            velocity_limit=7.5,
+        )
+
+    def _sample_inputs(self, device: str) -> tuple[ArticulationActions, torch.Tensor, torch.Tensor]:
+        """Sample the joint commands and states."""
+        control_action = ArticulationActions(
+            joint_positions=torch.randn(NUM_ENVS, NUM_JOINTS, device=device),
+            joint_velocities=torch.zeros(NUM_ENVS, NUM_JOINTS, device=device),
+            joint_efforts=torch.zeros(NUM_ENVS, NUM_JOINTS, device=device),
+        )
+        joint_pos = torch.randn(NUM_ENVS, NUM_JOINTS, device=device)
+        joint_vel = torch.randn(NUM_ENVS, NUM_JOINTS, device=device)
+        return control_action, joint_pos, joint_vel
+
+
+if __name__ == "__main__":
+    run_tests()
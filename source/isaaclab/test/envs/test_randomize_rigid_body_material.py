@@ -0,0 +1,161 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+from collections import namedtuple
+
+from isaaclab.assets import Articulation
+from isaaclab.envs.mdp import randomize_rigid_body_material
+from isaaclab.managers import EventTermCfg, SceneEntityCfg
+
+NUM_ENVS = 6
+NUM_SHAPES_PER_BODY = [1, 3, 2, 2]
+
+
+class TestRandomizeRigidBodyMaterial(unittest.TestCase):
+    """Test the assignment of the materials by the event term randomizing the rigid body materials."""
+
+    def setUp(self) -> None:
+        self.robot = _MockArticulation()
+        self.env = namedtuple("ManagerBasedEnv", ["scene"])(_MockScene({"robot": self.robot}))
+
+    def test_assignment_of_selected_bodies(self):
+        """Test that the materials of the shapes of the selected bodies are assigned as in the per-body loop."""
+        for body_ids in ([1, 3], [0, 2], slice(None)):
+            with self.subTest(body_ids=body_ids):
+                # restart with a new robot
+                self.setUp()
+                asset_cfg = SceneEntityCfg("robot", body_ids=body_ids)
+                term = self._create_term(asset_cfg)
+                expected_materials = self.robot.root_physx_view.materials.clone()
+                for seed, env_ids in enumerate([torch.tensor([0, 2, 5]), torch.tensor([1, 2]), None]):
+                    # apply the term
+                    torch.manual_seed(seed)
+                    term(self.env, env_ids, **term.cfg.params)
+                    # apply the per-body loop with the same samples
+                    torch.manual_seed(seed)
+                    if env_ids is None:
+                        env_ids = torch.arange(NUM_ENVS)
+                    bucket_ids = torch.randint(0, 8, (len(env_ids), len(term.shape_ids)))
+                    _assign_materials_per_body(
+                        expected_materials, term.material_buckets[bucket_ids], env_ids, asset_cfg, term.shape_ids
+                    )
+                    # check the materials of all the environments
+                    torch.testing.assert_close(self.robot.root_physx_view.materials, expected_materials)
+                    self.assertEqual(self.robot.root_physx_view.set_env_ids.tolist(), env_ids.tolist())
+                # the material properties are read from the simulation only once
+                self.assertEqual(self.robot.root_physx_view.num_get_calls, 1)
+
+    def test_shape_ids(self):
+        """Test the indices of the shapes of the selected bodies."""
+        term = self._create_term(SceneEntityCfg("robot", body_ids=[3, 1]))
+        self.assertEqual(term.shape_ids.tolist(), [6, 7, 1, 2, 3])
+        term = self._create_term(SceneEntityCfg("robot"))
+        self.assertEqual(term.shape_ids.tolist(), list(range(sum(NUM_SHAPES_PER_BODY))))
+
+    """
+    Helper functions.
+    """
+
+    def _create_term(self, asset_cfg: SceneEntityCfg) -> randomize_rigid_body_material:
+        """Create the event term for the robot."""
+        cfg = EventTermCfg(
+            func=randomize_rigid_body_material,
+            mode="startup",
+            params={
+                "static_friction_range": (0.5, 1.0),
+                "dynamic_friction_range": (0.3, 0.6),
+                "restitution_range": (0.0, 0.2),
+                "num_buckets": 8,
+                "asset_cfg": asset_cfg,
+            },
+        )
+        return randomize_rigid_body_material(cfg, self.env)
+
+
+def _assign_materials_per_body(
+    materials: torch.Tensor,
+    selected_material_samples: torch.Tensor,
+    env_ids: torch.Tensor,
+    asset_cfg: SceneEntityCfg,
+    shape_ids: torch.Tensor,
+):
+    """Assign the material samples body by body, as done before the shape indices were precomputed."""
+    # samples for all the shapes, with invalid values for the shapes that must not be assigned
+    material_samples = torch.full((len(env_ids), sum(NUM_SHAPES_PER_BODY), 3), float("nan"))
+    material_samples[:, shape_ids] = selected_material_samples
+    if asset_cfg.body_ids != slice(None):
+        for body_id in asset_cfg.body_ids:
+            start_idx = sum(NUM_SHAPES_PER_BODY[:body_id])
+            end_idx = start_idx + NUM_SHAPES_PER_BODY[body_id]
+            materials[env_ids, start_idx:end_idx] = material_samples[:, start_idx:end_idx]
+    else:
+        materials[env_ids] = material_samples[:]
+
+
+class _MockRigidBodyView:
+    """Rigid body view of a single link."""
+
+    def __init__(self, max_shapes: int):
+        self.max_shapes = max_shapes
+
+
+class _MockArticulationView:
+    """Articulation view with the material properties of the shapes of all the environments."""
+
+    def __init__(self):
+        self.link_paths = [[f"/World/envs/env_0/Robot/link_{idx}" for idx in range(len(NUM_SHAPES_PER_BODY))]]
+        self.max_shapes = sum(NUM_SHAPES_PER_BODY)
+        self.materials = torch.rand(NUM_ENVS, self.max_shapes, 3)
+        self.set_env_ids = None
+        self.num_get_calls = 0
+
+    def get_material_properties(self) -> torch.Tensor:
+        self.num_get_calls += 1
+        return self.materials.clone()
+
+    def set_material_properties(self, materials: torch.Tensor, env_ids: torch.Tensor):
+        self.materials[env_ids] = materials[env_ids]
+        self.set_env_ids = env_ids
+
+
+class _MockSimulationView:
+    """Simulation view that creates the views of the links of the articulation."""
+
+    def create_rigid_body_view(self, link_path: str) -> _MockRigidBodyView:
+        return _MockRigidBodyView(NUM_SHAPES_PER_BODY[int(link_path.rsplit("_", 1)[-1])])
+
+
+class _MockArticulation(Articulation):
+    """Articulation with mocked physics views."""
+
+    def __init__(self):
+        # note: the asset is not spawned, so the base class is not initialized
+        self._initialize_handle = None
+        self._invalidate_initialize_handle = None
+        self._debug_vis_handle = None
+        self._root_physx_view = _MockArticulationView()
+        self._physics_sim_view = _MockSimulationView()
+
+
+class _MockScene(dict):
+    """Scene with the assets of the environments."""
+
+    num_envs = NUM_ENVS
+
+
+if __name__ == "__main__":
+    run_tests()
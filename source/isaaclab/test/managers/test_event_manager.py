@@ -258,7 +258,7 @@ class TestEventManager(unittest.TestCase):
             torch.testing.assert_close(self.env.dummy1, (count + 1) // 10 * torch.ones_like(self.env.dummy1))
 
             # we increment the dummy2 by 1 every 2 to 10 steps based on the random interval
-            expected_dummy2_value += term_2_interval_time < 1e-6
+            expected_dummy2_value += term_2_interval_time.unsqueeze(1) < 1e-6
             torch.testing.assert_close(self.env.dummy2, expected_dummy2_value)
 
             # check the time sampled at the end of the interval is valid
@@ -268,8 +268,45 @@ class TestEventManager(unittest.TestCase):
                 expected_time_interval_init = torch.full_like(term_1_interval_time_init, term_1_interval_range_s[1])
                 torch.testing.assert_close(term_1_interval_time_init, expected_time_interval_init)
             # -- random interval
-            if term_2_interval_time < 1e-6:
+            if torch.all(term_2_interval_time < 1e-6):
                 term_2_interval_time = self.event_man._interval_term_time_left[1].clone()
+            # all the environments share the same time left
+            torch.testing.assert_close(
+                term_2_interval_time, torch.full_like(term_2_interval_time, term_2_interval_time[0])
+            )
+
+    def test_reset_and_update_interval_mode(self):
+        """Test the reset and the update of the configuration of event terms in interval mode."""
+        cfg = {
+            "term_1": EventTermCfg(
+                func=increment_dummy1_by_one, mode="interval", interval_range_s=(0.1, 0.5), is_global_time=True
+            ),
+            "term_2": EventTermCfg(
+                func=increment_dummy2_by_one, mode="interval", interval_range_s=(0.1, 0.5), is_global_time=False
+            ),
+        }
+        self.event_man = EventManager(cfg, self.env)
+        self.assertEqual(self.event_man._interval_term_time_left.shape, (2, self.env.num_envs))
+
+        # reset a subset of the environments
+        time_left = self.event_man._interval_term_time_left.clone()
+        env_ids = torch.arange(0, self.env.num_envs, 2, device=self.env.device)
+        self.event_man.reset(env_ids)
+        # -- global time is not reset
+        torch.testing.assert_close(self.event_man._interval_term_time_left[0], time_left[0])
+        # -- local time is only reset for the given environments
+        torch.testing.assert_close(self.event_man._interval_term_time_left[1, 1::2], time_left[1, 1::2])
+        self.assertFalse(torch.equal(self.event_man._interval_term_time_left[1, env_ids], time_left[1, env_ids]))
+
+        # update the interval range of the local term
+        self.event_man.set_term_cfg(
+            "term_2", EventTermCfg(func=increment_dummy2_by_one, mode="interval", interval_range_s=(1.0, 1.0))
+        )
+        # apply the event terms until all the environments sampled a new interval
+        for _ in range(60):
+            self.event_man.apply("interval", dt=self.env.dt)
+        torch.testing.assert_close(self.env.dummy2, torch.ones_like(self.env.dummy2))
+        self.assertTrue(torch.all(self.event_man._interval_term_time_left[1] > 0.4))
 
     def test_apply_reset_mode(self):
         """Test the application of event terms that are in reset mode."""
@@ -21,6 +21,7 @@ from collections import namedtuple
 
 from isaaclab.managers import ManagerTermBase, ObservationGroupCfg, ObservationManager, ObservationTermCfg
 from isaaclab.utils import configclass, modifiers
+from isaaclab.utils.noise import GaussianNoiseCfg
 
 
 def grilled_chicken(env):
@@ -498,6 +499,70 @@ class TestObservationManager(unittest.TestCase):
         self.obs_man.reset(reset_env_ids)
         self.assertTrue(torch.equal(expected_obs_data_t0[reset_env_ids], obs_policy[reset_env_ids]))
 
+    def test_compute_fused_terms(self):
+        """Test that the fused computation of a group matches the default computation."""
+
+        pos_scale_tuple = (2.0, 3.0, 1.0)
+        modifier = modifiers.ModifierCfg(func=modifiers.bias, params={"value": 1.0})
+        noise = GaussianNoiseCfg(mean=0.1, std=0.5)
+
+        @configclass
+        class PolicyCfg(ObservationGroupCfg):
+            """Test config class for policy observation group."""
+
+            enable_corruption = True
+            term_1 = ObservationTermCfg(func=grilled_chicken, scale=10, clip=(-5.0, 5.0))
+            term_2 = ObservationTermCfg(func=pos_w_data, scale=pos_scale_tuple, modifiers=[modifier], noise=noise)
+            term_3 = ObservationTermCfg(func=lin_vel_w_data, clip=(0.0, 0.5), history_length=3, scale=2.0)
+            term_4 = ObservationTermCfg(func=complex_function_class, params={"interval": 0.5}, noise=noise)
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            policy: ObservationGroupCfg = PolicyCfg()
+            policy_fused: ObservationGroupCfg = PolicyCfg(fuse_terms=True)
+
+        # create observation manager
+        cfg = MyObservationManagerCfg()
+        self.obs_man = ObservationManager(cfg, self.env)
+        # the output buffer is reused across calls
+        obs_policy_fused = self.obs_man.compute_group("policy_fused")
+        self.assertEqual(obs_policy_fused.data_ptr(), self.obs_man.compute_group("policy_fused").data_ptr())
+        self.obs_man.reset()
+
+        for _ in range(5):
+            # compute with the same random state
+            torch.manual_seed(0)
+            obs_policy = self.obs_man.compute_group("policy")
+            torch.manual_seed(0)
+            obs_policy_fused = self.obs_man.compute_group("policy_fused")
+            # check the observations are identical
+            self.assertEqual(obs_policy.shape, obs_policy_fused.shape)
+            torch.testing.assert_close(obs_policy, obs_policy_fused, rtol=0.0, atol=0.0)
+
+    def test_invalid_fused_terms_config(self):
+        """Test that fusing terms of a non-concatenated group raises an error."""
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                concatenate_terms = False
+                fuse_terms = True
+                term_1 = ObservationTermCfg(func=grilled_chicken)
+
+            policy: ObservationGroupCfg = PolicyCfg()
+
+        # create observation manager
+        cfg = MyObservationManagerCfg()
+        with self.assertRaises(ValueError):
+            self.obs_man = ObservationManager(cfg, self.env)
+
     def test_invalid_observation_config(self):
         """Test the invalid observation config."""
 
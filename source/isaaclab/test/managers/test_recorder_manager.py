@@ -157,6 +157,37 @@ class TestRecorderManager(unittest.TestCase):
                     episode = recorder_manager.get_episode(env_id)
                     self.assertEqual(episode.data["record_post_reset"].shape, (1, 3))
 
+    def test_record_multiple_chunks(self):
+        """Test the recording of more time steps than the buffered chunk length with partial resets."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                env = create_dummy_env(device)
+                # create recorder manager
+                cfg = self.create_dummy_recorder_manager_cfg()
+                cfg.dataset_export_mode = DatasetExportMode.EXPORT_NONE
+                cfg.episode_chunk_length = 4
+                recorder_manager = RecorderManager(cfg, env)
+
+                # record the step count for a few steps and reset some environments in between
+                reset_env_ids = [1, 5]
+                for step in range(10):
+                    recorder_manager.add_to_episodes("step", torch.full((env.num_envs, 1), step, device=device))
+                    if step == 6:
+                        recorder_manager.reset(reset_env_ids)
+
+                # check the recorded data
+                for env_id in range(env.num_envs):
+                    episode = recorder_manager.get_episode(env_id)
+                    first_step = 7 if env_id in reset_env_ids else 0
+                    expected_steps = torch.arange(first_step, 10, device=device).unsqueeze(1)
+                    torch.testing.assert_close(episode.data["step"], expected_steps)
+
+                # check that recording continues after an episode was accessed
+                recorder_manager.add_to_episodes("step", torch.full((2, 1), 10, device=device), env_ids=[0, 1])
+                self.assertEqual(len(recorder_manager.get_episode(0).data["step"]), 11)
+                self.assertEqual(len(recorder_manager.get_episode(1).data["step"]), 4)
+                self.assertEqual(len(recorder_manager.get_episode(2).data["step"]), 10)
+
 
 if __name__ == "__main__":
     run_tests()
@@ -124,6 +124,33 @@ class TestRewardManager(unittest.TestCase):
         self.assertEqual(float(rewards[0]), expected_reward)
         self.assertEqual(tuple(rewards.shape), (self.env.num_envs,))
 
+    def test_episodic_sums(self):
+        """Test the episodic sums of the reward terms and their update on weight changes."""
+        env = namedtuple("ManagerBasedRLEnv", ["num_envs", "dt", "device", "max_episode_length_s"])(20, 0.1, "cpu", 2.0)
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken, weight=10),
+            "term_2": RewardTermCfg(func=grilled_chicken, weight=0.0),
+        }
+        self.rew_man = RewardManager(cfg, env)
+        # compute reward for a few steps
+        for _ in range(3):
+            self.rew_man.compute(dt=env.dt)
+        # enable the second term
+        term_cfg = self.rew_man.get_term_cfg("term_2")
+        term_cfg.weight = -2.0
+        self.rew_man.set_term_cfg("term_2", term_cfg)
+        rewards = self.rew_man.compute(dt=env.dt)
+        torch.testing.assert_close(rewards, torch.full((env.num_envs,), 0.8))
+        # check the per-term rewards of the current step
+        self.assertEqual(self.rew_man.get_active_iterable_terms(0), [("term_1", [10.0]), ("term_2", [-2.0])])
+        # reset a subset of the environments and check the logged sums
+        extras = self.rew_man.reset(env_ids=[0, 1])
+        torch.testing.assert_close(extras["Episode_Reward/term_1"], torch.tensor(4.0 / env.max_episode_length_s))
+        torch.testing.assert_close(extras["Episode_Reward/term_2"], torch.tensor(-0.2 / env.max_episode_length_s))
+        # the sums of the other environments remain unchanged
+        extras = self.rew_man.reset(env_ids=[0, 2])
+        torch.testing.assert_close(extras["Episode_Reward/term_1"], torch.tensor(2.0 / env.max_episode_length_s))
+
     def test_config_empty(self):
         """Test the creation of reward manager with empty config."""
         self.rew_man = RewardManager(None, self.env)
@@ -295,6 +295,82 @@ class TestContactSensor(unittest.TestCase):
                             contact_sensor_2.data.force_matrix_w[:, :, 0], contact_sensor.data.force_matrix_w[:, :, 0]
                         )
 
+    def test_net_forces_w_history(self):
+        """Checks that the history of net forces is ordered from the most recent entry after partial updates."""
+        history_length = 3
+        for device in self.devices:
+            with self.subTest(device=device):
+                with build_simulation_context(device=device, dt=self.sim_dt, add_lighting=False) as sim:
+                    sim._app_control_on_stop_handle = None
+                    self._create_multi_env_scene(sim, history_length=history_length, update_period=2 * self.sim_dt)
+                    sensor: ContactSensor = self.scene["contact_sensor"]
+                    # expected history of each environment, built from the net forces after each update
+                    expected_history = torch.zeros(4, history_length, 1, 3, device=device)
+
+                    def append_to_expected_history(env_ids: torch.Tensor | slice):
+                        expected_history[env_ids] = torch.cat(
+                            [sensor.data.net_forces_w[env_ids].unsqueeze(1), expected_history[env_ids, :-1]], dim=1
+                        )
+
+                    # the sensors are updated when their data is first read after the reset of the scene
+                    append_to_expected_history(slice(None))
+                    torch.testing.assert_close(sensor.data.net_forces_w_history, expected_history)
+
+                    for step in range(8 * history_length):
+                        # reset some of the sensors in between to shift their update steps
+                        if step in (5, 12):
+                            env_ids = torch.tensor([1, 3] if step == 5 else [0], device=device)
+                            sensor.reset(env_ids)
+                            expected_history[env_ids] = 0.0
+                            # the reset sensors are updated when their data is read
+                            append_to_expected_history(env_ids)
+                            torch.testing.assert_close(sensor.data.net_forces_w_history, expected_history)
+                        self._perform_sim_step()
+                        # the sensors updated in this step
+                        append_to_expected_history(sensor._timestamp_last_update == sensor._timestamp)
+                        # reading the history twice in the same step gives the same result
+                        torch.testing.assert_close(sensor.data.net_forces_w_history, expected_history)
+                        torch.testing.assert_close(sensor.data.net_forces_w_history, expected_history)
+                        torch.testing.assert_close(sensor.data.net_forces_w_history[:, 0], sensor.data.net_forces_w)
+                    # the history contains contact forces
+                    self.assertTrue(torch.any(expected_history != 0.0))
+
+    def test_first_contact_and_air_after_update(self):
+        """Checks that the first-contact and first-air states are recomputed after an update and a reset."""
+        for device in self.devices:
+            with self.subTest(device=device):
+                with build_simulation_context(device=device, dt=self.sim_dt, add_lighting=False) as sim:
+                    sim._app_control_on_stop_handle = None
+                    self._create_multi_env_scene(sim, history_length=0, update_period=0.0)
+                    sensor: ContactSensor = self.scene["contact_sensor"]
+                    dt = 4 * self.sim_dt
+
+                    for step in range(100):
+                        self._perform_sim_step()
+                        # expected states from the current air and contact times
+                        current_air_time = sensor.data.current_air_time
+                        current_contact_time = sensor.data.current_contact_time
+                        expected_first_air = (current_air_time > 0.0) * (current_air_time < dt + 1.0e-8)
+                        expected_first_contact = (current_contact_time > 0.0) * (current_contact_time < dt + 1.0e-8)
+                        # reading the states twice in the same step gives the same result
+                        for _ in range(2):
+                            torch.testing.assert_close(sensor.compute_first_air(dt), expected_first_air)
+                            torch.testing.assert_close(sensor.compute_first_contact(dt), expected_first_contact)
+                        # the states are computed for each time period
+                        torch.testing.assert_close(
+                            sensor.compute_first_contact(2 * dt),
+                            (current_contact_time > 0.0) * (current_contact_time < 2 * dt + 1.0e-8),
+                        )
+                        # the states of the reset sensors are cleared
+                        if step in (30, 60):
+                            sensor.reset([0, 2])
+                            expected_first_air[[0, 2]] = False
+                            expected_first_contact[[0, 2]] = False
+                            torch.testing.assert_close(sensor.compute_first_air(dt), expected_first_air)
+                            torch.testing.assert_close(sensor.compute_first_contact(dt), expected_first_contact)
+                    # the cubes have landed on the ground
+                    self.assertTrue(torch.all(sensor.data.current_contact_time > 0.0))
+
     def test_sensor_print(self):
         """Test sensor print is working correctly."""
         with build_simulation_context(device="cuda:0", dt=self.sim_dt, add_lighting=False) as sim:
@@ -484,6 +560,36 @@ class TestContactSensor(unittest.TestCase):
         self.assertEqual(sensor.compute_first_contact(dt=dt).item(), in_contact)
         self.assertEqual(sensor.compute_first_air(dt=dt).item(), in_air)
 
+    def _create_multi_env_scene(self, sim: sim_utils.SimulationContext, history_length: int, update_period: float):
+        """Creates a scene of cubes dropped from different heights, each with a contact sensor.
+
+        Args:
+            sim: The simulation context.
+            history_length: The history length of the contact sensor.
+            update_period: The update period of the contact sensor.
+        """
+        num_envs = 4
+        scene_cfg = ContactSensorSceneCfg(num_envs=num_envs, env_spacing=1.0, lazy_sensor_update=False)
+        scene_cfg.terrain = FLAT_TERRAIN_CFG.replace(prim_path="/World/ground")
+        scene_cfg.shape = CUBE_CFG.replace(prim_path="{ENV_REGEX_NS}/Cube")
+        scene_cfg.contact_sensor = ContactSensorCfg(
+            prim_path="{ENV_REGEX_NS}/Cube",
+            debug_vis=False,
+            update_period=update_period,
+            track_air_time=True,
+            history_length=history_length,
+        )
+        self.sim = sim
+        self.scene = InteractiveScene(scene_cfg)
+        # Play the simulation
+        self.sim.reset()
+        # drop the cubes from different heights so that they land at different steps
+        root_pose = self.scene["shape"].data.default_root_state[:, :7].clone()
+        root_pose[:, :3] += self.scene.env_origins
+        root_pose[:, 2] = 0.25 + 0.002 * torch.arange(num_envs, device=sim.device)
+        self.scene["shape"].write_root_pose_to_sim(root_pose)
+        self.scene.reset()
+
     def _perform_sim_step(self) -> None:
         """Updates sensors and steps the contact sensor test scene."""
         # write data to simulation
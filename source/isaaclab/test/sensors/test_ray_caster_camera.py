@@ -20,11 +20,13 @@ import copy
 import numpy as np
 import os
 import torch
+import trimesh
 import unittest
 
 import isaacsim.core.utils.prims as prim_utils
 import isaacsim.core.utils.stage as stage_utils
 import omni.replicator.core as rep
+from isaacsim.core.prims import XFormPrim
 from pxr import Gf
 
 import isaaclab.sim as sim_utils
@@ -411,6 +413,41 @@ class TestWarpCamera(unittest.TestCase):
         torch.testing.assert_close(camera.data.pos_w, position)
         torch.testing.assert_close(camera.data.quat_w_world, orientation)
 
+    def test_multiple_and_dynamic_meshes(self):
+        """Test ray-casting against multiple meshes, one of which is moving."""
+        # create two boxes on the ground
+        for prim_path, position in [("/World/BoxStatic", (1.0, 0.0, 0.5)), ("/World/BoxDynamic", (-1.0, 0.0, 0.5))]:
+            prim_utils.create_prim(prim_path, "Xform", translation=position)
+            create_prim_from_mesh(f"{prim_path}/mesh", trimesh.creation.box((1.0, 1.0, 1.0)))
+        # create camera looking down at the boxes
+        camera_cfg = copy.deepcopy(self.camera_cfg)
+        camera_cfg.mesh_prim_paths = ["/World/defaultGroundPlane", "/World/BoxStatic", "/World/BoxDynamic"]
+        camera_cfg.dynamic_mesh_prim_paths = ["/World/BoxDynamic"]
+        camera_cfg.offset = RayCasterCameraCfg.OffsetCfg(
+            pos=(0.0, 0.0, 5.0), rot=(0.7071068, 0.0, 0.7071068, 0.0), convention="world"
+        )
+        camera_cfg.pattern_cfg = patterns.PinholeCameraPatternCfg(
+            focal_length=24.0, horizontal_aperture=20.955, height=3, width=3
+        )
+        camera_cfg.data_types = ["distance_to_camera"]
+        camera = RayCasterCamera(cfg=camera_cfg)
+        # play sim
+        self.sim.reset()
+        camera.update(self.dt)
+
+        # rays towards the boxes and towards the ground
+        ray_directions = torch.tensor([[1.0, 0.0, -5.0], [-1.0, 0.0, -5.0], [0.0, 2.0, -5.0]], device=camera.device)
+        ray_starts = torch.tensor([[0.0, 0.0, 5.0]], device=camera.device).repeat(3, 1)
+        ray_directions = torch.nn.functional.normalize(ray_directions, dim=-1)
+        ray_hits = camera._raycast(ray_starts.unsqueeze(0), ray_directions.unsqueeze(0), max_dist=1e6)[0][0]
+        torch.testing.assert_close(ray_hits[:, 2], torch.tensor([1.0, 1.0, 0.0], device=camera.device))
+
+        # move the dynamic box and check that the rays follow it
+        box_view = XFormPrim("/World/BoxDynamic", reset_xform_properties=False)
+        box_view.set_world_poses(positions=torch.tensor([[-1.0, 0.0, 1.5]], device=camera.device))
+        ray_hits = camera._raycast(ray_starts.unsqueeze(0), ray_directions.unsqueeze(0), max_dist=1e6)[0][0]
+        torch.testing.assert_close(ray_hits[:, 2], torch.tensor([1.0, 2.0, 0.0], device=camera.device))
+
     def test_camera_set_world_poses_from_view(self):
         """Test camera function to set specific world pose from view."""
         camera = RayCasterCamera(self.camera_cfg)
@@ -84,6 +84,36 @@ class TestUtilities(unittest.TestCase):
         with self.assertRaises(ValueError):
             sim_utils.get_all_matching_child_prims("World/Floor_.*")
 
+    def test_find_matching_prim_paths_after_stage_changes(self):
+        """Test that find_matching_prim_paths() follows the prims added to and removed from the stage."""
+        for index in range(4):
+            prim_utils.create_prim(f"/World/envs/env_{index}/Robot", "Xform")
+        self.assertEqual(len(sim_utils.find_matching_prim_paths("/World/envs/env_.*/Robot")), 4)
+
+        # add prims, including in a change block
+        prim_utils.create_prim("/World/envs/env_4/Robot", "Xform")
+        with Sdf.ChangeBlock():
+            Sdf.CreatePrimInLayer(stage_utils.get_current_stage().GetRootLayer(), "/World/envs/env_5/Robot")
+        prim_utils.create_prim("/World/envs/env_0/Robot/base", "Xform")
+        isaaclab_result = sim_utils.find_matching_prim_paths("/World/envs/env_.*/Robot")
+        self.assertListEqual(isaaclab_result, prim_utils.find_matching_prim_paths("/World/envs/env_.*/Robot"))
+        self.assertEqual(len(isaaclab_result), 6)
+        self.assertListEqual(
+            sim_utils.find_matching_prim_paths("/World/envs/env_0/Robot/.*"), ["/World/envs/env_0/Robot/base"]
+        )
+
+        # remove prims
+        prim_utils.delete_prim("/World/envs/env_1")
+        prim_utils.delete_prim("/World/envs/env_0/Robot/base")
+        isaaclab_result = sim_utils.find_matching_prim_paths("/World/envs/env_.*/Robot")
+        self.assertListEqual(isaaclab_result, prim_utils.find_matching_prim_paths("/World/envs/env_.*/Robot"))
+        self.assertEqual(len(isaaclab_result), 5)
+        self.assertListEqual(sim_utils.find_matching_prim_paths("/World/envs/env_0/Robot/.*"), [])
+
+        # the prims of a new stage are found
+        stage_utils.create_new_stage()
+        self.assertListEqual(sim_utils.find_matching_prim_paths("/World/envs/env_.*/Robot"), [])
+
     def test_find_global_fixed_joint_prim(self):
         """Test find_global_fixed_joint_prim() function."""
         # create scene
@@ -20,7 +20,7 @@ import unittest
 
 import isaacsim.core.utils.torch as torch_utils
 
-from isaaclab.terrains import FlatPatchSamplingCfg, TerrainGenerator, TerrainGeneratorCfg
+from isaaclab.terrains import FlatPatchSamplingCfg, HfTerrainBaseCfg, TerrainGenerator, TerrainGeneratorCfg
 from isaaclab.terrains.config.rough import ROUGH_TERRAINS_CFG
 
 
@@ -143,6 +143,123 @@ class TestTerrainGenerator(unittest.TestCase):
                     terrain_mesh_1.faces, terrain_mesh_2.faces, atol=1e-5, err_msg="Faces are not equal"
                 )
 
+    def test_generation_parallel(self):
+        """Generate the terrain in a pool of threads and check that it is reproducible and cached."""
+        # clear output directory
+        if os.path.exists(self.output_dir):
+            shutil.rmtree(self.output_dir)
+        # create terrain generator that generates the sub-terrains in parallel
+        cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+        cfg.num_rows = 4
+        cfg.num_cols = 4
+        cfg.seed = 0
+        cfg.num_workers = 4
+        cfg.use_cache = False
+        terrain_generator_1 = TerrainGenerator(cfg=cfg)
+
+        # set a random seed to disturb the process
+        torch_utils.set_seed(12456)
+        np.random.seed(12456)
+
+        # generate the terrain again with caching enabled
+        cfg.use_cache = True
+        cfg.cache_dir = self.output_dir
+        terrain_generator_2 = TerrainGenerator(cfg=cfg)
+        # check that the complete terrain is cached
+        self.assertTrue(any(name.startswith("terrain_") for name in os.listdir(cfg.cache_dir)))
+
+        # load the terrain from the cache
+        terrain_generator_3 = TerrainGenerator(cfg=cfg)
+        self.assertEqual(len(terrain_generator_3.terrain_meshes), 1)
+
+        # check if the meshes are equal
+        for terrain_generator in (terrain_generator_2, terrain_generator_3):
+            np.testing.assert_allclose(
+                terrain_generator_1.terrain_mesh.vertices,
+                terrain_generator.terrain_mesh.vertices,
+                atol=1e-5,
+                err_msg="Vertices are not equal",
+            )
+            np.testing.assert_allclose(
+                terrain_generator_1.terrain_mesh.faces,
+                terrain_generator.terrain_mesh.faces,
+                atol=1e-5,
+                err_msg="Faces are not equal",
+            )
+            np.testing.assert_allclose(terrain_generator_1.terrain_origins, terrain_generator.terrain_origins)
+
+    def test_generation_parallel_cache(self):
+        """Check that the sub-terrains generated serially and in parallel are cached separately."""
+        # clear output directory
+        if os.path.exists(self.output_dir):
+            shutil.rmtree(self.output_dir)
+        cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+        cfg.num_rows = 4
+        cfg.num_cols = 4
+        cfg.seed = 0
+        cfg.use_cache = False
+        # generate the terrains without caching
+        # note: the global random number generators are seeded since they are used by the serial generation
+        terrain_meshes = {}
+        for num_workers in (1, 4):
+            cfg.num_workers = num_workers
+            torch_utils.set_seed(12456)
+            terrain_meshes[num_workers] = TerrainGenerator(cfg=cfg).terrain_mesh.copy()
+
+        # generate the terrains with caching
+        cfg.use_cache = True
+        cfg.cache_dir = self.output_dir
+        for num_workers in (1, 4, 1):
+            cfg.num_workers = num_workers
+            # remove the complete terrains from the cache so that the sub-terrains are loaded from the cache
+            for name in os.listdir(cfg.cache_dir) if os.path.exists(cfg.cache_dir) else []:
+                if name.startswith("terrain_"):
+                    os.remove(os.path.join(cfg.cache_dir, name))
+            torch_utils.set_seed(12456)
+            expected_random_values = (np.random.rand(), torch.rand(1).item())
+            torch_utils.set_seed(12456)
+            terrain_generator = TerrainGenerator(cfg=cfg)
+            # the states of the global random number generators are not modified by the parallel generation
+            if num_workers > 1:
+                self.assertEqual((np.random.rand(), torch.rand(1).item()), expected_random_values)
+            # check if the meshes are equal to the ones generated without caching
+            np.testing.assert_allclose(
+                terrain_meshes[num_workers].vertices,
+                terrain_generator.terrain_mesh.vertices,
+                atol=1e-5,
+                err_msg="Vertices are not equal",
+            )
+        # the sub-terrains are cached for each number of workers
+        sub_terrain_hashes = [name for name in os.listdir(cfg.cache_dir) if not name.startswith("terrain_")]
+        self.assertEqual(len(sub_terrain_hashes), 2 * cfg.num_rows * cfg.num_cols)
+
+    def test_generation_flat_decimation(self):
+        """Generate the terrain with decimated height fields and check that only the flat regions are reduced."""
+        # create terrain generator with only the height field terrains
+        cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+        cfg.sub_terrains = {
+            name: sub_terrain_cfg
+            for name, sub_terrain_cfg in cfg.sub_terrains.items()
+            if isinstance(sub_terrain_cfg, HfTerrainBaseCfg)
+        }
+        cfg.num_rows = 2
+        cfg.num_cols = 6
+        cfg.seed = 0
+        cfg.use_cache = False
+        torch_utils.set_seed(0)
+        terrain_generator_1 = TerrainGenerator(cfg=cfg)
+        # decimate the flat regions of the height field terrains
+        for sub_terrain_cfg in cfg.sub_terrains.values():
+            sub_terrain_cfg.flat_block_size = 4
+        torch_utils.set_seed(0)
+        terrain_generator_2 = TerrainGenerator(cfg=cfg)
+
+        # check that the mesh is smaller but has the same bounds and surface
+        self.assertLess(len(terrain_generator_2.terrain_mesh.faces), len(terrain_generator_1.terrain_mesh.faces))
+        np.testing.assert_allclose(terrain_generator_1.terrain_mesh.bounds, terrain_generator_2.terrain_mesh.bounds)
+        self.assertAlmostEqual(terrain_generator_1.terrain_mesh.area, terrain_generator_2.terrain_mesh.area, places=3)
+        np.testing.assert_allclose(terrain_generator_1.terrain_origins, terrain_generator_2.terrain_origins)
+
     def test_terrain_flat_patches(self):
         """Test the flat patches generation."""
         # create terrain generator
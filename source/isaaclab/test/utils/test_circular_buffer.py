@@ -120,6 +120,20 @@ class TestCircularBuffer(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.buffer[torch.tensor([0, 0, 0], device=self.device)]
 
+    def test_empty_buffer_access_after_reset(self):
+        """Test accessing a buffer with reset batches before appending new data."""
+        data = torch.ones((self.batch_size, 2), device=self.device)
+        self.buffer.append(data)
+        # resetting no batches keeps the buffer accessible
+        self.buffer.reset(batch_ids=[])
+        torch.testing.assert_close(self.buffer[torch.tensor([0, 0, 0], device=self.device)], data)
+        # resetting a batch makes the buffer empty until the next append
+        self.buffer.reset(batch_ids=[1])
+        with self.assertRaises(RuntimeError):
+            self.buffer[torch.tensor([0, 0, 0], device=self.device)]
+        self.buffer.append(2.0 * data)
+        torch.testing.assert_close(self.buffer[torch.tensor([1, 1, 1], device=self.device)][1], 2.0 * data[1])
+
     def test_invalid_batch_size(self):
         """Test appending data with an invalid batch size."""
         data = torch.ones((self.batch_size + 1, 2), device=self.device)
@@ -169,6 +183,9 @@ class TestCircularBuffer(unittest.TestCase):
         # check that it is returned oldest first
         for idx in range(self.buffer.max_length - 1):
             self.assertTrue(torch.all(torch.le(retrieved_buffer[:, idx], retrieved_buffer[:, idx + 1])))
+        # check that the returned buffer is not modified by subsequent appends
+        self.buffer.append(torch.full((3, 2), -1, device=self.device))
+        self.assertTrue(torch.all(retrieved_buffer >= 0))
 
 
 if __name__ == "__main__":
@@ -101,6 +101,25 @@ class TestEpisodeData(unittest.TestCase):
                     )
                 )
 
+    def test_extend_tensors(self):
+        """Test appending sequences of tensor data to the episode beyond the initial capacity."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                num_steps = 3 * EpisodeData.MIN_CAPACITY
+                dummy_data = torch.arange(2 * num_steps, device=device).reshape(num_steps, 2)
+                episode = EpisodeData()
+
+                # test adding data one step at a time and as a sequence
+                for step in range(num_steps // 2):
+                    episode.add("first/second", dummy_data[step])
+                episode.extend("first/second", dummy_data[num_steps // 2 :])
+                self.assertTrue(torch.equal(episode.data["first"]["second"], dummy_data))
+
+                # test extending data that was set directly
+                episode.data = {"key": dummy_data[:1].clone()}
+                episode.extend("key", dummy_data[1:])
+                self.assertTrue(torch.equal(episode.data["key"], dummy_data))
+
     def test_get_initial_state(self):
         """Test getting the initial state of the episode."""
         for device in ("cuda:0", "cpu"):
@@ -12,6 +12,7 @@ simulation_app = AppLauncher(headless=True).app
 
 """Rest everything follows from here."""
 
+import h5py
 import os
 import shutil
 import tempfile
@@ -19,7 +20,7 @@ import torch
 import unittest
 import uuid
 
-from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+from isaaclab.utils.datasets import AsyncDatasetFileHandler, EpisodeData, HDF5DatasetFileHandler, HDF5GroupView
 
 
 def create_test_episode(device):
@@ -124,6 +125,146 @@ class TestHDF5DatasetFileHandler(unittest.TestCase):
 
                 dataset_file_handler.close()
 
+    def test_async_write_episode(self):
+        """Test writing episodes to the dataset file in a background thread."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+                dataset_file_handler = AsyncDatasetFileHandler(HDF5DatasetFileHandler(), max_queue_size=2)
+                dataset_file_handler.create(dataset_file_path, "test_env_name")
+
+                # write more episodes than the queue size
+                num_episodes = 5
+                test_episode = create_test_episode(device)
+                for _ in range(num_episodes):
+                    dataset_file_handler.write_episode(test_episode)
+                # modifying the episode after writing does not affect the queued data
+                test_episode.add("actions", torch.tensor([10, 11, 12], device=device))
+                dataset_file_handler.flush()
+                self.assertEqual(dataset_file_handler.get_num_episodes(), num_episodes)
+                dataset_file_handler.close()
+
+                # load the episodes from the dataset
+                dataset_file_handler = HDF5DatasetFileHandler()
+                dataset_file_handler.open(dataset_file_path)
+                for episode_name in dataset_file_handler.get_episode_names():
+                    loaded_episode = dataset_file_handler.load_episode(episode_name, device=device)
+                    self.assertEqual(loaded_episode.success, test_episode.success)
+                    self.assertTrue(torch.equal(loaded_episode.data["actions"], test_episode.data["actions"][:3]))
+                    self.assertTrue(
+                        torch.equal(
+                            loaded_episode.data["obs"]["policy"]["term1"], test_episode.data["obs"]["policy"]["term1"]
+                        )
+                    )
+                dataset_file_handler.close()
+
+    def test_async_write_episode_flushes_file(self):
+        """Test that the episodes written in a background thread are on disk before the file is closed."""
+        dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+        dataset_file_handler = AsyncDatasetFileHandler(HDF5DatasetFileHandler())
+        dataset_file_handler.create(dataset_file_path, "test_env_name")
+        test_episode = create_test_episode("cpu")
+        for _ in range(3):
+            dataset_file_handler.write_episode(test_episode)
+        # wait for the writer thread without flushing or closing the file
+        dataset_file_handler._queue.join()
+
+        # reopen a copy of the file, as left on disk if the process stopped here
+        copied_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+        shutil.copy(dataset_file_path, copied_file_path)
+        copied_file_handler = HDF5DatasetFileHandler()
+        copied_file_handler.open(copied_file_path)
+        self.assertEqual(copied_file_handler.get_num_episodes(), 3)
+        for episode_name in copied_file_handler.get_episode_names():
+            loaded_episode = copied_file_handler.load_episode(episode_name, device="cpu")
+            self.assertTrue(torch.equal(loaded_episode.data["actions"], test_episode.data["actions"]))
+        copied_file_handler.close()
+        dataset_file_handler.close()
+
+    def test_async_write_episode_failure(self):
+        """Test that an error of the background writer thread is raised by the next write."""
+
+        class FailingDatasetFileHandler(HDF5DatasetFileHandler):
+            def write_episode(self, episode: EpisodeData):
+                raise OSError("Disk is full.")
+
+        dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+        dataset_file_handler = AsyncDatasetFileHandler(FailingDatasetFileHandler())
+        dataset_file_handler.create(dataset_file_path, "test_env_name")
+        test_episode = create_test_episode("cpu")
+        dataset_file_handler.write_episode(test_episode)
+        dataset_file_handler._queue.join()
+        with self.assertRaises(RuntimeError):
+            dataset_file_handler.write_episode(test_episode)
+        dataset_file_handler.close()
+
+    def test_compressed_dataset_layout(self):
+        """Test writing episodes with chunked and compressed datasets."""
+        dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+        dataset_file_handler = HDF5DatasetFileHandler(
+            compression="gzip", compression_opts=4, chunk_length=2, key_compression={"obs/.*": "lzf"}
+        )
+        dataset_file_handler.create(dataset_file_path, "test_env_name")
+        test_episode = create_test_episode("cpu")
+        dataset_file_handler.write_episode(test_episode)
+        dataset_file_handler.close()
+
+        # check the layout of the datasets
+        with h5py.File(dataset_file_path, "r") as h5_file:
+            actions = h5_file["data/demo_0/actions"]
+            self.assertEqual(actions.compression, "gzip")
+            self.assertEqual(actions.compression_opts, 4)
+            self.assertEqual(actions.chunks, (2, 3))
+            self.assertEqual(actions.maxshape, (None, 3))
+            self.assertEqual(h5_file["data/demo_0/obs/policy/term1"].compression, "lzf")
+
+        # check the data of the episode
+        dataset_file_handler = HDF5DatasetFileHandler()
+        dataset_file_handler.open(dataset_file_path)
+        loaded_episode = dataset_file_handler.load_episode("demo_0", device="cpu")
+        self.assertTrue(torch.equal(loaded_episode.data["actions"], test_episode.data["actions"]))
+        self.assertTrue(
+            torch.equal(loaded_episode.data["obs"]["policy"]["term1"], test_episode.data["obs"]["policy"]["term1"])
+        )
+        dataset_file_handler.close()
+
+    def test_lazy_load_and_select_episodes(self):
+        """Test loading episodes lazily and selecting them by their success flag."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+                dataset_file_handler = HDF5DatasetFileHandler()
+                dataset_file_handler.create(dataset_file_path, "test_env_name")
+                test_episode = create_test_episode(device)
+                for success in (True, False, True):
+                    test_episode.success = success
+                    dataset_file_handler.write_episode(test_episode)
+                dataset_file_handler.close()
+
+                dataset_file_handler = HDF5DatasetFileHandler()
+                dataset_file_handler.open(dataset_file_path)
+                # select the episodes using the index
+                self.assertEqual(list(dataset_file_handler.get_episode_names(success=True)), ["demo_0", "demo_2"])
+                self.assertEqual(list(dataset_file_handler.get_episode_names(success=False)), ["demo_1"])
+
+                # load an episode lazily
+                loaded_episode = dataset_file_handler.load_episode("demo_0", device=device, lazy=True)
+                self.assertIsInstance(loaded_episode.data, HDF5GroupView)
+                self.assertEqual(set(loaded_episode.data), {"initial_state", "actions", "obs"})
+                self.assertTrue(torch.equal(loaded_episode.get_initial_state(), test_episode.get_initial_state()))
+                for action in test_episode.data["actions"]:
+                    self.assertTrue(torch.equal(loaded_episode.get_next_action(), action))
+                self.assertTrue(
+                    torch.equal(
+                        loaded_episode.data["obs"]["policy"]["term1"], test_episode.data["obs"]["policy"]["term1"]
+                    )
+                )
+                # adding data converts the episode data into dictionaries
+                loaded_episode.add("actions", torch.tensor([10, 11, 12], device=device))
+                self.assertIsInstance(loaded_episode.data["obs"], dict)
+                self.assertEqual(len(loaded_episode.data["actions"]), 4)
+                dataset_file_handler.close()
+
 
 if __name__ == "__main__":
     run_tests()
@@ -583,6 +583,31 @@ class TestMathUtilities(unittest.TestCase):
             np.testing.assert_array_almost_equal(result_quat, expected_quat, decimal=DECIMAL_PRECISION)
             np.testing.assert_array_almost_equal(result_pos, expected_pos, decimal=DECIMAL_PRECISION)
 
+    def test_interpolate_poses_batched(self):
+        """Test that a batch of poses is interpolated as each pair of poses of the batch."""
+        poses_1 = torch.stack([math_utils.generate_random_transformation_matrix() for _ in range(NUM_ITERS)])
+        poses_2 = torch.stack([math_utils.generate_random_transformation_matrix() for _ in range(NUM_ITERS)])
+        # include pairs with the same rotation
+        poses_2[::10, :3, :3] = poses_1[::10, :3, :3]
+
+        for axis_angle in (True, False):
+            interpolated_rotations = math_utils.interpolate_rotations(
+                poses_1[:, :3, :3], poses_2[:, :3, :3], 7, axis_angle=axis_angle
+            )
+            self.assertEqual(interpolated_rotations.shape, (8, NUM_ITERS, 3, 3))
+            for i in range(0, NUM_ITERS, 7):
+                expected = math_utils.interpolate_rotations(
+                    poses_1[i, :3, :3], poses_2[i, :3, :3], 7, axis_angle=axis_angle
+                )
+                torch.testing.assert_close(interpolated_rotations[:, i], expected)
+
+        interpolated_poses, num_steps = math_utils.interpolate_poses(poses_1, poses_2, 5)
+        self.assertEqual(num_steps, 5)
+        self.assertEqual(interpolated_poses.shape, (7, NUM_ITERS, 4, 4))
+        for i in range(0, NUM_ITERS, 7):
+            expected, _ = math_utils.interpolate_poses(poses_1[i], poses_2[i], 5)
+            torch.testing.assert_close(interpolated_poses[:, i], expected)
+
 
 if __name__ == "__main__":
     run_tests()
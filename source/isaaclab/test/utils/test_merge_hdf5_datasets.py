@@ -0,0 +1,157 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import h5py
+import os
+import shutil
+import subprocess
+import tempfile
+import torch
+import unittest
+
+from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+
+# path to the root of the repository
+WORKFLOW_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../../.."))
+
+
+def create_test_episode(value: float, success: bool, seed: int = 0) -> EpisodeData:
+    """Create a test episode with dummy data filled with the given value."""
+    test_episode = EpisodeData()
+    test_episode.seed = seed
+    test_episode.success = success
+    test_episode.add("initial_state", torch.full((3,), value))
+    for _ in range(4):
+        test_episode.add("actions", torch.full((3,), value))
+        test_episode.add("obs/policy/term1", torch.full((5,), value))
+    return test_episode
+
+
+class TestMergeHDF5Datasets(unittest.TestCase):
+    """Test the script to merge HDF5 datasets."""
+
+    def setUp(self):
+        # create a temporary directory to store the test datasets
+        self.temp_dir = tempfile.mkdtemp()
+        # create the input files
+        # note: the last episode of the second file is a duplicate of the first episode of the first file,
+        #   and the other episodes only differ from each other by their attributes
+        self.input_files = []
+        for file_idx, episodes in enumerate([
+            [(1.0, True, 0), (1.0, False, 0), (1.0, True, 1)],
+            [(2.0, True, 0), (1.0, True, 0)],
+        ]):
+            dataset_file_path = os.path.join(self.temp_dir, f"input_{file_idx}.hdf5")
+            dataset_file_handler = HDF5DatasetFileHandler()
+            dataset_file_handler.create(dataset_file_path, "test_env_name")
+            for value, success, seed in episodes:
+                dataset_file_handler.write_episode(create_test_episode(value, success, seed))
+            dataset_file_handler.close()
+            self.input_files.append(dataset_file_path)
+
+    def tearDown(self):
+        # delete the temporary directory after the test
+        shutil.rmtree(self.temp_dir)
+
+    def test_merge(self):
+        """Test merging the episodes into a single file."""
+        for num_workers in (1, 2):
+            with self.subTest(num_workers=num_workers):
+                output_file = self._merge(f"merged_{num_workers}.hdf5", "--num_workers", str(num_workers))
+                self._check_merged_episodes(output_file, [1.0, 1.0, 1.0, 2.0, 1.0], [True, False, True, True, True])
+                # the episodes are copied into the output file
+                with h5py.File(output_file, "r") as h5_file:
+                    self.assertIsInstance(h5_file["data"].get("demo_0", getlink=True), h5py.HardLink)
+
+    def test_merge_shards(self):
+        """Test merging the episodes into shard files referred to by an index file."""
+        output_file = self._merge("merged.hdf5", "--num_workers", "2", "--num_shards", "2")
+        self._check_merged_episodes(output_file, [1.0, 1.0, 1.0, 2.0, 1.0], [True, False, True, True, True])
+        # the episodes are split between the shards
+        for shard_idx, num_episodes in enumerate((3, 2)):
+            shard_file = os.path.join(self.temp_dir, f"merged_shard_{shard_idx}.hdf5")
+            with h5py.File(shard_file, "r") as h5_file:
+                self.assertEqual(len(h5_file["data"]), num_episodes)
+        with h5py.File(output_file, "r") as h5_file:
+            self.assertIsInstance(h5_file["data"].get("demo_4", getlink=True), h5py.ExternalLink)
+
+    def test_merge_link(self):
+        """Test merging the episodes with external links to the input files."""
+        output_file = self._merge("merged.hdf5", "--link")
+        self._check_merged_episodes(output_file, [1.0, 1.0, 1.0, 2.0, 1.0], [True, False, True, True, True])
+        with h5py.File(output_file, "r") as h5_file:
+            link = h5_file["data"].get("demo_3", getlink=True)
+            self.assertIsInstance(link, h5py.ExternalLink)
+            self.assertEqual((link.filename, link.path), ("input_1.hdf5", "data/demo_0"))
+
+    def test_merge_dedupe(self):
+        """Test that only the episodes with the same data and attributes are skipped."""
+        for num_shards in (1, 2):
+            with self.subTest(num_shards=num_shards):
+                output_file = self._merge(
+                    f"merged_{num_shards}.hdf5", "--num_workers", "2", "--num_shards", str(num_shards), "--dedupe"
+                )
+                self._check_merged_episodes(output_file, [1.0, 1.0, 1.0, 2.0], [True, False, True, True])
+                # the episodes that only differ by their seed are kept
+                dataset_file_handler = HDF5DatasetFileHandler()
+                dataset_file_handler.open(output_file)
+                seeds = [dataset_file_handler.load_episode(f"demo_{idx}", device="cpu").seed for idx in range(4)]
+                self.assertEqual(seeds, [0, 0, 1, 0])
+                dataset_file_handler.close()
+
+    """
+    Helper functions.
+    """
+
+    def _merge(self, output_file_name: str, *args: str) -> str:
+        """Run the merge script on the input files and return the path to the output file."""
+        output_file = os.path.join(self.temp_dir, output_file_name)
+        command = [
+            WORKFLOW_ROOT + "/isaaclab.sh",
+            "-p",
+            os.path.join(WORKFLOW_ROOT, "scripts/tools/merge_hdf5_datasets.py"),
+            "--input_files",
+            *self.input_files,
+            "--output_file",
+            output_file,
+            *args,
+        ]
+        result = subprocess.run(command, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        return output_file
+
+    def _check_merged_episodes(self, output_file: str, values: list[float], successes: list[bool]):
+        """Check the data and the index of the episodes of a merged file."""
+        dataset_file_handler = HDF5DatasetFileHandler()
+        dataset_file_handler.open(output_file)
+        self.assertEqual(dataset_file_handler.get_env_name(), "test_env_name")
+        self.assertEqual(dataset_file_handler.get_num_episodes(), len(values))
+        episode_names = [f"demo_{idx}" for idx in range(len(values))]
+        self.assertEqual(list(dataset_file_handler.get_episode_names()), episode_names)
+        # check the index of the successful episodes
+        self.assertEqual(
+            list(dataset_file_handler.get_episode_names(success=True)),
+            [name for name, success in zip(episode_names, successes) if success],
+        )
+        # check the data of the episodes
+        for episode_name, value, success in zip(episode_names, values, successes):
+            episode = dataset_file_handler.load_episode(episode_name, device="cpu")
+            self.assertEqual(episode.success, success)
+            self.assertTrue(torch.equal(episode.data["actions"], torch.full((4, 3), value)))
+            self.assertTrue(torch.equal(episode.data["obs"]["policy"]["term1"], torch.full((4, 5), value)))
+        dataset_file_handler.close()
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,103 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import json
+import time
+import torch
+import unittest
+
+from isaaclab.utils.profiler import StepProfiler
+
+
+class TestStepProfiler(unittest.TestCase):
+    """Test fixture for the StepProfiler class."""
+
+    def test_section_times(self):
+        """Test that the times of the sections are summed per step and averaged over the window."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                profiler = StepProfiler(device=device, window_size=3)
+                data = torch.rand(256, 256, device=device)
+                for _ in range(5):
+                    profiler.start("step")
+                    # a section called several times per step
+                    for _ in range(2):
+                        with profiler.section("matmul"):
+                            data = data @ data
+                            data /= data.norm()
+                    with profiler.section("sleep"):
+                        time.sleep(0.01)
+                    profiler.stop("step")
+                    profiler.step()
+                profiler.synchronize()
+                stats = profiler.get_stats()
+
+                # check the sections and the window
+                self.assertEqual(list(stats.keys()), ["matmul", "sleep", "step"])
+                self.assertEqual(profiler.num_steps, 5)
+                for section_stats in stats.values():
+                    self.assertEqual(section_stats["num_steps"], 3)
+                    self.assertLessEqual(section_stats["min_ms"], section_stats["mean_ms"])
+                    self.assertLessEqual(section_stats["mean_ms"], section_stats["max_ms"])
+                # check the times
+                if device == "cpu":
+                    self.assertGreaterEqual(stats["sleep"]["min_ms"], 10.0)
+                self.assertGreaterEqual(stats["step"]["min_ms"], stats["matmul"]["min_ms"])
+
+                # check the exports
+                log = profiler.get_log()
+                self.assertAlmostEqual(log["Profile/sleep"], stats["sleep"]["mean_ms"])
+                self.assertEqual(json.loads(profiler.to_json()), stats)
+                self.assertIn("matmul", profiler.to_table())
+
+                # check the reset
+                profiler.reset()
+                self.assertEqual(profiler.get_stats(), {})
+
+    def test_wrap(self):
+        """Test that a wrapped callable is timed and forwards its attributes."""
+
+        class Term:
+            def __init__(self):
+                self.num_resets = 0
+
+            def __call__(self, value: int) -> int:
+                return 2 * value
+
+            def reset(self):
+                self.num_resets += 1
+
+        profiler = StepProfiler()
+        term = profiler.wrap("term", Term())
+        self.assertEqual(term(3), 6)
+        term.reset()
+        self.assertEqual(term.num_resets, 1)
+        profiler.step()
+        self.assertEqual(profiler.get_stats()["term"]["num_steps"], 1)
+
+    def test_invalid_sections(self):
+        """Test that starting a running section or stopping a section that is not running fails."""
+        profiler = StepProfiler()
+        with self.assertRaises(RuntimeError):
+            profiler.stop("section")
+        profiler.start("section")
+        with self.assertRaises(RuntimeError):
+            profiler.start("section")
+        with self.assertRaises(ValueError):
+            StepProfiler(window_size=0)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -190,6 +190,27 @@ class TestStringUtilities(unittest.TestCase):
         with self.assertRaises(ValueError):
             _ = string_utils.resolve_matching_names_values(query_names, target_names, preserve_order=True)
 
+    def test_resolve_matching_names_memoized(self):
+        """Test that the memoized results of resolving matching names are not shared between the callers."""
+        target_names = ["a", "b", "c", "d", "e"]
+        index_list, names_list = string_utils.resolve_matching_names(["d|e", "a"], target_names, preserve_order=True)
+        # modify the returned lists
+        index_list.append(10)
+        names_list.clear()
+        # resolve the same names again
+        index_list, names_list = string_utils.resolve_matching_names(["d|e", "a"], target_names, preserve_order=True)
+        self.assertEqual(index_list, [3, 4, 0])
+        self.assertEqual(names_list, ["d", "e", "a"])
+        # the values are resolved for the same keys with different values
+        _, _, values_list = string_utils.resolve_matching_names_values({"d|e": 1, "a": 2}, target_names, True)
+        self.assertEqual(values_list, [1, 1, 2])
+        _, _, values_list = string_utils.resolve_matching_names_values({"d|e": [3], "a": None}, target_names, True)
+        self.assertEqual(values_list, [[3], [3], None])
+        # the errors are raised at every call
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                string_utils.resolve_matching_names(["a|b", "b"], target_names)
+
 
 if __name__ == "__main__":
     run_tests()
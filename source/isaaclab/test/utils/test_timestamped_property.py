@@ -0,0 +1,83 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import torch
+import unittest
+
+from isaaclab.utils.buffers import TimestampedBuffer, timestamped_property
+
+
+class _Data:
+    """Data container with a lazy buffer and a quantity derived from it."""
+
+    def __init__(self):
+        self._sim_timestamp = 0.0
+        self._state = TimestampedBuffer()
+        self.num_reads = 0
+
+    @property
+    def state(self) -> torch.Tensor:
+        if self._state.timestamp < self._sim_timestamp:
+            self._state.data = torch.full((4, 3), self._sim_timestamp)
+            self._state.timestamp = self._sim_timestamp
+            self.num_reads += 1
+        return self._state.data
+
+    @timestamped_property(dependencies=("_state",))
+    def state_norm(self) -> torch.Tensor:
+        """Norm of the state."""
+        return torch.linalg.norm(self.state, dim=-1)
+
+
+class TestTimestampedProperty(unittest.TestCase):
+    """Test fixture for the timestamped properties."""
+
+    def test_memoization(self):
+        """Test that the property is computed once per timestamp."""
+        data = _Data()
+        for step in range(3):
+            data._sim_timestamp += 0.5
+            for _ in range(4):
+                torch.testing.assert_close(data.state_norm, torch.linalg.norm(data.state, dim=-1))
+            self.assertEqual(data.num_reads, step + 1)
+        stats = timestamped_property.get_stats(data)["state_norm"]
+        self.assertEqual((stats.hits, stats.misses), (9, 3))
+        self.assertAlmostEqual(stats.hit_rate, 0.75)
+        # reset the counters
+        timestamped_property.reset_stats(data)
+        self.assertEqual(timestamped_property.get_stats(data)["state_norm"].hits, 0)
+
+    def test_invalidation_on_write(self):
+        """Test that the property is recomputed when its dependency is modified or invalidated."""
+        data = _Data()
+        norm = data.state_norm
+        # in-place modification of the dependency
+        data.state[0] = 3.0
+        self.assertFalse(torch.equal(data.state_norm, norm))
+        torch.testing.assert_close(data.state_norm, torch.linalg.norm(data.state, dim=-1))
+        # invalidation of the dependency
+        data._state.timestamp = -1.0
+        data.state_norm
+        self.assertEqual(data.num_reads, 2)
+        self.assertEqual(timestamped_property.get_stats(data)["state_norm"].misses, 3)
+
+    def test_read_only(self):
+        """Test that the property cannot be set."""
+        data = _Data()
+        with self.assertRaises(AttributeError):
+            data.state_norm = torch.zeros(4)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -9,4 +9,5 @@ from .data_generator import *
 from .datagen_info import *
 from .datagen_info_pool import *
 from .selection_strategy import *
+from .trajectory_executor import *
 from .waypoint import *
@@ -11,7 +11,8 @@ import numpy as np
 import torch
 
 from isaaclab_mimic.datagen.datagen_info import DatagenInfo
-from isaaclab_mimic.datagen.selection_strategy import make_selection_strategy
+from isaaclab_mimic.datagen.selection_strategy import SelectionStrategy, make_selection_strategy
+from isaaclab_mimic.datagen.trajectory_executor import MultiEnvTrajectoryExecutor
 from isaaclab_mimic.datagen.waypoint import WaypointSequence, WaypointTrajectory
 
 import isaaclab.utils.math as PoseUtils
@@ -144,8 +145,30 @@ class DataGenerator:
             # no reference object - only random selection is supported
             assert selection_strategy_name == "random"
 
-        # We need to collect the datagen info objects over the timesteps for the subtask segment in each source
-        # demo, so that it can be used by the selection strategy.
+        # make selection strategy object
+        selection_strategy_obj = make_selection_strategy(selection_strategy_name)
+        if selection_strategy_kwargs is None:
+            selection_strategy_kwargs = dict()
+
+        # Strategies that only depend on the poses at the start of the subtask segments select the source demo
+        # from the pose index of the datagen info pool.
+        if (
+            type(selection_strategy_obj).select_source_demo_from_poses
+            is not SelectionStrategy.select_source_demo_from_poses
+        ):
+            src_eef_poses, src_object_poses = self.src_demo_datagen_info_pool.get_poses_at(
+                src_subtask_inds[:, 0], object_name=subtask_object_name
+            )
+            return selection_strategy_obj.select_source_demo_from_poses(
+                eef_pose=eef_pose,
+                object_pose=object_pose,
+                src_eef_poses=src_eef_poses,
+                src_object_poses=src_object_poses,
+                **selection_strategy_kwargs,
+            )
+
+        # Otherwise, we need to collect the datagen info objects over the timesteps for the subtask segment in
+        # each source demo, so that it can be used by the selection strategy.
         src_subtask_datagen_infos = []
         for i in range(len(self.src_demo_datagen_info_pool.datagen_infos)):
             # datagen info over all timesteps of the src trajectory
@@ -176,12 +199,7 @@ class DataGenerator:
                 )
             )
 
-        # make selection strategy object
-        selection_strategy_obj = make_selection_strategy(selection_strategy_name)
-
         # run selection
-        if selection_strategy_kwargs is None:
-            selection_strategy_kwargs = dict()
         selected_src_demo_ind = selection_strategy_obj.select_source_demo(
             eef_pose=eef_pose,
             object_pose=object_pose,
@@ -196,6 +214,7 @@ class DataGenerator:
         env_id,
         success_term,
         env_action_queue: asyncio.Queue | None = None,
+        trajectory_executor: MultiEnvTrajectoryExecutor | None = None,
         select_src_per_subtask=False,
         transform_first_robot_pose=False,
         interpolate_from_last_target_pose=True,
@@ -212,6 +231,10 @@ class DataGenerator:
 
             env_action_queue (asyncio.Queue): queue to store actions for each environment
 
+            trajectory_executor (MultiEnvTrajectoryExecutor): executor stepping the trajectories of all the
+                environments together. If provided, the trajectory of each subtask is submitted to it at once
+                instead of sending each action through @env_action_queue.
+
             select_src_per_subtask (bool): if True, select a different source demonstration for each subtask
                 during data generation, else keep the same one for the entire episode
 
@@ -399,9 +422,12 @@ class DataGenerator:
             traj_to_execute.pop_first()
 
             # Execute the trajectory and collect data.
-            exec_results = await traj_to_execute.execute(
-                env=self.env, env_id=env_id, env_action_queue=env_action_queue, success_term=success_term
-            )
+            if trajectory_executor is not None:
+                exec_results = await trajectory_executor.execute(env_id=env_id, trajectory=traj_to_execute)
+            else:
+                exec_results = await traj_to_execute.execute(
+                    env=self.env, env_id=env_id, env_action_queue=env_action_queue, success_term=success_term
+                )
 
             # check that trajectory is non-empty
             if len(exec_results["states"]) > 0:
@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import torch
 
 from isaaclab_mimic.datagen.datagen_info import DatagenInfo
 
@@ -18,6 +19,10 @@ class DataGenInfoPool:
     This class is a container for storing `DatagenInfo` objects that are extracted from episodes.
     The pool supports the use of an asyncio lock to safely add new episodes to the pool while
     consuming the data, so it can be shared across multiple mimic data generators.
+
+    The pool also keeps an index of the end effector and object poses of all the episodes concatenated along
+    the time dimension. It allows gathering the poses of all the source demos at given time indices with a
+    single indexing operation, which is used by the selection strategies.
     """
 
     def __init__(self, env, env_cfg, device, asyncio_lock: asyncio.Lock | None = None):
@@ -30,6 +35,12 @@ class DataGenInfoPool:
         self._datagen_infos = []
         self._subtask_indices = []
 
+        # index of the poses of all the episodes concatenated along the time dimension
+        self._pose_index_num_episodes = 0
+        self._episode_start_inds = torch.zeros(0, dtype=torch.long, device=device)
+        self._eef_pose_index = None
+        self._object_pose_index = dict()
+
         self.env = env
         self.env_cfg = env_cfg
         self.device = device
@@ -65,6 +76,27 @@ class DataGenInfoPool:
         """Returns the number of datagen infos."""
         return len(self._datagen_infos)
 
+    def get_poses_at(self, time_inds, object_name: str | None = None):
+        """
+        Get the end effector and object poses of all the episodes at given time indices.
+
+        Args:
+            time_inds (np.array or torch.Tensor): time index in each episode of shape (N,), where N is
+                the number of episodes in the pool
+            object_name (str or None): name of the object to get the poses of. If None, the object
+                poses are not returned.
+
+        Returns:
+            eef_poses (torch.Tensor): end effector poses of shape (N, 4, 4)
+            object_poses (torch.Tensor or None): object poses of shape (N, 4, 4)
+        """
+        self._update_pose_index()
+        # flat indices of the poses in the index
+        flat_inds = self._episode_start_inds + torch.as_tensor(time_inds, dtype=torch.long, device=self.device)
+        eef_poses = self._eef_pose_index[flat_inds]
+        object_poses = self._object_pose_index[object_name][flat_inds] if object_name is not None else None
+        return eef_poses, object_poses
+
     async def add_episode(self, episode: EpisodeData):
         """
         Add a datagen info from the given episode.
@@ -91,9 +123,10 @@ class DataGenInfoPool:
         # extract datagen info
         if "datagen_info" in ep_grp["obs"]:
             eef_pose = ep_grp["obs"]["datagen_info"]["eef_pose"][eef_name]
-            object_poses_dict = ep_grp["obs"]["datagen_info"]["object_pose"]
+            # note: the groups of lazily loaded episodes are views of the file, which are converted to dictionaries
+            object_poses_dict = dict(ep_grp["obs"]["datagen_info"]["object_pose"].items())
             target_eef_pose = ep_grp["obs"]["datagen_info"]["target_eef_pose"][eef_name]
-            subtask_term_signals_dict = ep_grp["obs"]["datagen_info"]["subtask_term_signals"]
+            subtask_term_signals_dict = dict(ep_grp["obs"]["datagen_info"]["subtask_term_signals"].items())
         else:
             # Extract eef poses
             eef_pos = ep_grp["obs"]["eef_pos"]
@@ -179,6 +212,30 @@ class DataGenInfoPool:
 
         self._subtask_indices.append(ep_subtask_indices)
 
+    def _update_pose_index(self):
+        """
+        Append the poses of the episodes added since the last update to the pose index.
+        """
+        new_datagen_infos = self._datagen_infos[self._pose_index_num_episodes :]
+        if len(new_datagen_infos) == 0:
+            return
+        # start of each new episode in the concatenated poses
+        num_poses = self._eef_pose_index.shape[0] if self._eef_pose_index is not None else 0
+        lengths = torch.tensor([info.eef_pose.shape[0] for info in new_datagen_infos], device=self.device)
+        start_inds = num_poses + torch.cumsum(lengths, dim=0) - lengths
+        self._episode_start_inds = torch.cat([self._episode_start_inds, start_inds])
+        # concatenate the poses of the new episodes
+        eef_poses = [info.eef_pose.to(self.device) for info in new_datagen_infos]
+        if self._eef_pose_index is not None:
+            eef_poses.insert(0, self._eef_pose_index)
+        self._eef_pose_index = torch.cat(eef_poses)
+        for object_name in new_datagen_infos[0].object_poses:
+            object_poses = [info.object_poses[object_name].to(self.device) for info in new_datagen_infos]
+            if object_name in self._object_pose_index:
+                object_poses.insert(0, self._object_pose_index[object_name])
+            self._object_pose_index[object_name] = torch.cat(object_poses)
+        self._pose_index_num_episodes = len(self._datagen_infos)
+
     def load_from_dataset_file(self, file_path, select_demo_keys: str | None = None):
         """
         Load from a dataset file.
@@ -191,11 +248,13 @@ class DataGenInfoPool:
         dataset_file_handler.open(file_path)
         episode_names = dataset_file_handler.get_episode_names()
 
-        if len(episode_names) == 0:
-            return
-
-        for episode_name in episode_names:
-            if select_demo_keys is not None and episode_name not in select_demo_keys:
-                continue
-            episode = dataset_file_handler.load_episode(episode_name, self.device)
-            self._add_episode(episode)
+        # note: the file must remain open while the lazily loaded episodes are read
+        try:
+            for episode_name in episode_names:
+                if select_demo_keys is not None and episode_name not in select_demo_keys:
+                    continue
+                # load lazily to only read the datasets used for the datagen info
+                episode = dataset_file_handler.load_episode(episode_name, self.device, lazy=True)
+                self._add_episode(episode)
+        finally:
+            dataset_file_handler.close()
@@ -96,6 +96,35 @@ class SelectionStrategy(metaclass=SelectionStrategyMeta):
         """
         raise NotImplementedError
 
+    def select_source_demo_from_poses(
+        self,
+        eef_pose,
+        object_pose,
+        src_eef_poses,
+        src_object_poses,
+    ):
+        """
+        Selects source demonstration index using the current robot pose, relevant object pose
+        for the current subtask, and the robot and object poses at the start of the subtask segment
+        in each source demonstration.
+
+        Selection strategies that only depend on these poses can implement this method. The data generator
+        then gathers the poses of all the source demonstrations with a single indexing operation instead of
+        collecting the subtask segments of each source demonstration for :meth:`select_source_demo`.
+
+        Args:
+            eef_pose (torch.Tensor): current 4x4 eef pose
+            object_pose (torch.Tensor): current 4x4 object pose, for the object in this subtask
+            src_eef_poses (torch.Tensor or None): eef poses at the start of the subtask segment in the
+                source demonstrations of shape [N, 4, 4]
+            src_object_poses (torch.Tensor or None): poses of the object in this subtask at the start of
+                the subtask segment in the source demonstrations of shape [N, 4, 4]
+
+        Returns:
+            source_demo_ind (int): index of source demonstration - indicates which source subtask segment to use
+        """
+        raise NotImplementedError
+
 
 class RandomStrategy(SelectionStrategy):
     """
@@ -130,6 +159,34 @@ class RandomStrategy(SelectionStrategy):
         n_src_demo = len(src_subtask_datagen_infos)
         return torch.randint(0, n_src_demo, (1,)).item()
 
+    def select_source_demo_from_poses(
+        self,
+        eef_pose,
+        object_pose,
+        src_eef_poses,
+        src_object_poses,
+    ):
+        """
+        Selects source demonstration index using the current robot pose, relevant object pose
+        for the current subtask, and the robot and object poses at the start of the subtask segment
+        in each source demonstration.
+
+        Args:
+            eef_pose (torch.Tensor): current 4x4 eef pose
+            object_pose (torch.Tensor): current 4x4 object pose, for the object in this subtask
+            src_eef_poses (torch.Tensor or None): eef poses at the start of the subtask segment in the
+                source demonstrations of shape [N, 4, 4]
+            src_object_poses (torch.Tensor or None): poses of the object in this subtask at the start of
+                the subtask segment in the source demonstrations of shape [N, 4, 4]
+
+        Returns:
+            source_demo_ind (int): index of source demonstration - indicates which source subtask segment to use
+        """
+
+        # random selection
+        n_src_demo = src_eef_poses.shape[0]
+        return torch.randint(0, n_src_demo, (1,)).item()
+
 
 class NearestNeighborObjectStrategy(SelectionStrategy):
     """
@@ -176,6 +233,46 @@ class NearestNeighborObjectStrategy(SelectionStrategy):
             src_object_poses.append(src_obj_pose[0][0])
         src_object_poses = torch.stack(src_object_poses)
 
+        return self.select_source_demo_from_poses(
+            eef_pose=eef_pose,
+            object_pose=object_pose,
+            src_eef_poses=None,
+            src_object_poses=src_object_poses,
+            pos_weight=pos_weight,
+            rot_weight=rot_weight,
+            nn_k=nn_k,
+        )
+
+    def select_source_demo_from_poses(
+        self,
+        eef_pose,
+        object_pose,
+        src_eef_poses,
+        src_object_poses,
+        pos_weight=1.0,
+        rot_weight=1.0,
+        nn_k=3,
+    ):
+        """
+        Selects source demonstration index using the current robot pose, relevant object pose
+        for the current subtask, and the robot and object poses at the start of the subtask segment
+        in each source demonstration.
+
+        Args:
+            eef_pose (torch.Tensor): current 4x4 eef pose
+            object_pose (torch.Tensor): current 4x4 object pose, for the object in this subtask
+            src_eef_poses (torch.Tensor or None): eef poses at the start of the subtask segment in the
+                source demonstrations of shape [N, 4, 4]
+            src_object_poses (torch.Tensor or None): poses of the object in this subtask at the start of
+                the subtask segment in the source demonstrations of shape [N, 4, 4]
+            pos_weight (float): weight on position for minimizing pose distance
+            rot_weight (float): weight on rotation for minimizing pose distance
+            nn_k (int): pick source demo index uniformly at randomly from the top @nn_k nearest neighbors
+
+        Returns:
+            source_demo_ind (int): index of source demonstration - indicates which source subtask segment to use
+        """
+
         # split into positions and rotations
         all_src_obj_pos, all_src_obj_rot = PoseUtils.unmake_pose(src_object_poses)
         obj_pos, obj_rot = PoseUtils.unmake_pose(object_pose)
@@ -204,7 +301,7 @@ class NearestNeighborObjectStrategy(SelectionStrategy):
 
         # return one of the top-K nearest neighbors uniformly at random
         rand_k = torch.randint(0, nn_k, (1,)).item()
-        top_k_neighbors_in_order = torch.argsort(dists_to_minimize)[:nn_k]
+        top_k_neighbors_in_order = torch.topk(dists_to_minimize, nn_k, largest=False, sorted=True).indices
         return top_k_neighbors_in_order[rand_k]
 
 
@@ -258,6 +355,46 @@ class NearestNeighborRobotDistanceStrategy(SelectionStrategy):
         src_eef_poses = torch.stack(src_eef_poses)
         src_object_poses = torch.stack(src_object_poses)
 
+        return self.select_source_demo_from_poses(
+            eef_pose=eef_pose,
+            object_pose=object_pose,
+            src_eef_poses=src_eef_poses,
+            src_object_poses=src_object_poses,
+            pos_weight=pos_weight,
+            rot_weight=rot_weight,
+            nn_k=nn_k,
+        )
+
+    def select_source_demo_from_poses(
+        self,
+        eef_pose,
+        object_pose,
+        src_eef_poses,
+        src_object_poses,
+        pos_weight=1.0,
+        rot_weight=1.0,
+        nn_k=3,
+    ):
+        """
+        Selects source demonstration index using the current robot pose, relevant object pose
+        for the current subtask, and the robot and object poses at the start of the subtask segment
+        in each source demonstration.
+
+        Args:
+            eef_pose (torch.Tensor): current 4x4 eef pose
+            object_pose (torch.Tensor): current 4x4 object pose, for the object in this subtask
+            src_eef_poses (torch.Tensor or None): eef poses at the start of the subtask segment in the
+                source demonstrations of shape [N, 4, 4]
+            src_object_poses (torch.Tensor or None): poses of the object in this subtask at the start of
+                the subtask segment in the source demonstrations of shape [N, 4, 4]
+            pos_weight (float): weight on position for minimizing pose distance
+            rot_weight (float): weight on rotation for minimizing pose distance
+            nn_k (int): pick source demo index uniformly at randomly from the top @nn_k nearest neighbors
+
+        Returns:
+            source_demo_ind (int): index of source demonstration - indicates which source subtask segment to use
+        """
+
         # Get source eef poses with respect to object frames.
         # note: frame A is world, frame B is object
         src_object_poses_inv = PoseUtils.pose_inv(src_object_poses)
@@ -304,5 +441,5 @@ class NearestNeighborRobotDistanceStrategy(SelectionStrategy):
 
         # return one of the top-K nearest neighbors uniformly at random
         rand_k = torch.randint(0, nn_k, (1,)).item()
-        top_k_neighbors_in_order = torch.argsort(dists_to_minimize)[:nn_k]
+        top_k_neighbors_in_order = torch.topk(dists_to_minimize, nn_k, largest=False, sorted=True).indices
         return top_k_neighbors_in_order[rand_k]
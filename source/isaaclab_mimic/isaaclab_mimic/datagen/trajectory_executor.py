@@ -0,0 +1,232 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Executor stepping the waypoint trajectories of all the environments together.
+"""
+import asyncio
+import numpy as np
+import torch
+
+from isaaclab_mimic.datagen.waypoint import WaypointTrajectory
+
+
+class MultiEnvTrajectoryExecutor:
+    """
+    Executes the waypoint trajectories of the data generators of all the environments in lock-step.
+
+    Each data generator plans the trajectory of its environment for a subtask and submits it at once with
+    :meth:`execute`. The executor stores the target poses, gripper actions and action noise of the submitted
+    trajectories in batched buffers of shape (num_envs, T, ...), where T is the length of the longest trajectory.
+    At every :meth:`step`, the targets of all the environments are gathered with a single indexing operation,
+    converted to actions with :meth:`ManagerBasedRLMimicEnv.target_eef_poses_to_actions` and applied with a
+    single call to ``env.step``. The data generator of an environment is only resumed once its trajectory has
+    been executed, instead of exchanging every action through an asyncio queue.
+
+    A typical environment loop looks like:
+
+    .. code-block:: python
+
+        executor = MultiEnvTrajectoryExecutor(env, success_term)
+        # create one data generation task per environment, which awaits executor.execute(...)
+        while True:
+            asyncio_event_loop.run_until_complete(executor.wait_for_trajectories())
+            executor.step()
+    """
+
+    def __init__(self, env, success_term):
+        """
+        Args:
+            env (Isaac Lab ManagerBasedRLMimicEnv instance): environment to use for executing the trajectories
+            success_term (TerminationTermCfg): success term to check if the task is successful
+        """
+        self.env = env
+        self.success_term = success_term
+        self.num_envs = env.num_envs
+        self.device = env.device
+
+        (self._eef_name,) = env.cfg.subtask_configs.keys()
+        self._env_indices = torch.arange(self.num_envs, device=self.device)
+
+        # batched buffers of the submitted trajectories
+        # note: they are allocated at the first submission, when the dimension of the gripper actions is known
+        self._target_poses = None
+        self._gripper_actions = None
+        self._action_noise = None
+        self._actions = None
+        self._success = torch.zeros(self.num_envs, dtype=torch.bool, device=self.device)
+        # number of waypoints and number of executed waypoints of each trajectory (on the host)
+        self._lengths = np.zeros(self.num_envs, dtype=np.int64)
+        self._num_steps = np.zeros(self.num_envs, dtype=np.int64)
+        # futures to resolve once the trajectories are executed
+        self._futures: list[asyncio.Future | None] = [None] * self.num_envs
+        self._all_submitted = asyncio.Event()
+
+        # states and observations at each step, shared by the trajectories executed at that step
+        self._states = []
+        self._observations = []
+        self._first_record_step = 0
+        self._record_start_steps = np.zeros(self.num_envs, dtype=np.int64)
+        self._step_count = 0
+
+    def __repr__(self):
+        """
+        Pretty print this object.
+        """
+        msg = str(self.__class__.__name__)
+        msg += " (\n\tnum_envs={}\n\tnum_active_envs={}\n)".format(self.num_envs, self.num_active_envs)
+        return msg
+
+    @property
+    def num_active_envs(self):
+        """Returns the number of environments with a trajectory being executed."""
+        return int(np.count_nonzero(self._num_steps < self._lengths))
+
+    async def execute(self, env_id, trajectory: WaypointTrajectory):
+        """
+        Submit the trajectory of an environment and wait until it is executed.
+
+        Args:
+            env_id (int): environment index
+            trajectory (WaypointTrajectory instance): trajectory to execute
+
+        Returns:
+            results (dict): dictionary with the following items for the executed trajectory:
+                states (list): simulator state at each timestep
+                observations (list): observation dictionary at each timestep
+                actions (torch.Tensor): action executed at each timestep
+                success (bool): whether the trajectory successfully solved the task or not
+        """
+        if self._futures[env_id] is not None:
+            raise RuntimeError(f"A trajectory is already being executed in the environment {env_id}.")
+        target_poses, gripper_actions, action_noise = trajectory.get_targets()
+        num_waypoints = target_poses.shape[0]
+        if num_waypoints == 0:
+            return dict(states=[], observations=[], actions=torch.zeros(0, device=self.device), success=False)
+
+        # resize the buffers if needed
+        self._reserve(num_waypoints, gripper_actions.shape[-1])
+        # store the trajectory
+        self._target_poses[env_id, :num_waypoints] = target_poses
+        self._gripper_actions[env_id, :num_waypoints] = gripper_actions
+        self._action_noise[env_id, :num_waypoints] = action_noise
+        self._success[env_id] = False
+        self._lengths[env_id] = num_waypoints
+        self._num_steps[env_id] = 0
+        self._record_start_steps[env_id] = self._step_count
+
+        # wait for the execution
+        future = asyncio.get_running_loop().create_future()
+        self._futures[env_id] = future
+        if all(future is not None for future in self._futures):
+            self._all_submitted.set()
+        return await future
+
+    async def wait_for_trajectories(self):
+        """
+        Wait until a trajectory has been submitted for every environment.
+
+        This runs the data generators of the environments whose trajectory has been executed, so that they can
+        plan and submit their next trajectory.
+        """
+        await self._all_submitted.wait()
+
+    def step(self):
+        """
+        Step the environment with the current waypoint of the trajectory of each environment.
+        """
+        # gather the current waypoints of all the environments
+        waypoint_inds = torch.from_numpy(self._num_steps).to(self.device)
+        target_poses = self._target_poses[self._env_indices, waypoint_inds]
+        gripper_actions = self._gripper_actions[self._env_indices, waypoint_inds]
+        action_noise = self._action_noise[self._env_indices, waypoint_inds]
+
+        # current state
+        self._states.append(self.env.scene.get_state(is_relative=True))
+
+        # convert target poses and gripper actions to env actions
+        actions = self.env.target_eef_poses_to_actions(
+            target_eef_pose_dict={self._eef_name: target_poses},
+            gripper_action_dict={self._eef_name: gripper_actions},
+            noise=action_noise,
+        )
+        self._actions[self._env_indices, waypoint_inds] = actions
+
+        # step environment
+        obs, _, _, _, _ = self.env.step(actions)
+        self._observations.append(obs)
+        self._step_count += 1
+
+        # if the task success metric is True once during the execution, then the task is considered successful
+        self._success |= self.success_term.func(self.env, **self.success_term.params).bool()
+
+        # resolve the trajectories that are executed
+        self._num_steps += 1
+        done_env_ids = np.flatnonzero(self._num_steps == self._lengths)
+        if len(done_env_ids) > 0:
+            self._all_submitted.clear()
+            success = self._success[done_env_ids].tolist()
+            for env_id, env_success in zip(done_env_ids.tolist(), success):
+                self._resolve(env_id, env_success)
+            self._discard_records()
+
+    def _reserve(self, num_waypoints, gripper_action_dim):
+        """
+        Allocate the buffers of the trajectories if they cannot hold @num_waypoints waypoints.
+
+        Args:
+            num_waypoints (int): number of waypoints of a trajectory
+            gripper_action_dim (int): dimension of the gripper actions
+        """
+        if self._target_poses is not None and self._target_poses.shape[1] >= num_waypoints:
+            return
+        # grow geometrically to limit the number of re-allocations
+        old_length = self._target_poses.shape[1] if self._target_poses is not None else 0
+        length = max(num_waypoints, 2 * old_length)
+        action_dim = self.env.action_manager.total_action_dim
+
+        def resize(buffer, shape, dtype=torch.float32):
+            new_buffer = torch.zeros(shape, dtype=dtype, device=self.device)
+            if buffer is not None:
+                new_buffer[:, :old_length] = buffer
+            return new_buffer
+
+        self._target_poses = resize(self._target_poses, (self.num_envs, length, 4, 4))
+        self._gripper_actions = resize(self._gripper_actions, (self.num_envs, length, gripper_action_dim))
+        self._action_noise = resize(self._action_noise, (self.num_envs, length))
+        self._actions = resize(self._actions, (self.num_envs, length, action_dim))
+
+    def _resolve(self, env_id, success):
+        """
+        Resolve the future of the executed trajectory of an environment with its results.
+
+        Args:
+            env_id (int): environment index
+            success (bool): whether the trajectory successfully solved the task or not
+        """
+        num_waypoints = self._lengths[env_id]
+        start = self._record_start_steps[env_id] - self._first_record_step
+        results = dict(
+            states=self._states[start : start + num_waypoints],
+            observations=self._observations[start : start + num_waypoints],
+            # note: the actions have the same layout as the ones returned by WaypointTrajectory.execute
+            actions=self._actions[env_id, :num_waypoints].clone().unsqueeze(1),
+            success=success,
+        )
+        future = self._futures[env_id]
+        self._futures[env_id] = None
+        future.set_result(results)
+
+    def _discard_records(self):
+        """
+        Discard the states and observations that are not needed by the trajectories being executed.
+        """
+        active = np.array([future is not None for future in self._futures], dtype=bool)
+        first_needed_step = int(self._record_start_steps[active].min()) if np.any(active) else self._step_count
+        num_discarded = first_needed_step - self._first_record_step
+        if num_discarded > 0:
+            del self._states[:num_discarded]
+            del self._observations[:num_discarded]
+            self._first_record_step = first_needed_step
@@ -39,6 +39,10 @@ class Waypoint:
 class WaypointSequence:
     """
     Represents a sequence of Waypoint objects.
+
+    The waypoints are stored as tensors with a leading time dimension: the poses have shape (T, 4, 4), the
+    gripper actions have shape (T, D) and the action noise amplitudes have shape (T,). Waypoints without noise
+    have a NaN noise amplitude. Waypoint objects are only created when the sequence is indexed.
     """
 
     def __init__(self, sequence=None):
@@ -46,12 +50,23 @@ class WaypointSequence:
         Args:
             sequence (list or None): if provided, should be a list of Waypoint objects
         """
-        if sequence is None:
-            self.sequence = []
+        if sequence is None or len(sequence) == 0:
+            self.eef_names = None
+            self.poses = torch.zeros((0, 4, 4), dtype=torch.float32)
+            self.gripper_actions = torch.zeros((0, 1), dtype=torch.float32)
+            self.action_noise = torch.zeros(0, dtype=torch.float32)
         else:
             for waypoint in sequence:
                 assert isinstance(waypoint, Waypoint)
-            self.sequence = deepcopy(sequence)
+            # note: stacking copies the data of the waypoints
+            self.eef_names = sequence[0].eef_names
+            self.poses = torch.stack([waypoint.pose for waypoint in sequence])
+            self.gripper_actions = torch.stack([waypoint.gripper_action for waypoint in sequence])
+            self.action_noise = torch.tensor(
+                [float(waypoint.noise) if waypoint.noise is not None else float("nan") for waypoint in sequence],
+                dtype=torch.float32,
+                device=self.poses.device,
+            )
 
     @classmethod
     def from_poses(cls, eef_names, poses, gripper_actions, action_noise):
@@ -73,30 +88,32 @@ class WaypointSequence:
         # handle scalar to tensor conversion
         num_timesteps = poses.shape[0]
         if isinstance(action_noise, float):
-            action_noise = action_noise * torch.ones((num_timesteps, 1), dtype=torch.float32)
-        action_noise = action_noise.reshape(-1, 1)
+            action_noise = torch.full((num_timesteps,), action_noise, dtype=torch.float32, device=poses.device)
+        else:
+            # note: the noise is copied since it can be modified when merging trajectories
+            action_noise = action_noise.reshape(-1).to(device=poses.device, dtype=torch.float32, copy=True)
 
         # make WaypointSequence instance
-        sequence = [
-            Waypoint(
-                eef_names=eef_names,
-                pose=poses[t],
-                gripper_action=gripper_actions[t],
-                noise=action_noise[t, 0],
-            )
-            for t in range(num_timesteps)
-        ]
-        return cls(sequence=sequence)
+        sequence = cls()
+        sequence.eef_names = eef_names
+        sequence.poses = poses
+        sequence.gripper_actions = gripper_actions
+        sequence.action_noise = action_noise
+        return sequence
+
+    @property
+    def sequence(self):
+        """
+        Returns the list of Waypoint objects of the sequence.
+        """
+        return [self[ind] for ind in range(len(self))]
 
     def get_poses(self):
-        poses = []
-        for waypoint in self.sequence:
-            poses.append(waypoint.pose[:2, 3])
-        return poses
+        return list(self.poses[:, :2, 3])
 
     def __len__(self):
         # length of sequence
-        return len(self.sequence)
+        return self.poses.shape[0]
 
     def __getitem__(self, ind):
         """
@@ -105,13 +122,28 @@ class WaypointSequence:
         Returns:
             waypoint (Waypoint instance)
         """
-        return self.sequence[ind]
+        noise = self.action_noise[ind]
+        return Waypoint(
+            eef_names=self.eef_names,
+            pose=self.poses[ind],
+            gripper_action=self.gripper_actions[ind],
+            noise=None if torch.isnan(noise) else noise,
+        )
 
     def __add__(self, other):
         """
         Defines addition (concatenation) of sequences
         """
-        return WaypointSequence(sequence=(self.sequence + other.sequence))
+        if len(self) == 0:
+            return other._slice(slice(None))
+        if len(other) == 0:
+            return self._slice(slice(None))
+        return WaypointSequence.from_poses(
+            eef_names=self.eef_names,
+            poses=torch.cat([self.poses, other.poses]),
+            gripper_actions=torch.cat([self.gripper_actions, other.gripper_actions]),
+            action_noise=torch.cat([self.action_noise, other.action_noise]),
+        )
 
     def __str__(self):
         """Prints all waypoints in the sequence."""
@@ -128,16 +160,25 @@ class WaypointSequence:
         Returns:
             waypoint (Waypoint instance)
         """
-        return deepcopy(self.sequence[-1])
+        return deepcopy(self[-1])
 
     def split(self, ind):
         """
         Splits this sequence into 2 pieces, the part up to time index @ind, and the
         rest. Returns 2 WaypointSequence objects.
         """
-        seq_1 = self.sequence[:ind]
-        seq_2 = self.sequence[ind:]
-        return WaypointSequence(sequence=seq_1), WaypointSequence(sequence=seq_2)
+        return self._slice(slice(None, ind)), self._slice(slice(ind, None))
+
+    def _slice(self, time_slice):
+        """
+        Returns the sequence of the waypoints in the time slice @time_slice.
+        """
+        return WaypointSequence.from_poses(
+            eef_names=self.eef_names,
+            poses=self.poses[time_slice],
+            gripper_actions=self.gripper_actions[time_slice],
+            action_noise=self.action_noise[time_slice],
+        )
 
 
 class WaypointTrajectory:
@@ -184,11 +225,25 @@ class WaypointTrajectory:
         return self.waypoint_sequences[-1].last_waypoint
 
     def get_poses(self):
-        poses = []
-        for waypoint_sequence in self.waypoint_sequences:
-            for waypoint in waypoint_sequence:
-                poses.append(waypoint.pose[:2, 3])
-        return poses
+        return list(self.get_targets()[0][:, :2, 3])
+
+    def get_targets(self):
+        """
+        Get the target poses, gripper actions and action noise of all the waypoints in the trajectory.
+
+        Returns:
+            poses (torch.Tensor): target poses of shape (T, 4, 4)
+            gripper_actions (torch.Tensor): gripper actions of shape (T, D)
+            action_noise (torch.Tensor): action noise amplitudes of shape (T,). The amplitude is zero for
+                the waypoints without noise.
+        """
+        sequences = [sequence for sequence in self.waypoint_sequences if len(sequence) > 0]
+        if len(sequences) == 0:
+            return torch.zeros(0, 4, 4), torch.zeros(0, 1), torch.zeros(0)
+        poses = torch.cat([sequence.poses for sequence in sequences])
+        gripper_actions = torch.cat([sequence.gripper_actions for sequence in sequences])
+        action_noise = torch.cat([sequence.action_noise for sequence in sequences]).nan_to_num(nan=0.0)
+        return poses, gripper_actions, action_noise
 
     def add_waypoint_sequence(self, sequence):
         """
@@ -338,7 +393,7 @@ class WaypointTrajectory:
                 )
 
             # make sure to preserve noise from first element of other trajectory
-            self.waypoint_sequences[-1][-1].noise = target_for_interpolation.noise
+            self.waypoint_sequences[-1].action_noise[-1] = other_first.action_noise[0]
 
         # concatenate the trajectories
         self.waypoint_sequences += other.waypoint_sequences
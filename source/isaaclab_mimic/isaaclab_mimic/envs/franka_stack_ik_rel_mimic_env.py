@@ -52,6 +52,38 @@ class FrankaCubeStackIKRelMimicEnv(ManagerBasedRLMimicEnv):
         Returns:
             An action torch.Tensor that's compatible with env.step().
         """
+        if noise is not None:
+            noise = torch.tensor([noise], device=self.device)
+        actions = self.target_eef_poses_to_actions(
+            target_eef_pose_dict={eef_name: pose.unsqueeze(0) for eef_name, pose in target_eef_pose_dict.items()},
+            gripper_action_dict={eef_name: action.unsqueeze(0) for eef_name, action in gripper_action_dict.items()},
+            noise=noise,
+            env_ids=[env_id],
+        )
+        return actions[0]
+
+    def target_eef_poses_to_actions(
+        self,
+        target_eef_pose_dict: dict,
+        gripper_action_dict: dict,
+        noise: torch.Tensor | None = None,
+        env_ids: Sequence[int] | None = None,
+    ) -> torch.Tensor:
+        """
+        Batched version of :meth:`target_eef_pose_to_action` for several environments.
+
+        Args:
+            target_eef_pose_dict: Dictionary of 4x4 target eef poses for each end-effector. Shape of each
+                pose is (len(env_ids), 4, 4).
+            gripper_action_dict: Dictionary of gripper actions for each end-effector. Shape of each action is
+                (len(env_ids), gripper_action_dim).
+            noise: Amplitude of the noise to add to the action of each environment. Shape is (len(env_ids),).
+                If None, no noise is added and the action is not clipped. A zero amplitude adds no noise.
+            env_ids: Environment indices to compute the actions for. If None, all envs are considered.
+
+        Returns:
+            An action torch.Tensor that's compatible with env.step(). Shape is (len(env_ids), action_dim).
+        """
         eef_name = list(self.cfg.subtask_configs.keys())[0]
 
         # target position and rotation
@@ -59,7 +91,7 @@ class FrankaCubeStackIKRelMimicEnv(ManagerBasedRLMimicEnv):
         target_pos, target_rot = PoseUtils.unmake_pose(target_eef_pose)
 
         # current position and rotation
-        curr_pose = self.get_robot_eef_pose(eef_name, env_ids=[env_id])[0]
+        curr_pose = self.get_robot_eef_pose(eef_name, env_ids=env_ids)
         curr_pos, curr_rot = PoseUtils.unmake_pose(curr_pose)
 
         # normalized delta position action
@@ -74,13 +106,12 @@ class FrankaCubeStackIKRelMimicEnv(ManagerBasedRLMimicEnv):
         (gripper_action,) = gripper_action_dict.values()
 
         # add noise to action
-        pose_action = torch.cat([delta_position, delta_rotation], dim=0)
+        pose_action = torch.cat([delta_position, delta_rotation], dim=-1)
         if noise is not None:
-            noise = noise * torch.randn_like(pose_action)
-            pose_action += noise
+            pose_action = pose_action + noise.unsqueeze(-1) * torch.randn_like(pose_action)
             pose_action = torch.clamp(pose_action, -1.0, 1.0)
 
-        return torch.cat([pose_action, gripper_action], dim=0)
+        return torch.cat([pose_action, gripper_action], dim=-1)
 
     def action_to_target_eef_pose(self, action: torch.Tensor) -> dict[str, torch.Tensor]:
         """
@@ -8,11 +8,15 @@ from isaaclab.app import AppLauncher
 # launch omniverse app
 simulation_app = AppLauncher(headless=True).app
 
+import asyncio
 import numpy as np
+import os
+import tempfile
 import torch
 import unittest
 
 from isaaclab_mimic.datagen.datagen_info import DatagenInfo
+from isaaclab_mimic.datagen.datagen_info_pool import DataGenInfoPool
 
 # Importing the necessary classes for the testing
 from isaaclab_mimic.datagen.selection_strategy import (
@@ -21,6 +25,8 @@ from isaaclab_mimic.datagen.selection_strategy import (
 )
 
 import isaaclab.utils.math as PoseUtils
+from isaaclab.envs.mimic_env_cfg import SubTaskConfig
+from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
 
 # Number of iterations to run the batched tests
 NUM_ITERS = 1000
@@ -293,5 +299,120 @@ class TestNearestNeighborRobotDistanceStrategy(unittest.TestCase):
         )
 
 
+class TestDataGenInfoPoolPoseIndex(unittest.TestCase):
+    """Test the selection of source demonstrations from the pose index of the datagen info pool."""
+
+    def test_select_source_demo_from_pose_index(self):
+        """Test that the strategies select the same source demonstrations from the pose index and from the
+        subtask segments of the source demonstrations."""
+        # create a pool with episodes of different lengths
+        env = _MockMimicEnv()
+        pool = DataGenInfoPool(env=env, env_cfg=env.cfg, device="cpu")
+        episode_lengths = [5, 9, 7, 12, 6, 8]
+        for episode_length in episode_lengths[:3]:
+            asyncio.run(pool.add_episode(_create_episode(episode_length)))
+        # check the index after adding episodes
+        time_inds = np.array([1, 4, 0])
+        eef_poses, object_poses = pool.get_poses_at(time_inds, object_name="cube")
+        for i, time_ind in enumerate(time_inds):
+            self.assertTrue(torch.equal(eef_poses[i], pool.datagen_infos[i].eef_pose[time_ind]))
+            self.assertTrue(torch.equal(object_poses[i], pool.datagen_infos[i].object_poses["cube"][time_ind]))
+        for episode_length in episode_lengths[3:]:
+            asyncio.run(pool.add_episode(_create_episode(episode_length)))
+
+        # compare the selection with both code paths
+        time_inds = np.array([np.random.randint(0, length) for length in episode_lengths])
+        src_eef_poses, src_object_poses = pool.get_poses_at(time_inds, object_name="cube")
+        src_subtask_datagen_infos = [
+            DatagenInfo(eef_pose=info.eef_pose[time_ind:], object_poses={"cube": info.object_poses["cube"][time_ind:]})
+            for info, time_ind in zip(pool.datagen_infos, time_inds)
+        ]
+        eef_pose = PoseUtils.generate_random_transformation_matrix(pos_boundary=1, rot_boundary=(2 * np.pi))
+        object_pose = PoseUtils.generate_random_transformation_matrix(pos_boundary=1, rot_boundary=(2 * np.pi))
+        for strategy in (NearestNeighborObjectStrategy(), NearestNeighborRobotDistanceStrategy()):
+            torch.manual_seed(0)
+            expected_inds = [
+                int(strategy.select_source_demo(eef_pose, object_pose, src_subtask_datagen_infos, nn_k=3))
+                for _ in range(10)
+            ]
+            torch.manual_seed(0)
+            inds = [
+                int(
+                    strategy.select_source_demo_from_poses(
+                        eef_pose, object_pose, src_eef_poses, src_object_poses, nn_k=3
+                    )
+                )
+                for _ in range(10)
+            ]
+            self.assertEqual(inds, expected_inds)
+
+    def test_load_from_dataset_file(self):
+        """Test that the datagen info of the episodes of an annotated dataset file are loaded."""
+        env = _MockMimicEnv()
+        episodes = [_create_episode(episode_length) for episode_length in (5, 9, 7)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # write an annotated dataset
+            dataset_file_path = os.path.join(temp_dir, "annotated_dataset.hdf5")
+            dataset_file_handler = HDF5DatasetFileHandler()
+            dataset_file_handler.create(dataset_file_path, "test_env_name")
+            for episode in episodes:
+                dataset_file_handler.write_episode(episode)
+            dataset_file_handler.close()
+
+            # load the dataset into the pool
+            pool = DataGenInfoPool(env=env, env_cfg=env.cfg, device="cpu")
+            pool.load_from_dataset_file(dataset_file_path)
+
+        # the datagen info is loaded in memory and does not depend on the closed file
+        self.assertEqual(pool.num_datagen_infos, len(episodes))
+        for datagen_info, episode in zip(pool.datagen_infos, episodes):
+            datagen_info_data = episode.data["obs"]["datagen_info"]
+            self.assertTrue(torch.equal(datagen_info.eef_pose, datagen_info_data["eef_pose"]["franka"]))
+            self.assertTrue(torch.equal(datagen_info.object_poses["cube"], datagen_info_data["object_pose"]["cube"]))
+            self.assertTrue(torch.equal(datagen_info.target_eef_pose, datagen_info_data["target_eef_pose"]["franka"]))
+            self.assertTrue(torch.equal(datagen_info.gripper_action, episode.data["actions"][:, -1:]))
+            self.assertEqual(list(datagen_info.subtask_term_signals.keys()), ["grasp"])
+
+
+"""
+Helper functions.
+"""
+
+
+class _MockMimicEnv:
+    """Mimic environment with the attributes used by the datagen info pool."""
+
+    def __init__(self):
+        self.cfg = type("MimicEnvCfg", (), {})()
+        self.cfg.subtask_configs = {"franka": [SubTaskConfig(object_ref="cube", subtask_term_signal=None)]}
+
+    def actions_to_gripper_actions(self, actions: torch.Tensor) -> dict[str, torch.Tensor]:
+        return {"franka": actions[:, -1:]}
+
+
+def _create_episode(num_steps: int) -> EpisodeData:
+    """Create an episode with random poses of the end effector and of an object."""
+
+    def random_poses():
+        return torch.stack([
+            PoseUtils.generate_random_transformation_matrix(pos_boundary=1, rot_boundary=(2 * np.pi))
+            for _ in range(num_steps)
+        ])
+
+    episode = EpisodeData()
+    episode.data = {
+        "actions": torch.rand(num_steps, 7),
+        "obs": {
+            "datagen_info": {
+                "eef_pose": {"franka": random_poses()},
+                "object_pose": {"cube": random_poses()},
+                "target_eef_pose": {"franka": random_poses()},
+                "subtask_term_signals": {"grasp": torch.zeros(num_steps, dtype=torch.bool)},
+            }
+        },
+    }
+    return episode
+
+
 if __name__ == "__main__":
     unittest.main()
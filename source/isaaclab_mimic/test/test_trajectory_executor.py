@@ -0,0 +1,118 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+import asyncio
+import torch
+import unittest
+
+from isaaclab_mimic.datagen.trajectory_executor import MultiEnvTrajectoryExecutor
+from isaaclab_mimic.datagen.waypoint import WaypointSequence, WaypointTrajectory
+
+import isaaclab.utils.math as PoseUtils
+from isaaclab.managers import TerminationTermCfg
+
+NUM_ENVS = 3
+ACTION_DIM = 4
+
+
+class TestMultiEnvTrajectoryExecutor(unittest.TestCase):
+    """Test the MultiEnvTrajectoryExecutor class."""
+
+    def test_execute(self):
+        """Test that the trajectories of all the environments are executed in lock-step."""
+        env = _MockMimicEnv()
+        success_term = TerminationTermCfg(
+            func=lambda env, step: torch.full((NUM_ENVS,), env.step_count == step), params={"step": 4}
+        )
+        executor = MultiEnvTrajectoryExecutor(env, success_term)
+        # trajectories of different lengths for each environment
+        trajectory_lengths = {0: [3, 2, 4], 1: [5, 1], 2: [2, 2, 2, 1]}
+        results = {env_id: [] for env_id in trajectory_lengths}
+
+        async def run_env(env_id):
+            for length in trajectory_lengths[env_id]:
+                trajectory = _create_trajectory(env_id, length)
+                results[env_id].append((trajectory, await executor.execute(env_id, trajectory)))
+            # keep the environment busy
+            await executor.execute(env_id, _create_trajectory(env_id, 100))
+
+        loop = asyncio.new_event_loop()
+        tasks = [loop.create_task(run_env(env_id)) for env_id in trajectory_lengths]
+        for _ in range(9):
+            loop.run_until_complete(executor.wait_for_trajectories())
+            executor.step()
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.close()
+
+        for env_id, lengths in trajectory_lengths.items():
+            start_step = 0
+            for (trajectory, result), length in zip(results[env_id], lengths):
+                # actions of the trajectory
+                poses, gripper_actions, _ = trajectory.get_targets()
+                expected_actions = torch.cat([poses[:, :3, 3], gripper_actions], dim=-1).unsqueeze(1)
+                torch.testing.assert_close(result["actions"], expected_actions)
+                # states and observations recorded before and after each step
+                self.assertEqual(result["states"], list(range(start_step, start_step + length)))
+                self.assertEqual(result["observations"], list(range(start_step + 1, start_step + length + 1)))
+                self.assertEqual(result["success"], start_step < 4 <= start_step + length)
+                start_step += length
+        # only the records of the trajectories being executed are kept
+        self.assertEqual(executor.num_active_envs, 2)
+        self.assertEqual(executor._states, [6, 7, 8])
+
+    def test_execute_empty(self):
+        """Test that an empty trajectory is executed without stepping the environment."""
+        env = _MockMimicEnv()
+        executor = MultiEnvTrajectoryExecutor(env, TerminationTermCfg(func=lambda env: torch.zeros(NUM_ENVS)))
+        result = asyncio.run(executor.execute(0, WaypointTrajectory()))
+        self.assertEqual(result["states"], [])
+        self.assertFalse(result["success"])
+        self.assertEqual(env.step_count, 0)
+
+
+"""
+Helper functions.
+"""
+
+
+class _MockMimicEnv:
+    """Mimic environment with the attributes used by the trajectory executor."""
+
+    def __init__(self):
+        self.num_envs = NUM_ENVS
+        self.device = "cpu"
+        self.cfg = type("MimicEnvCfg", (), {})()
+        self.cfg.subtask_configs = {"franka": []}
+        self.action_manager = type("ActionManager", (), {"total_action_dim": ACTION_DIM})()
+        self.scene = type("Scene", (), {"get_state": lambda _, is_relative: self.step_count})()
+        self.step_count = 0
+
+    def target_eef_poses_to_actions(self, target_eef_pose_dict, gripper_action_dict, noise=None, env_ids=None):
+        return torch.cat([target_eef_pose_dict["franka"][:, :3, 3], gripper_action_dict["franka"]], dim=-1)
+
+    def step(self, actions):
+        assert actions.shape == (NUM_ENVS, ACTION_DIM)
+        self.step_count += 1
+        return self.step_count, None, None, None, None
+
+
+def _create_trajectory(env_id: int, num_waypoints: int) -> WaypointTrajectory:
+    """Create a trajectory of random waypoints."""
+    poses = torch.stack([PoseUtils.generate_random_transformation_matrix() for _ in range(num_waypoints)])
+    gripper_actions = torch.full((num_waypoints, 1), float(env_id))
+    trajectory = WaypointTrajectory()
+    trajectory.add_waypoint_sequence(WaypointSequence.from_poses(["franka"], poses, gripper_actions, action_noise=0.05))
+    return trajectory
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -43,6 +43,8 @@ from rl_games.common.vecenv import IVecEnv
 
 from isaaclab.envs import DirectRLEnv, ManagerBasedRLEnv, VecEnvObs
 
+from .staging import TensorStager
+
 """
 Vectorized environment wrapper.
 """
@@ -53,8 +55,9 @@ class RlGamesVecEnvWrapper(IVecEnv):
 
     This class wraps around the Isaac Lab environment. Since RL-Games works directly on
     GPU buffers, the wrapper handles moving of buffers from the simulation environment
-    to the same device as the learning agent. Additionally, it performs clipping of
-    observations and actions.
+    to the same device as the learning agent. If the devices differ, the buffers are copied
+    through preallocated staging buffers (see :class:`~isaaclab_rl.staging.TensorStager`).
+    Additionally, it performs clipping of observations and actions.
 
     For algorithms like asymmetric actor-critic, RL-Games expects a dictionary for
     observations. This dictionary contains "obs" and "states" which typically correspond
@@ -105,6 +108,8 @@ class RlGamesVecEnvWrapper(IVecEnv):
         self._clip_obs = clip_obs
         self._clip_actions = clip_actions
         self._sim_device = env.unwrapped.device
+        # staging buffers for moving the buffers to rl-device
+        self._stager = TensorStager(device=rl_device)
         # information for privileged observations
         if self.state_space is None:
             self.rlg_num_states = 0
@@ -232,8 +237,8 @@ class RlGamesVecEnvWrapper(IVecEnv):
 
     def reset(self):  # noqa: D102
         obs_dict, _ = self.env.reset()
-        # process observations and states
-        return self._process_obs(obs_dict)
+        # process observations and states and move them to rl-device
+        return self._stager.stage(self._process_obs(obs_dict))
 
     def step(self, actions):  # noqa: D102
         # move actions to sim-device
@@ -243,25 +248,29 @@ class RlGamesVecEnvWrapper(IVecEnv):
         # perform environment step
         obs_dict, rew, terminated, truncated, extras = self.env.step(actions)
 
-        # move time out information to the extras dict
-        # this is only needed for infinite horizon tasks
-        # note: only useful when `value_bootstrap` is True in the agent configuration
-        if not self.unwrapped.cfg.is_finite_horizon:
-            extras["time_outs"] = truncated.to(device=self._rl_device)
         # process observations and states
         obs_and_states = self._process_obs(obs_dict)
         # move buffers to rl-device
-        # note: we perform clone to prevent issues when rl-device and sim-device are the same.
-        rew = rew.to(device=self._rl_device)
-        dones = (terminated | truncated).to(device=self._rl_device)
+        # note: all the buffers are copied at once so that the transfers do not wait on each other
+        data = self._stager.stage({
+            "obs": obs_and_states,
+            "rew": rew,
+            "dones": terminated | truncated,
+            "time_outs": truncated,
+        })
         extras = {
             k: v.to(device=self._rl_device, non_blocking=True) if hasattr(v, "to") else v for k, v in extras.items()
         }
+        # move time out information to the extras dict
+        # this is only needed for infinite horizon tasks
+        # note: only useful when `value_bootstrap` is True in the agent configuration
+        if not self.unwrapped.cfg.is_finite_horizon:
+            extras["time_outs"] = data["time_outs"]
         # remap extras from "log" to "episode"
         if "log" in extras:
             extras["episode"] = extras.pop("log")
 
-        return obs_and_states, rew, dones, extras
+        return data["obs"], data["rew"], data["dones"], extras
 
     def close(self):  # noqa: D102
         return self.env.close()
@@ -282,14 +291,12 @@ class RlGamesVecEnvWrapper(IVecEnv):
 
         Returns:
             If environment provides states, then a dictionary containing the observations and states is returned.
-            Otherwise just the observations tensor is returned.
+            Otherwise just the observations tensor is returned. The tensors are on the simulation device.
         """
         # process policy obs
         obs = obs_dict["policy"]
         # clip the observations
         obs = torch.clamp(obs, -self._clip_obs, self._clip_obs)
-        # move the buffer to rl-device
-        obs = obs.to(device=self._rl_device).clone()
 
         # check if asymmetric actor-critic or not
         if self.rlg_num_states > 0:
@@ -300,8 +307,6 @@ class RlGamesVecEnvWrapper(IVecEnv):
                 raise NotImplementedError("Environment does not define key 'critic' for privileged observations.")
             # clip the states
             states = torch.clamp(states, -self._clip_obs, self._clip_obs)
-            # move buffers to rl-device
-            states = states.to(self._rl_device).clone()
             # convert to dictionary
             return {"obs": obs, "states": states}
         else:
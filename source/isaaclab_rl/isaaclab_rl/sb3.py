@@ -22,6 +22,7 @@ import gymnasium as gym
 import numpy as np
 import torch
 import torch.nn as nn  # noqa: F401
+from collections.abc import Sequence
 from typing import Any
 
 from stable_baselines3.common.utils import constant_fn
@@ -29,6 +30,8 @@ from stable_baselines3.common.vec_env.base_vec_env import VecEnv, VecEnvObs, Vec
 
 from isaaclab.envs import DirectRLEnv, ManagerBasedRLEnv
 
+from .staging import TensorStager
+
 """
 Configuration Parser.
 """
@@ -97,7 +100,8 @@ class Sb3VecEnvWrapper(VecEnv):
 
     In contrast to the Isaac Lab environment, stable-baselines expect the following:
 
-    1. numpy datatype for MDP signals
+    1. numpy datatype for MDP signals (the tensors are copied to the host into new buffers at every step, see
+       :class:`~isaaclab_rl.staging.TensorStager`, so the returned arrays are owned by the caller)
     2. a list of info dicts for each sub-environment (instead of a dict)
     3. when environment has terminated, the observations from the environment should correspond
        to the one after reset. The "real" final observation is passed using the info dicts
@@ -123,11 +127,13 @@ class Sb3VecEnvWrapper(VecEnv):
 
     """
 
-    def __init__(self, env: ManagerBasedRLEnv | DirectRLEnv):
+    def __init__(self, env: ManagerBasedRLEnv | DirectRLEnv, batched_infos: bool = False):
         """Initialize the wrapper.
 
         Args:
             env: The environment to wrap around.
+            batched_infos: Whether to return the info dicts as a lazy :class:`Sb3InfoSequence` instead of a list.
+                The info dict of a sub-environment is then only created when it is accessed. Defaults to False.
 
         Raises:
             ValueError: When the environment is not an instance of :class:`ManagerBasedRLEnv` or :class:`DirectRLEnv`.
@@ -140,6 +146,7 @@ class Sb3VecEnvWrapper(VecEnv):
             )
         # initialize the wrapper
         self.env = env
+        self.batched_infos = batched_infos
         # collect common information
         self.num_envs = self.unwrapped.num_envs
         self.sim_device = self.unwrapped.device
@@ -158,6 +165,9 @@ class Sb3VecEnvWrapper(VecEnv):
         # add buffer for logging episodic information
         self._ep_rew_buf = torch.zeros(self.num_envs, device=self.sim_device)
         self._ep_len_buf = torch.zeros(self.num_envs, device=self.sim_device)
+        # add stager for copying the MDP signals to the host
+        # note: new host buffers are used at every step since Stable-Baselines3 keeps the returned arrays
+        self._stager = TensorStager(device="cpu", num_buffers=None)
 
     def __str__(self):
         """Returns the wrapper name and the :attr:`env` representation string."""
@@ -206,8 +216,8 @@ class Sb3VecEnvWrapper(VecEnv):
     def reset(self) -> VecEnvObs:  # noqa: D102
         obs_dict, _ = self.env.reset()
         # reset episodic information buffers
-        self._ep_rew_buf.zero_()
-        self._ep_len_buf.zero_()
+        self._ep_rew_buf = torch.zeros_like(self._ep_rew_buf)
+        self._ep_len_buf = torch.zeros_like(self._ep_len_buf)
         # convert data types to numpy depending on backend
         return self._process_obs(obs_dict)
 
@@ -228,22 +238,36 @@ class Sb3VecEnvWrapper(VecEnv):
         self._ep_rew_buf += rew
         self._ep_len_buf += 1
         # compute reset ids
-        dones = terminated | truncated
-        reset_ids = (dones > 0).nonzero(as_tuple=False)
+        reset_mask = terminated | truncated
 
         # convert data types to numpy depending on backend
         # note: ManagerBasedRLEnv uses torch backend (by default).
-        obs = self._process_obs(obs_dict)
-        rew = rew.detach().cpu().numpy()
-        terminated = terminated.detach().cpu().numpy()
-        truncated = truncated.detach().cpu().numpy()
-        dones = dones.detach().cpu().numpy()
+        data = self._to_numpy({
+            "obs": self._get_policy_obs(obs_dict),
+            "rew": rew,
+            "terminated": terminated,
+            "truncated": truncated,
+            "dones": reset_mask,
+            "episode_returns": self._ep_rew_buf,
+            "episode_lengths": self._ep_len_buf,
+        })
+        obs, rew, terminated, truncated, dones = (
+            data["obs"],
+            data["rew"],
+            data["terminated"],
+            data["truncated"],
+            data["dones"],
+        )
+        reset_ids = dones.nonzero()[0]
         # convert extra information to list of dicts
-        infos = self._process_extras(obs, terminated, truncated, extras, reset_ids)
+        infos = self._process_extras(
+            obs, terminated, truncated, extras, reset_ids, data["episode_returns"], data["episode_lengths"]
+        )
 
         # reset info for terminated environments
-        self._ep_rew_buf[reset_ids] = 0
-        self._ep_len_buf[reset_ids] = 0
+        # note: the buffers are not reset in-place since they are shared with the host on CPU devices
+        self._ep_rew_buf = self._ep_rew_buf.masked_fill(reset_mask, 0)
+        self._ep_len_buf = self._ep_len_buf.masked_fill(reset_mask, 0)
 
         return obs, rew, dones, infos
 
@@ -290,59 +314,163 @@ class Sb3VecEnvWrapper(VecEnv):
 
     def _process_obs(self, obs_dict: torch.Tensor | dict[str, torch.Tensor]) -> np.ndarray | dict[str, np.ndarray]:
         """Convert observations into NumPy data type."""
+        return self._to_numpy(self._get_policy_obs(obs_dict))
+
+    def _get_policy_obs(self, obs_dict: dict) -> torch.Tensor | dict[str, torch.Tensor]:
+        """Get the observations of the policy."""
         # Sb3 doesn't support asymmetric observation spaces, so we only use "policy"
         obs = obs_dict["policy"]
-        # note: ManagerBasedRLEnv uses torch backend (by default).
-        if isinstance(obs, dict):
-            for key, value in obs.items():
-                obs[key] = value.detach().cpu().numpy()
-        elif isinstance(obs, torch.Tensor):
-            obs = obs.detach().cpu().numpy()
-        else:
+        if not isinstance(obs, (dict, torch.Tensor)):
             raise NotImplementedError(f"Unsupported data type: {type(obs)}")
         return obs
 
+    def _to_numpy(self, data: torch.Tensor | dict) -> np.ndarray | dict:
+        """Copy the tensors to the host with a single synchronization and convert them into NumPy data type.
+
+        The arrays are views over new host buffers, so Stable-Baselines3 can keep them across steps.
+        """
+        return self._stager.to_numpy(self._stager.stage(data))
+
     def _process_extras(
-        self, obs: np.ndarray, terminated: np.ndarray, truncated: np.ndarray, extras: dict, reset_ids: np.ndarray
-    ) -> list[dict[str, Any]]:
-        """Convert miscellaneous information into dictionary for each sub-environment."""
-        # create empty list of dictionaries to fill
-        infos: list[dict[str, Any]] = [dict.fromkeys(extras.keys()) for _ in range(self.num_envs)]
-        # fill-in information for each sub-environment
-        # note: This loop becomes slow when number of environments is large.
-        for idx in range(self.num_envs):
-            # fill-in episode monitoring info
-            if idx in reset_ids:
-                infos[idx]["episode"] = dict()
-                infos[idx]["episode"]["r"] = float(self._ep_rew_buf[idx])
-                infos[idx]["episode"]["l"] = float(self._ep_len_buf[idx])
+        self,
+        obs: np.ndarray,
+        terminated: np.ndarray,
+        truncated: np.ndarray,
+        extras: dict,
+        reset_ids: np.ndarray,
+        episode_returns: np.ndarray,
+        episode_lengths: np.ndarray,
+    ) -> list[dict[str, Any]] | Sb3InfoSequence:
+        """Convert miscellaneous information into dictionary for each sub-environment.
+
+        If :attr:`batched_infos` is enabled, the info dicts are only created when they are accessed.
+        """
+        infos = Sb3InfoSequence(
+            obs,
+            terminated,
+            truncated,
+            extras,
+            reset_ids,
+            episode_returns=episode_returns,
+            episode_lengths=episode_lengths,
+        )
+        if self.batched_infos:
+            return infos
+        # create the list of dictionaries
+        return list(infos)
+
+
+class Sb3InfoSequence(Sequence):
+    """Lazy sequence of the info dicts of the sub-environments for a step of :class:`Sb3VecEnvWrapper`.
+
+    The information of all the sub-environments is stored column-wise in NumPy arrays. The info dict of a
+    sub-environment is only created when it is accessed, and is cached afterwards so that it can be modified
+    (for instance, by :class:`stable_baselines3.common.vec_env.VecNormalize`).
+
+    The info dict of a sub-environment contains the same keys as the ones of the list created by the wrapper:
+
+    * ``"episode"``: The un-discounted return ``"r"``, the length ``"l"`` and the logged information of the
+      episode if the sub-environment was reset, else None.
+    * ``"TimeLimit.truncated"``: Whether the episode was truncated but not terminated.
+    * ``"terminal_observation"``: The final observation of the episode if the sub-environment was reset, else None.
+    * The values of the sub-environment for the other keys of the extras. Tensors are converted to NumPy arrays
+      once for all the sub-environments.
+    """
+
+    def __init__(
+        self,
+        obs: np.ndarray | dict[str, np.ndarray],
+        terminated: np.ndarray,
+        truncated: np.ndarray,
+        extras: dict,
+        reset_ids: np.ndarray,
+        episode_returns: np.ndarray,
+        episode_lengths: np.ndarray,
+    ):
+        """Initialize the sequence.
+
+        Args:
+            obs: The observations of all the sub-environments.
+            terminated: The termination flags of all the sub-environments.
+            truncated: The truncation flags of all the sub-environments.
+            extras: The extras returned by the environment.
+            reset_ids: The indices of the sub-environments that are reset.
+            episode_returns: The un-discounted episode returns of all the sub-environments.
+            episode_lengths: The episode lengths of all the sub-environments.
+        """
+        self._obs = obs
+        self._extras = extras
+        self._time_limit_truncated = np.logical_and(truncated, np.logical_not(terminated))
+        self._reset_ids = set(reset_ids.tolist())
+        self._episode_returns = episode_returns
+        self._episode_lengths = episode_lengths
+        # cache of the extras converted to numpy arrays
+        self._extras_columns: dict[str, Any] = dict()
+        # cache of the created info dicts
+        self._infos: list[dict[str, Any] | None] = [None] * len(terminated)
+
+    def __len__(self) -> int:
+        return len(self._infos)
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Info index {index} is out of range for {len(self)} sub-environments.")
+        if self._infos[index] is None:
+            self._infos[index] = self._create_info(index)
+        return self._infos[index]
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    @property
+    def reset_ids(self) -> set[int]:
+        """The indices of the sub-environments that are reset."""
+        return self._reset_ids
+
+    """
+    Helper functions.
+    """
+
+    def _create_info(self, idx: int) -> dict[str, Any]:
+        """Create the info dict of a sub-environment."""
+        info: dict[str, Any] = dict.fromkeys(self._extras.keys())
+        is_reset = idx in self._reset_ids
+        # fill-in episode monitoring info
+        if is_reset:
+            info["episode"] = {"r": float(self._episode_returns[idx]), "l": float(self._episode_lengths[idx])}
+        else:
+            info["episode"] = None
+        # fill-in bootstrap information
+        info["TimeLimit.truncated"] = self._time_limit_truncated[idx]
+        # fill-in information from extras
+        for key, value in self._extras.items():
+            # 1. remap extra episodes information safely
+            # 2. for others just store their values
+            if key == "log":
+                # only log this data for episodes that are terminated
+                if is_reset:
+                    info["episode"].update(value)
             else:
-                infos[idx]["episode"] = None
-            # fill-in bootstrap information
-            infos[idx]["TimeLimit.truncated"] = truncated[idx] and not terminated[idx]
-            # fill-in information from extras
-            for key, value in extras.items():
-                # 1. remap extra episodes information safely
-                # 2. for others just store their values
-                if key == "log":
-                    # only log this data for episodes that are terminated
-                    if infos[idx]["episode"] is not None:
-                        for sub_key, sub_value in value.items():
-                            infos[idx]["episode"][sub_key] = sub_value
-                else:
-                    infos[idx][key] = value[idx]
-            # add information about terminal observation separately
-            if idx in reset_ids:
-                # extract terminal observations
-                if isinstance(obs, dict):
-                    terminal_obs = dict.fromkeys(obs.keys())
-                    for key, value in obs.items():
-                        terminal_obs[key] = value[idx]
-                else:
-                    terminal_obs = obs[idx]
-                # add info to dict
-                infos[idx]["terminal_observation"] = terminal_obs
+                info[key] = self._get_extras_column(key, value)[idx]
+        # add information about terminal observation separately
+        if is_reset:
+            if isinstance(self._obs, dict):
+                info["terminal_observation"] = {key: value[idx] for key, value in self._obs.items()}
             else:
-                infos[idx]["terminal_observation"] = None
-        # return list of dictionaries
-        return infos
+                info["terminal_observation"] = self._obs[idx]
+        else:
+            info["terminal_observation"] = None
+        return info
+
+    def _get_extras_column(self, key: str, value: Any) -> Any:
+        """Get the values of an extras key for all the sub-environments, with tensors converted to NumPy."""
+        if key not in self._extras_columns:
+            if isinstance(value, torch.Tensor):
+                value = value.detach().cpu().numpy()
+            self._extras_columns[key] = value
+        return self._extras_columns[key]
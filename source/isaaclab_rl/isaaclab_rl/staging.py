@@ -0,0 +1,188 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Utility to transfer the tensors of the environment to the device of the learning framework.
+
+The wrappers of the learning frameworks move the observations, rewards and dones from the simulation device
+to the device of the agent at every step. The :class:`TensorStager` class performs these transfers into
+preallocated buffers. For transfers from a CUDA device, the copies are issued asynchronously on a side stream,
+and the host buffers are allocated in pinned memory.
+
+The following example shows how to copy the observations of an environment to the host as NumPy arrays:
+
+.. code-block:: python
+
+    from isaaclab_rl.staging import TensorStager
+
+    stager = TensorStager(device="cpu")
+
+    obs_dict, _ = env.reset()
+    obs = stager.to_numpy(stager.stage(obs_dict["policy"]))
+
+"""
+
+# needed to import for allowing type-hinting: torch.Tensor | dict[str, torch.Tensor]
+from __future__ import annotations
+
+import numpy as np
+import torch
+from collections.abc import Mapping
+
+
+class TensorStager:
+    """Copies tensors to a target device through preallocated, multi-buffered staging buffers.
+
+    Each call to :meth:`stage` copies a tensor or a dictionary of tensors (for instance, observation groups)
+    into a set of buffers that is reused every :attr:`num_buffers` calls. The buffers are allocated at the first
+    call and re-allocated only if the shape or data type of a tensor changes. Thus, the returned tensors (and the
+    NumPy views over them) stay valid until :attr:`num_buffers` further calls. With the default of two buffers,
+    the data of the previous step can still be used while the data of the current step is copied.
+
+    If :attr:`num_buffers` is None, new buffers are allocated at every call instead. The returned tensors are then
+    owned by the caller and can be kept for as long as needed. The pinned host buffers come from the caching host
+    allocator of PyTorch, so the memory of the released buffers is reused without new page-locked allocations.
+
+    For tensors on a CUDA device, the copies of a call are issued with ``non_blocking=True`` on a side stream of
+    the source device, so that they do not wait on each other. The host buffers are allocated in pinned memory.
+    If the target is the host, :meth:`stage` waits once for all the copies to finish before returning. If the
+    target is a CUDA device, the current stream of the target device waits for the copies instead, so that the
+    host is not synchronized at all.
+
+    Tensors that are not on a CUDA device, or that are already on the target device, are not staged. They are
+    returned as :meth:`torch.Tensor.to` would return them. This makes the stager a no-op on CPU-only setups.
+    """
+
+    def __init__(self, device: str | torch.device = "cpu", num_buffers: int | None = 2):
+        """Initializes the stager.
+
+        Args:
+            device: The device to copy the tensors to. Defaults to "cpu".
+            num_buffers: The number of buffer sets that are used in turn. Defaults to 2.
+                If None, new buffers are allocated at every call.
+
+        Raises:
+            ValueError: If the number of buffers is less than 1.
+        """
+        if num_buffers is not None and num_buffers < 1:
+            raise ValueError(f"The number of staging buffers must be at least 1. Received: {num_buffers}.")
+        self._device = torch.device(device)
+        if self._device.type == "cuda" and self._device.index is None:
+            self._device = torch.device("cuda", torch.cuda.current_device())
+        self._num_buffers = num_buffers
+        # staging buffers for each buffer set
+        self._buffers: list[dict[str, torch.Tensor]] = [dict() for _ in range(num_buffers or 0)]
+        self._buffer_index = 0
+        # side streams for each source device
+        self._streams: dict[torch.device, torch.cuda.Stream] = dict()
+
+    def __str__(self) -> str:
+        """Returns the string representation of the stager."""
+        return f"<{type(self).__name__}(device={self._device}, num_buffers={self._num_buffers})>"
+
+    """
+    Properties
+    """
+
+    @property
+    def device(self) -> torch.device:
+        """The device the tensors are copied to."""
+        return self._device
+
+    @property
+    def num_buffers(self) -> int | None:
+        """The number of buffer sets that are used in turn, or None if new buffers are allocated at every call."""
+        return self._num_buffers
+
+    """
+    Operations
+    """
+
+    def stage(self, data: torch.Tensor | Mapping) -> torch.Tensor | dict:
+        """Copy a tensor or a (nested) dictionary of tensors to the target device.
+
+        Args:
+            data: The tensor or the dictionary of tensors to copy.
+
+        Returns:
+            The tensor or dictionary of tensors on the target device.
+        """
+        # select the next buffer set
+        if self._num_buffers is None:
+            buffers = dict()
+        else:
+            self._buffer_index = (self._buffer_index + 1) % self._num_buffers
+            buffers = self._buffers[self._buffer_index]
+        # issue the copies
+        used_streams: list[torch.cuda.Stream] = []
+        staged_data = self._stage_data("", data, buffers, used_streams)
+        # wait for the copies to finish
+        for stream in used_streams:
+            if self._device.type == "cuda":
+                torch.cuda.current_stream(self._device).wait_stream(stream)
+            else:
+                stream.synchronize()
+        return staged_data
+
+    @staticmethod
+    def to_numpy(data: torch.Tensor | Mapping) -> np.ndarray | dict:
+        """Convert a host tensor or a (nested) dictionary of host tensors into NumPy arrays.
+
+        The arrays share the memory of the tensors, so no data is copied. If the staging buffers are reused, the
+        arrays are overwritten after :attr:`num_buffers` further calls to :meth:`stage`.
+
+        Args:
+            data: The tensor or the dictionary of tensors on the host.
+
+        Returns:
+            The NumPy array or the dictionary of NumPy arrays.
+        """
+        if isinstance(data, Mapping):
+            return {key: TensorStager.to_numpy(value) for key, value in data.items()}
+        return data.numpy()
+
+    """
+    Helper functions.
+    """
+
+    def _stage_data(
+        self,
+        key: str,
+        data: torch.Tensor | Mapping,
+        buffers: dict[str, torch.Tensor],
+        used_streams: list[torch.cuda.Stream],
+    ) -> torch.Tensor | dict:
+        """Copy a tensor into its staging buffer, or fall back to a regular transfer if staging is not needed.
+
+        The buffers of nested dictionaries are identified by the keys of the levels, joined with a slash.
+        """
+        if isinstance(data, Mapping):
+            return {
+                sub_key: self._stage_data(f"{key}/{sub_key}", value, buffers, used_streams)
+                for sub_key, value in data.items()
+            }
+        tensor = data.detach()
+        if not tensor.is_cuda or tensor.device == self._device:
+            return tensor.to(self._device)
+        # obtain the staging buffer
+        buffer = buffers.get(key)
+        if buffer is None or buffer.shape != tensor.shape or buffer.dtype != tensor.dtype:
+            buffer = torch.empty(
+                tensor.shape, dtype=tensor.dtype, device=self._device, pin_memory=self._device.type == "cpu"
+            )
+            buffers[key] = buffer
+        # obtain the side stream of the source device
+        stream = self._streams.get(tensor.device)
+        if stream is None:
+            stream = torch.cuda.Stream(device=tensor.device)
+            self._streams[tensor.device] = stream
+        # copy the tensor once it is computed on the current stream
+        stream.wait_stream(torch.cuda.current_stream(tensor.device))
+        with torch.cuda.stream(stream):
+            buffer.copy_(tensor, non_blocking=True)
+        # prevent the memory of the tensor from being reused before the copy is done
+        tensor.record_stream(stream)
+        if stream not in used_streams:
+            used_streams.append(stream)
+        return buffer
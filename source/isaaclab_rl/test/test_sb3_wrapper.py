@@ -21,7 +21,7 @@ import unittest
 
 import carb
 import omni.usd
-from isaaclab_rl.sb3 import Sb3VecEnvWrapper
+from isaaclab_rl.sb3 import Sb3InfoSequence, Sb3VecEnvWrapper
 
 from isaaclab.envs import DirectMARLEnv, multi_agent_to_single_agent
 
@@ -105,12 +105,82 @@ class TestStableBaselines3VecEnvWrapper(unittest.TestCase):
                 print(f">>> Closing environment: {task_name}")
                 env.close()
 
+    def test_batched_infos(self):
+        """Run random actions and check that the lazy info dicts match the episode terminations."""
+        task_name = self.registered_tasks[0]
+        # create a new stage
+        omni.usd.get_context().new_stage()
+        # create environment
+        env_cfg = parse_env_cfg(task_name, device=self.device, num_envs=self.num_envs)
+        env = gym.make(task_name, cfg=env_cfg)
+        if isinstance(env.unwrapped, DirectMARLEnv):
+            env = multi_agent_to_single_agent(env)
+        env = Sb3VecEnvWrapper(env, batched_infos=True)
+
+        # reset environment
+        env.reset()
+        # simulate environment for 100 steps
+        with torch.inference_mode():
+            for _ in range(100):
+                actions = 2 * np.random.rand(env.num_envs, *env.action_space.shape) - 1
+                _, _, dones, infos = env.step(actions)
+                # check the info dicts
+                self.assertIsInstance(infos, Sb3InfoSequence)
+                self.assertEqual(len(infos), env.num_envs)
+                self.assertSetEqual(infos.reset_ids, set(np.nonzero(dones)[0].tolist()))
+                for idx, info in enumerate(infos):
+                    self.assertIs(info, infos[idx])
+                    self.assertEqual(info["episode"] is not None, bool(dones[idx]))
+                    self.assertEqual(info["terminal_observation"] is not None, bool(dones[idx]))
+                self.assertTrue(self._check_valid_array(infos))
+
+        # close the environment
+        env.close()
+
+    def test_data_kept_across_steps(self):
+        """Check that the returned data of a step is not overwritten by the following steps."""
+        task_name = self.registered_tasks[0]
+        # create a new stage
+        omni.usd.get_context().new_stage()
+        # create environment
+        env_cfg = parse_env_cfg(task_name, device=self.device, num_envs=self.num_envs)
+        env = gym.make(task_name, cfg=env_cfg)
+        if isinstance(env.unwrapped, DirectMARLEnv):
+            env = multi_agent_to_single_agent(env)
+        env = Sb3VecEnvWrapper(env)
+
+        # reset environment
+        env.reset()
+        # simulate environment for 100 steps
+        previous_transitions = []
+        with torch.inference_mode():
+            for _ in range(100):
+                actions = 2 * np.random.rand(env.num_envs, *env.action_space.shape) - 1
+                obs, rew, dones, infos = env.step(actions)
+                terminal_obs = [info["terminal_observation"] for info in infos]
+                # store the data with copies of its values
+                previous_transitions.append((
+                    (obs, rew, dones, terminal_obs),
+                    (obs.copy(), rew.copy(), dones.copy(), [np.copy(value) for value in terminal_obs]),
+                ))
+                # check the data of two steps before
+                if len(previous_transitions) > 2:
+                    transition, expected_transition = previous_transitions.pop(0)
+                    for data, expected_data in zip(transition[:3], expected_transition[:3]):
+                        np.testing.assert_array_equal(data, expected_data)
+                    for data, expected_data in zip(transition[3], expected_transition[3]):
+                        if data is not None:
+                            np.testing.assert_array_equal(data, expected_data)
+
+        # close the environment
+        env.close()
+
     """
     Helper functions.
     """
 
     @staticmethod
-    def _check_valid_array(data: np.ndarray | dict | list) -> bool:
+    def _check_valid_array(data: np.ndarray | dict | list | Sb3InfoSequence) -> bool:
         """Checks if given data does not have corrupted values.
 
         Args:
@@ -129,7 +199,7 @@ class TestStableBaselines3VecEnvWrapper(unittest.TestCase):
                 elif isinstance(value, np.ndarray):
                     valid_array &= not np.any(np.isnan(value))
             return valid_array
-        elif isinstance(data, list):
+        elif isinstance(data, (list, Sb3InfoSequence)):
             valid_array = True
             for value in data:
                 valid_array &= TestStableBaselines3VecEnvWrapper._check_valid_array(value)
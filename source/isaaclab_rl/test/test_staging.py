@@ -0,0 +1,84 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch the simulator
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+
+"""Rest everything follows."""
+
+import numpy as np
+import torch
+import unittest
+
+from isaaclab_rl.staging import TensorStager
+
+
+class TestTensorStager(unittest.TestCase):
+    """Test that the tensor stager copies the tensors to the target device."""
+
+    def test_stage_to_host(self):
+        """Check that nested dictionaries of tensors are copied to the host."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                stager = TensorStager(device="cpu")
+                data = {
+                    "obs": {
+                        "joint_pos": torch.rand(16, 4, device=device),
+                        "joint_vel": torch.rand(16, 4, device=device),
+                    },
+                    "dones": torch.rand(16, device=device) > 0.5,
+                }
+                staged_data = stager.stage(data)
+                numpy_data = stager.to_numpy(staged_data)
+                # check the values
+                for key in ("joint_pos", "joint_vel"):
+                    self.assertIsInstance(numpy_data["obs"][key], np.ndarray)
+                    np.testing.assert_array_equal(numpy_data["obs"][key], data["obs"][key].cpu().numpy())
+                np.testing.assert_array_equal(numpy_data["dones"], data["dones"].cpu().numpy())
+                # check that the host buffers are pinned for copies from the device
+                self.assertEqual(staged_data["dones"].is_pinned(), device.startswith("cuda"))
+
+    def test_double_buffering(self):
+        """Check that the staging buffers are reused every two calls and keep the previous data valid."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                stager = TensorStager(device="cpu")
+                tensors = [torch.full((8, 3), float(i), device=device) for i in range(4)]
+                staged_tensors = [stager.stage(tensor) for tensor in tensors]
+                # the data of the previous call is still valid
+                np.testing.assert_array_equal(stager.to_numpy(staged_tensors[2]), np.full((8, 3), 2.0))
+                np.testing.assert_array_equal(stager.to_numpy(staged_tensors[3]), np.full((8, 3), 3.0))
+                if device.startswith("cuda"):
+                    # the buffers alternate between two buffer sets
+                    self.assertIs(staged_tensors[0], staged_tensors[2])
+                    self.assertIsNot(staged_tensors[2], staged_tensors[3])
+                    # the buffers are re-allocated if the shape changes
+                    staged_tensor = stager.stage(torch.zeros(4, 3, device=device))
+                    self.assertIsNot(staged_tensor, staged_tensors[0])
+                    self.assertEqual(staged_tensor.shape, (4, 3))
+
+    def test_new_buffers(self):
+        """Check that new buffers are used at every call if the number of buffers is None."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                stager = TensorStager(device="cpu", num_buffers=None)
+                data = {"obs": torch.full((8, 3), 0.0, device=device)}
+                staged_data = stager.stage(data)
+                numpy_data = stager.to_numpy(staged_data)
+                # stage the source tensor again after modifying it out-of-place
+                for value in (1.0, 2.0):
+                    data["obs"] = torch.full((8, 3), value, device=device)
+                    self.assertIsNot(stager.stage(data)["obs"], staged_data["obs"])
+                np.testing.assert_array_equal(numpy_data["obs"], np.full((8, 3), 0.0))
+
+
+if __name__ == "__main__":
+    run_tests()